@@ -0,0 +1,113 @@
+"""Throughput of :func:`images.auto_logo.generate_logo` in logos per second.
+
+Renders ``--logos`` logos per template at each of ``--sizes`` and reports
+logos per second.  Every run uses the same team specs, so results are
+comparable between runs::
+
+    python -m benchmarks.logo_throughput --sizes 256 512 1024 --logos 5
+
+``--no-numpy`` renders with the per-pixel fallbacks used when NumPy is not
+installed, for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import images.auto_logo as auto_logo
+from images.auto_logo import TeamSpec, generate_logo
+
+DEFAULT_SIZES = (256, 512, 1024)
+TEMPLATES = ("circle", "shield", "cap")
+
+_TEAMS = [
+    ("Albany", "Eagles"),
+    ("Boston", "Tigers"),
+    ("Chicago", "Sharks"),
+    ("Denver", "Dragons"),
+    ("El Paso", "Thunder"),
+    ("Fresno", "Rangers"),
+]
+
+
+@dataclass
+class LogoResult:
+    """Time taken to render ``logos`` logos of one template and size."""
+
+    template: str
+    size: int
+    logos: int
+    seconds: float
+
+    @property
+    def logos_per_sec(self) -> float:
+        return self.logos / self.seconds if self.seconds else 0.0
+
+
+def team_specs(count: int, template: str) -> List[TeamSpec]:
+    """Return ``count`` specs cycling through a fixed set of teams."""
+
+    specs = []
+    for i in range(count):
+        city, mascot = _TEAMS[i % len(_TEAMS)]
+        specs.append(TeamSpec(location=city, mascot=mascot, template=template))
+    return specs
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    logos: int = 5,
+    templates: Sequence[str] = TEMPLATES,
+) -> List[LogoResult]:
+    """Render ``logos`` logos for every template and size and time them."""
+
+    results = []
+    for size in sizes:
+        for template in templates:
+            specs = team_specs(logos, template)
+            start = time.perf_counter()
+            for spec in specs:
+                generate_logo(spec, size=size)
+            results.append(LogoResult(template, size, logos, time.perf_counter() - start))
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--logos", type=int, default=5, help="logos per template and size")
+    parser.add_argument(
+        "--template",
+        action="append",
+        choices=TEMPLATES,
+        help="template to render (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--no-numpy", action="store_true", help="use the per-pixel fallbacks"
+    )
+    args = parser.parse_args(argv)
+
+    saved_np = auto_logo.np
+    if args.no_numpy:
+        auto_logo.np = None
+    try:
+        results = run_benchmark(args.sizes, args.logos, args.template or TEMPLATES)
+    finally:
+        auto_logo.np = saved_np
+    for r in results:
+        print(
+            f"{r.template:<7} {r.size:5d}px {r.logos_per_sec:8.2f} logos/s "
+            f"({r.logos} logos, {r.seconds:.2f}s)"
+        )
+    return 0
+
+
+__all__ = ["DEFAULT_SIZES", "LogoResult", "TEMPLATES", "main", "run_benchmark", "team_specs"]
+
+
+if __name__ == "__main__":  # pragma: no cover - command line entry point
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Per-player memory footprint of the player models.
+
+Builds a league of ``--players`` players by repeating ``data/players.csv``
+with fresh ids, writes it as a CSV and loads it back.  The load runs once
+into the dataclass models and once into the slotted
+:mod:`models.compact_player` variants.  The memory each loaded league
+retains is measured with :mod:`tracemalloc`::
+
+    python -m benchmarks.player_memory --players 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+from utils.player_loader import load_players_from_csv
+from utils.player_writer import save_players_to_csv
+
+
+@dataclass
+class MemoryResult:
+    """Memory retained by one representation of the league."""
+
+    name: str
+    players: int
+    bytes: int
+
+    @property
+    def bytes_per_player(self) -> float:
+        return self.bytes / self.players if self.players else 0.0
+
+
+def write_league(path: str, players: int, source: str = "data/players.csv") -> None:
+    """Write ``players`` players to ``path`` by repeating ``source``."""
+
+    base = load_players_from_csv(source, use_cache=False)
+    league = []
+    for idx in range(players):
+        player = copy.copy(base[idx % len(base)])
+        player.player_id = f"P{idx:07d}"
+        league.append(player)
+    save_players_to_csv(league, path)
+
+
+def retained_bytes(load: Callable[[], object]) -> int:
+    """Return the memory still allocated by the result of ``load``."""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = load()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def measure(players: int, source: str = "data/players.csv") -> List[MemoryResult]:
+    """Return the footprint of a ``players``-strong league in each model."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "players.csv")
+        write_league(path, players, source)
+        loaders = {
+            "dataclass": lambda: load_players_from_csv(path, use_cache=False),
+            "compact": lambda: load_players_from_csv(path, use_cache=False, compact=True),
+        }
+        return [
+            MemoryResult(name, players, retained_bytes(load))
+            for name, load in loaders.items()
+        ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    results = measure(args.players)
+    for r in results:
+        print(
+            f"{r.name:<10} {r.bytes_per_player:8.0f} bytes/player "
+            f"{r.bytes / 1e6:8.1f} MB total"
+        )
+    baseline = results[0].bytes_per_player
+    for r in results[1:]:
+        print(f"{r.name} uses {r.bytes_per_player / baseline:.0%} of {results[0].name}")
+    return 0
+
+
+__all__ = ["MemoryResult", "main", "measure", "retained_bytes", "write_league"]
+
+
+if __name__ == "__main__":  # pragma: no cover - command line entry point
+    sys.exit(main())
@@ -0,0 +1,317 @@
+"""Throughput benchmark for :meth:`GameSimulation.simulate_game`.
+
+Every scenario plays a round robin of games between the league's real
+rosters (``data/players.csv`` and ``data/rosters``).  It reports games per
+second and at-bats per second.  Results are appended to a JSON history file,
+and the run fails when a scenario's games per second drop more than a
+configurable percentage below the median of the recent history::
+
+    python -m benchmarks.sim_throughput --games 500 --threshold 10
+
+The exit status is ``1`` when a regression is detected.  ``--profile``
+prints per-decision counters (see :mod:`logic.decision_profile`) instead;
+profiled runs are slower and are neither recorded nor checked.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+from logic.decision_profile import DecisionStats
+from logic.game_events import NullSink
+from logic.pbini_loader import load_pbini
+from logic.playbalance_config import PlayBalanceConfig
+from logic.rng_streams import RandomStreams
+from logic.season_runner import TeamRoster, _team_state, load_team_rosters
+from logic.simulation import GameSimulation
+from utils.team_loader import load_teams
+
+DEFAULT_HISTORY = os.path.join("benchmarks", "results", "sim_throughput.json")
+
+# Overrides that give every manager decision a real chance of firing, so the
+# benchmark also exercises the strategy paths the stock PB.INI leaves idle.
+ALL_STRATEGIES: Dict[str, int] = {
+    "chargeChanceBaseThird": 40,
+    "chargeChanceSacChanceAdjust": 0,
+    "holdChanceBase": 40,
+    "pickoffChanceBase": 30,
+    "pitchOutChanceBase": 40,
+    "pinchRunChance": 30,
+    "defSubChance": 30,
+    "doubleSwitchChance": 30,
+    "doubleSwitchPHAdjust": 50,
+}
+
+
+# ----------------------------------------------------------------------
+# Scenarios
+# ----------------------------------------------------------------------
+def default_config(pbini_path: str = "logic/PBINI.txt") -> PlayBalanceConfig:
+    """Return the stock configuration from ``pbini_path``."""
+
+    return PlayBalanceConfig.from_dict(load_pbini(pbini_path))
+
+
+def all_strategies_config(pbini_path: str = "logic/PBINI.txt") -> PlayBalanceConfig:
+    """Return the stock configuration with :data:`ALL_STRATEGIES` applied."""
+
+    config = default_config(pbini_path)
+    config.values.update(ALL_STRATEGIES)
+    return config
+
+
+SCENARIOS: Dict[str, Callable[[], PlayBalanceConfig]] = {
+    "default": default_config,
+    "all_strategies": all_strategies_config,
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput measured for one scenario."""
+
+    scenario: str
+    games: int
+    at_bats: int
+    seconds: float
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+    @property
+    def at_bats_per_sec(self) -> float:
+        return self.at_bats / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        data = asdict(self)
+        data["games_per_sec"] = self.games_per_sec
+        data["at_bats_per_sec"] = self.at_bats_per_sec
+        return data
+
+
+def run_scenario(
+    name: str,
+    config: PlayBalanceConfig,
+    rosters: Dict[str, TeamRoster],
+    games: int,
+    *,
+    seed: int = 0,
+    innings: int = 9,
+    profile: Optional[DecisionStats] = None,
+) -> BenchmarkResult:
+    """Simulate ``games`` games between ``rosters`` and time them.
+
+    Games cycle through every ordered pair of teams and each draws from its
+    own :class:`~logic.rng_streams.RandomStreams`, so a scenario plays the
+    same games on every run.  Decision counters of every game are added to
+    ``profile`` when given.
+    """
+
+    pairs = itertools.cycle(itertools.permutations(sorted(rosters), 2))
+    at_bats = 0
+    start = time.perf_counter()
+    for game_id in range(games):
+        home_id, away_id = next(pairs)
+        home = _team_state(rosters[home_id])
+        away = _team_state(rosters[away_id])
+        sim = GameSimulation(
+            home,
+            away,
+            config,
+            events=NullSink(),
+            streams=RandomStreams(seed, str(game_id)),
+            profile=profile,
+        )
+        sim.simulate_game(innings)
+        for team in (home, away):
+            at_bats += sum(s.at_bats for s in team.lineup_stats.values())
+    seconds = time.perf_counter() - start
+    return BenchmarkResult(name, games, at_bats, seconds)
+
+
+def run_benchmarks(
+    games: int,
+    *,
+    scenarios: Optional[Sequence[str]] = None,
+    team_ids: Optional[Sequence[str]] = None,
+    seed: int = 0,
+    profiles: Optional[Dict[str, DecisionStats]] = None,
+) -> List[BenchmarkResult]:
+    """Run each of ``scenarios`` (all by default) for ``games`` games.
+
+    When ``profiles`` is a dict, it receives the decision counters of each
+    scenario.
+    """
+
+    if team_ids is None:
+        team_ids = [team.team_id for team in load_teams()]
+    rosters = load_team_rosters(team_ids)
+    names = list(scenarios) if scenarios else list(SCENARIOS)
+    results = []
+    for name in names:
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name}")
+        stats = None
+        if profiles is not None:
+            stats = profiles[name] = DecisionStats()
+        results.append(
+            run_scenario(
+                name, SCENARIOS[name](), rosters, games, seed=seed, profile=stats
+            )
+        )
+    return results
+
+
+# ----------------------------------------------------------------------
+# History and regression checks
+# ----------------------------------------------------------------------
+def load_history(path: str) -> List[Dict[str, object]]:
+    """Return the recorded runs in ``path``, oldest first."""
+
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def append_history(path: str, results: Sequence[BenchmarkResult]) -> Dict[str, object]:
+    """Append a run made of ``results`` to the history file and return it."""
+
+    history = load_history(path)
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {r.scenario: r.to_dict() for r in results},
+    }
+    history.append(entry)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(history, fh, indent=2)
+    return entry
+
+
+def check_regression(
+    results: Sequence[BenchmarkResult],
+    history: Sequence[Dict[str, object]],
+    threshold_pct: float,
+    window: int = 5,
+) -> List[str]:
+    """Return a message for each scenario slower than its recent baseline.
+
+    The baseline is the median games per second of the last ``window``
+    recorded runs of the scenario.  A scenario regresses when it is more
+    than ``threshold_pct`` percent below that baseline.  Scenarios without
+    history are never reported.
+    """
+
+    problems = []
+    for result in results:
+        past = [
+            run["results"][result.scenario]["games_per_sec"]
+            for run in history
+            if result.scenario in run.get("results", {})
+        ][-window:]
+        if not past:
+            continue
+        baseline = statistics.median(past)
+        floor = baseline * (1 - threshold_pct / 100.0)
+        if result.games_per_sec < floor:
+            drop = 100.0 * (1 - result.games_per_sec / baseline)
+            problems.append(
+                f"{result.scenario}: {result.games_per_sec:.1f} games/s is "
+                f"{drop:.1f}% below the baseline of {baseline:.1f} games/s"
+            )
+    return problems
+
+
+# ----------------------------------------------------------------------
+# Command line
+# ----------------------------------------------------------------------
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=500, help="games per scenario")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="scenario to run (repeatable, default: all)",
+    )
+    parser.add_argument("--teams", nargs="+", help="team ids (default: every team)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--history", default=DEFAULT_HISTORY)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="allowed drop in games/s, in percent of the baseline",
+    )
+    parser.add_argument(
+        "--window", type=int, default=5, help="recent runs forming the baseline"
+    )
+    parser.add_argument(
+        "--no-record", action="store_true", help="do not append this run to the history"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="print per-decision counters"
+    )
+    args = parser.parse_args(argv)
+
+    profiles: Optional[Dict[str, DecisionStats]] = {} if args.profile else None
+    results = run_benchmarks(
+        args.games,
+        scenarios=args.scenario,
+        team_ids=args.teams,
+        seed=args.seed,
+        profiles=profiles,
+    )
+    for r in results:
+        print(
+            f"{r.scenario:<16} {r.games_per_sec:10.1f} games/s "
+            f"{r.at_bats_per_sec:12.1f} at-bats/s ({r.games} games, {r.seconds:.2f}s)"
+        )
+    if profiles is not None:
+        for name, stats in profiles.items():
+            print(f"\n[{name}]\n{stats.report()}")
+        return 0
+
+    problems = check_regression(
+        results, load_history(args.history), args.threshold, args.window
+    )
+    if not args.no_record:
+        append_history(args.history, results)
+    for message in problems:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+__all__ = [
+    "ALL_STRATEGIES",
+    "BenchmarkResult",
+    "SCENARIOS",
+    "all_strategies_config",
+    "append_history",
+    "check_regression",
+    "default_config",
+    "load_history",
+    "main",
+    "run_benchmarks",
+    "run_scenario",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover - command line entry point
+    sys.exit(main())
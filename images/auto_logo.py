@@ -1,7 +1,13 @@
-from dataclasses import dataclass
-from typing import Optional, Tuple, List, Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Optional, Tuple, List, Callable, Set
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
-import math, random, hashlib, os
+import math, random, hashlib, json, os, shutil
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
 
 # ------------------ Data model ------------------
 @dataclass
@@ -66,34 +72,83 @@ def choose_colors(spec: TeamSpec, rnd: random.Random):
     return _hex_to_rgb(pal[0]), _hex_to_rgb(pal[1])
 
 # ------------------ Drawing primitives ------------------
+# With NumPy the gradient and the blended overlays (field background, gloss)
+# are computed as whole arrays; the per-pixel fallbacks produce identical
+# images.
+def _radial_gradient_array(w: int, h: int, inner_rgb, outer_rgb):
+    cx, cy = w//2, h//2; max_r = (cx**2 + cy**2) ** 0.5
+    # The gradient only depends on |x-cx| and |y-cy|: render one quadrant
+    # and mirror it by indexing.
+    ay = np.abs(np.arange(h) - cy); ax = np.abs(np.arange(w) - cx)
+    qy = np.arange(ay.max() + 1, dtype=np.float64)[:, None]
+    qx = np.arange(ax.max() + 1, dtype=np.float64)[None, :]
+    t = np.minimum(np.sqrt(qx*qx + qy*qy) / max_r, 1.0)[..., None]
+    inner = np.asarray(inner_rgb, dtype=np.float64)
+    outer = np.asarray(outer_rgb, dtype=np.float64)
+    # Same expression as ``_blend``; the cast truncates like ``int()``.
+    quadrant = (inner + (outer - inner)*t).astype(np.uint8)
+    return quadrant[ay[:, None], ax[None, :]]
+
 def _draw_radial_gradient(img: Image.Image, inner_rgb, outer_rgb):
-    w,h = img.size; cx, cy = w//2, h//2; max_r = (cx**2 + cy**2) ** 0.5
+    w,h = img.size
+    if np is not None:
+        img.paste(Image.fromarray(_radial_gradient_array(w, h, inner_rgb, outer_rgb), "RGB"))
+        return
+    cx, cy = w//2, h//2; max_r = (cx**2 + cy**2) ** 0.5
     px = img.load()
     for y in range(h):
         for x in range(w):
             r = ((x-cx)**2 + (y-cy)**2) ** 0.5 / max_r
             px[x,y] = _blend(inner_rgb, outer_rgb, min(1.0, r))
 
-def _draw_field_background(img: Image.Image, color=(255,255,255), alpha=40, scale=0.65) -> Image.Image:
-    if img.mode != "RGBA": base = img.convert("RGBA")
-    else: base = img
-    w,h = base.size; cx, cy = w//2, int(h*0.55); size = int(min(w,h)*0.45*scale)
+def _blend_toward(img: Image.Image, color, mask: Image.Image) -> Image.Image:
+    """Blend the RGB ``img`` toward ``color`` by the ``L`` mode ``mask``.
+
+    Equivalent to ``Image.composite(Image.new("RGB", size, color), img, mask)``
+    and to alpha compositing ``color`` with the mask as its alpha.
+    """
+    if np is None:
+        return Image.composite(Image.new("RGB", img.size, color), img, mask)
+    base = np.asarray(img, dtype=np.int32)
+    a = np.asarray(mask, dtype=np.int32)[..., None]
+    t = (np.asarray(color, dtype=np.int32) - base)*a + 128
+    # Rounded division by 255 without floats, as Pillow does it.
+    out = base + ((t >> 8) + t >> 8)
+    return Image.fromarray(out.astype(np.uint8), "RGB")
+
+def _field_background_mask(w: int, h: int, alpha: int, scale: float) -> Image.Image:
+    cx, cy = w//2, int(h*0.55); size = int(min(w,h)*0.45*scale)
     pts = [(cx, cy-size), (cx+size, cy), (cx, cy+size), (cx-size, cy)]
-    fill = (*color, alpha)
-    overlay = Image.new("RGBA", (w,h), (0,0,0,0))
-    od = ImageDraw.Draw(overlay)
-    od.polygon(pts, outline=fill, width=max(2, size//20))
+    mask = Image.new("L", (w,h), 0)
+    od = ImageDraw.Draw(mask)
+    od.polygon(pts, outline=alpha, width=max(2, size//20))
     s2 = int(size*0.6)
     pts2 = [(cx, cy-int(s2)), (cx+int(s2), cy), (cx, cy+int(s2)), (cx-int(s2), cy)]
-    od.polygon(pts2, outline=fill, width=max(2, size//24))
+    od.polygon(pts2, outline=alpha, width=max(2, size//24))
     b = max(3, size//25)
-    for px,py in pts2: od.rectangle([px-b, py-b, px+b, py+b], fill=fill)
-    od.arc([cx-size, cy-size, cx+size, cy+size], start=200, end=340, fill=fill, width=max(2, size//24))
-    od.ellipse([cx-b, cy-b, cx+b, cy+b], fill=fill)
+    for px,py in pts2: od.rectangle([px-b, py-b, px+b, py+b], fill=alpha)
+    od.arc([cx-size, cy-size, cx+size, cy+size], start=200, end=340, fill=alpha, width=max(2, size//24))
+    od.ellipse([cx-b, cy-b, cx+b, cy+b], fill=alpha)
+    return mask
+
+def _draw_field_background(img: Image.Image, color=(255,255,255), alpha=40, scale=0.65) -> Image.Image:
+    # The marks are drawn once into a mask of constant ``alpha`` and blended
+    # in one step, instead of compositing a full RGBA overlay.
+    mask = _field_background_mask(img.width, img.height, alpha, scale)
+    if img.mode == "RGB":
+        return _blend_toward(img, color, mask)
+    base = img.convert("RGBA")
+    overlay = Image.new("RGBA", img.size, (*color, 0))
+    overlay.putalpha(mask)
     base.alpha_composite(overlay)
-    if img is not base: return base.convert("RGB")
     return base
 
+def _gloss_mask(w: int, h: int, center, radius: int, size: int) -> Image.Image:
+    gloss = Image.new("L", (w,h), 0); gdraw = ImageDraw.Draw(gloss)
+    gdraw.ellipse([center[0]-radius, center[1]-radius, center[0]+radius, center[1]], fill=80)
+    gloss = gloss.filter(ImageFilter.GaussianBlur(radius=int(size*0.04)))
+    return gloss.point(lambda p: int(p*0.4))
+
 def _stroke_text(draw, xy, text, font, fill, stroke_fill, stroke_width):
     x,y = xy
     for dx in range(-stroke_width, stroke_width+1):
@@ -150,10 +205,7 @@ def _render_circle_badge(spec: TeamSpec, rnd: random.Random, size=1024, font_pat
     _stroke_text(draw, (cx, center[1]-int(f_city.size*0.6)), city, f_city, fill=_contrast_color(secondary), stroke_fill=(0,0,0,180), stroke_width=max(2,int(size*0.005)))
     nx = _center_text(draw, w, nick, f_nick)
     _stroke_text(draw, (nx, center[1]+int(f_city.size*0.1)), nick, f_nick, fill=(255,255,255), stroke_fill=(0,0,0,200), stroke_width=max(2,int(size*0.006)))
-    gloss = Image.new("L", (w,h), 0); gdraw = ImageDraw.Draw(gloss)
-    gdraw.ellipse([center[0]-radius, center[1]-radius, center[0]+radius, center[1]], fill=80)
-    gloss = gloss.filter(ImageFilter.GaussianBlur(radius=int(size*0.04)))
-    img = Image.composite(Image.new("RGB",(w,h),(255,255,255)), img, gloss.point(lambda p: int(p*0.4)))
+    img = _blend_toward(img, (255,255,255), _gloss_mask(w, h, center, radius, size))
     return img
 
 def _render_shield(spec: TeamSpec, rnd: random.Random, size=1024, font_path: Optional[str]=None) -> Image.Image:
@@ -223,20 +275,103 @@ def save_logo(img: Image.Image, out_path: str, dpi: int=300):
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     img.save(out_path, format="PNG", dpi=(dpi,dpi))
 
+# Bump when a change to the renderers alters their output, so cached logos
+# are not reused.
+RENDER_VERSION = 1
+
+def logo_cache_key(spec: TeamSpec, size: int, font_path: Optional[str] = None) -> str:
+    """Content address of the logo rendered for ``spec`` at ``size``."""
+    payload = {
+        "spec": asdict(spec),
+        "size": size,
+        "template": (spec.template or "circle").lower(),
+        "font": font_path,
+        "version": RENDER_VERSION,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _logo_filename(t: TeamSpec) -> str:
+    return f"{(t.abbrev or (t.location+' '+t.mascot)).replace(' ', '_').lower()}.png"
+
+def _render_logo_file(spec: TeamSpec, size: int, font_path: Optional[str], path: str) -> str:
+    seed = spec.seed or _seed_from_name(spec.location, spec.mascot)
+    img = generate_logo(spec, size=size, font_path=font_path, rnd=random.Random(seed))
+    # Write then rename so a cache entry is never seen half written.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    save_logo(img, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
 def batch_generate(
     teams: List[TeamSpec],
     out_dir: str,
     size: int = 1024,
     font_path: Optional[str] = None,
     callback: Optional[Callable[[TeamSpec, str], None]] = None,
+    workers: Optional[int] = 1,
+    cache_dir: Optional[str] = None,
+    prune: bool = True,
 ):
+    """Render a logo for each of ``teams`` into ``out_dir``.
+
+    ``callback`` receives ``(spec, path)`` in the calling process as each
+    logo is written; with several workers that is in completion order.
+    ``workers`` processes render in parallel (``None`` means one per CPU,
+    ``1`` renders in this process).  With ``cache_dir`` each logo is stored
+    there under :func:`logo_cache_key` and copied into ``out_dir``; logos
+    already in the cache are not rendered again.  Once the logos are written,
+    ``prune`` deletes cache entries no spec in ``teams`` refers to any more,
+    such as renders of old colours; pass ``prune=False`` when ``teams`` is
+    only part of the league.
+    """
     os.makedirs(out_dir, exist_ok=True)
-    for t in teams:
-        seed = t.seed or _seed_from_name(t.location, t.mascot)
-        rnd = random.Random(seed)
-        img = generate_logo(t, size=size, font_path=font_path, rnd=rnd)
-        filename = f"{(t.abbrev or (t.location+' '+t.mascot)).replace(' ', '_').lower()}.png"
-        path = os.path.join(out_dir, filename)
-        save_logo(img, path)
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def finish(spec: TeamSpec, rendered: str, path: str) -> None:
+        if rendered != path:
+            shutil.copyfile(rendered, path)
         if callback:
-            callback(t, path)
+            callback(spec, path)
+
+    jobs = []
+    keys = set()
+    for t in teams:
+        path = os.path.join(out_dir, _logo_filename(t))
+        if cache_dir is None:
+            jobs.append((t, path, path))
+            continue
+        key = logo_cache_key(t, size, font_path)
+        keys.add(key)
+        cached = os.path.join(cache_dir, f"{key}.png")
+        if os.path.exists(cached):
+            finish(t, cached, path)
+        else:
+            jobs.append((t, cached, path))
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs)) or 1
+    if workers == 1:
+        for t, target, path in jobs:
+            finish(t, _render_logo_file(t, size, font_path, target), path)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_render_logo_file, t, size, font_path, target): (t, path)
+                for t, target, path in jobs
+            }
+            for future in as_completed(futures):
+                t, path = futures[future]
+                finish(t, future.result(), path)
+
+    if cache_dir is not None and prune:
+        _prune_cache(cache_dir, keys)
+
+def _prune_cache(cache_dir: str, keys: Set[str]) -> None:
+    """Delete the logos in ``cache_dir`` whose key is not in ``keys``."""
+    for name in os.listdir(cache_dir):
+        stem, ext = os.path.splitext(name)
+        if ext == ".png" and stem not in keys:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
@@ -0,0 +1,497 @@
+"""Vectorised Monte Carlo engine for replaying one matchup many times.
+
+:class:`BatchGameSimulation` advances thousands of copies of the same
+``home``/``away`` game in lockstep.  Base occupancy, outs, batting order
+position, runs and the per-game roster state are held in NumPy arrays and all
+random rolls for an at-bat are drawn as one block.  The probabilities come
+from the same code paths used by :meth:`GameSimulation.play_at_bat` –
+:func:`~logic.simulation.hit_probability` and the chance calculations of
+:class:`~logic.offensive_manager.OffensiveManager` – and the substitution rules
+of :class:`~logic.substitution_manager.SubstitutionManager` are mirrored, so
+the score distribution matches calling ``simulate_game()`` in a loop.
+
+The defensive checks made before each at-bat (charging the bunt, holding the
+runner, pickoffs, pitch outs and pitching around) only feed the strategy log
+in the scalar engine and are therefore not rolled here.
+
+NumPy is an optional dependency; constructing the engine without it raises
+:class:`RuntimeError`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+from .offensive_manager import OffensiveManager
+from .playbalance_config import PlayBalanceConfig
+from .simulation import STEAL_SUCCESS_PROB, TeamState, hit_probability
+
+_EMPTY = -1
+# Bench players are ranked by insertion order so ties resolve to the player
+# ``max()`` would pick from the scalar engine's bench list.
+_RANK_SPAN = 1 << 20
+
+# Rows of the uniform block drawn for every at-bat step.
+(
+    _U_PINCH_RUN,
+    _U_DOUBLE_SWITCH,
+    _U_PINCH_HIT,
+    _U_HIT_AND_RUN,
+    _U_HNR_STEAL,
+    _U_SACRIFICE,
+    _U_SQUEEZE,
+    _U_SWING,
+    _U_STEAL_ATTEMPT,
+    _U_STEAL,
+) = range(10)
+_N_ROLLS = 10
+
+
+def _pct(chance: float) -> float:
+    """Convert a percentage chance into a clamped probability."""
+
+    return max(0.0, min(100.0, chance)) / 100.0
+
+
+@dataclass
+class BatchResult:
+    """Final scores of every simulated game."""
+
+    home_runs: "np.ndarray"
+    away_runs: "np.ndarray"
+    home_inning_runs: "np.ndarray"
+    away_inning_runs: "np.ndarray"
+
+    @property
+    def games(self) -> int:
+        return int(self.home_runs.shape[0])
+
+    @property
+    def home_win_prob(self) -> float:
+        return float(np.mean(self.home_runs > self.away_runs))
+
+    @property
+    def away_win_prob(self) -> float:
+        return float(np.mean(self.away_runs > self.home_runs))
+
+    @property
+    def tie_prob(self) -> float:
+        return float(np.mean(self.home_runs == self.away_runs))
+
+    def expected_runs(self, side: str = "home") -> float:
+        return float(np.mean(self._runs(side)))
+
+    def run_distribution(self, side: str = "home") -> "np.ndarray":
+        """Return ``P(runs == k)`` for ``k = 0..max`` for ``side``."""
+
+        runs = self._runs(side)
+        return np.bincount(runs) / runs.shape[0]
+
+    def _runs(self, side: str) -> "np.ndarray":
+        if side == "home":
+            return self.home_runs
+        if side == "away":
+            return self.away_runs
+        raise ValueError(f"Unknown side: {side}")
+
+
+class _GameState:
+    """Per-game roster and score arrays for one team."""
+
+    FIELDS = (
+        "lineup",
+        "bench",
+        "rank",
+        "next_rank",
+        "pitcher",
+        "pitches",
+        "batting_index",
+        "runs",
+    )
+
+    def __init__(self, **arrays: "np.ndarray") -> None:
+        for name in self.FIELDS:
+            setattr(self, name, arrays[name])
+
+    def take(self, rows: "np.ndarray") -> "_GameState":
+        """Return a copy holding only the games selected by ``rows``."""
+
+        return _GameState(**{name: getattr(self, name)[rows] for name in self.FIELDS})
+
+    def put(self, rows: "np.ndarray", other: "_GameState") -> None:
+        """Write ``other`` back into the games selected by ``rows``."""
+
+        for name in self.FIELDS:
+            getattr(self, name)[rows] = getattr(other, name)
+
+    # ------------------------------------------------------------------
+    # Roster helpers
+    # ------------------------------------------------------------------
+    def best_bench(self, ratings: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the best available bench player per game and a has-bench mask."""
+
+        key = np.where(
+            self.bench, ratings[None, :] * _RANK_SPAN - self.rank, np.iinfo(np.int64).min
+        )
+        return key.argmax(axis=1), self.bench.any(axis=1)
+
+    def change_pitcher(self, mask: "np.ndarray") -> None:
+        self.pitcher += mask
+        self.pitches[mask] = 0
+
+    def put_in_slot(self, mask: "np.ndarray", slot: "np.ndarray", player: "np.ndarray") -> None:
+        rows = np.flatnonzero(mask)
+        self.lineup[rows, slot[rows]] = player[rows]
+        self.bench[rows, player[rows]] = False
+
+
+class _TeamArrays:
+    """Rating and decision probability tables for one team."""
+
+    def __init__(
+        self,
+        team: TeamState,
+        config: PlayBalanceConfig,
+        offense: OffensiveManager,
+        n: int,
+    ) -> None:
+        if not team.pitchers:
+            raise RuntimeError("Defense has no available pitcher")
+        players = list(team.lineup) + list(team.bench)
+        size = len(players)
+        lineup_len = len(team.lineup)
+
+        self.players = players
+        self.ph = np.array([p.ph for p in players], dtype=np.int64)
+        self.sp = np.array([p.sp for p in players], dtype=np.int64)
+        self.gf = np.array([p.gf for p in players], dtype=np.int64)
+        self.hit_p = np.array([hit_probability(config, p.ph) for p in players])
+
+        self.pitchers = list(team.pitchers)
+        self.endurance = np.array([p.endurance for p in self.pitchers], dtype=np.int64)
+
+        # Offensive decision probabilities indexed by player rows.
+        self.hnr_p = np.array(
+            [
+                [
+                    _pct(
+                        offense.hit_and_run_chance(
+                            runner_sp=runner.sp, batter_ch=batter.ch, batter_ph=batter.ph
+                        )
+                    )
+                    for batter in players
+                ]
+                for runner in players
+            ]
+        )
+        # Variant 0: not close & late; 1: close & late; 2: close & late with a
+        # runner on second.  A runner is always on first when bunting.
+        self.sac_p = np.array(
+            [
+                [
+                    _pct(
+                        offense.sacrifice_bunt_chance(
+                            batter_is_pitcher=batter.primary_position == "P",
+                            batter_ch=batter.ch,
+                            batter_ph=batter.ph,
+                            outs=0,
+                            inning=inning,
+                            on_first=True,
+                            on_second=on_second,
+                            run_diff=0,
+                        )
+                    )
+                    for batter in players
+                ]
+                for inning, on_second in ((1, False), (7, False), (7, True))
+            ]
+        )
+        self.squeeze_p = np.array(
+            [
+                [
+                    _pct(
+                        offense.suicide_squeeze_chance(
+                            batter_ch=batter.ch,
+                            batter_ph=batter.ph,
+                            balls=0,
+                            strikes=0,
+                            runner_on_third_sp=runner.sp,
+                        )
+                    )
+                    for runner in players
+                ]
+                for batter in players
+            ]
+        )
+        self.steal_p: Optional["np.ndarray"] = None
+
+        bench = np.zeros((n, size), dtype=bool)
+        bench[:, lineup_len:] = True
+        self.state = _GameState(
+            lineup=np.tile(np.arange(lineup_len, dtype=np.int64), (n, 1)),
+            bench=bench,
+            rank=np.tile(np.arange(size, dtype=np.int64), (n, 1)),
+            next_rank=np.full(n, size, dtype=np.int64),
+            pitcher=np.zeros(n, dtype=np.int64),
+            pitches=np.zeros(n, dtype=np.int64),
+            batting_index=np.zeros(n, dtype=np.int64),
+            runs=np.zeros(n, dtype=np.int64),
+        )
+        self.inning_runs: List["np.ndarray"] = []
+
+    def build_steal_table(self, offense: OffensiveManager, pitchers: List) -> None:
+        """Post-hit steal chance indexed by ``[runner, opposing pitcher]``.
+
+        The runner is the batter who just reached, whose ``CH`` is also used
+        as the batter rating, exactly as in ``GameSimulation.play_at_bat``.
+        """
+
+        self.steal_p = np.array(
+            [
+                [
+                    offense.calculate_steal_chance(
+                        runner_sp=runner.sp,
+                        pitcher_hold=pitcher.hold_runner,
+                        pitcher_is_left=pitcher.bats == "L",
+                        batter_ch=runner.ch,
+                    )
+                    for pitcher in pitchers
+                ]
+                for runner in self.players
+            ]
+        )
+
+
+class BatchGameSimulation:
+    """Simulate ``n_games`` copies of the same matchup in lockstep.
+
+    ``home`` and ``away`` should be fresh :class:`TeamState` objects; they are
+    only read, never mutated.
+    """
+
+    def __init__(
+        self,
+        home: TeamState,
+        away: TeamState,
+        config: PlayBalanceConfig,
+        n_games: int = 10000,
+        seed: Optional[int] = None,
+    ) -> None:
+        if np is None:
+            raise RuntimeError("Batch simulation requires numpy to be installed")
+        self.config = config
+        self.n = n_games
+        self.rng = np.random.default_rng(seed)
+        offense = OffensiveManager(config)
+        self.home = _TeamArrays(home, config, offense, n_games)
+        self.away = _TeamArrays(away, config, offense, n_games)
+        self.home.build_steal_table(offense, self.away.pitchers)
+        self.away.build_steal_table(offense, self.home.pitchers)
+
+        self.tired_thresh = config.get("pitcherTiredThresh", 0)
+        self.pinch_run_chance = config.get("pinchRunChance", 0) / 100.0
+        self.def_sub_chance = config.get("defSubChance", 0) / 100.0
+        self.double_switch_chance = config.get("doubleSwitchChance", 0) / 100.0
+        self.pinch_hit_chance = config.get("doubleSwitchPHAdjust", 0) / 100.0
+
+    # ------------------------------------------------------------------
+    # Core loop
+    # ------------------------------------------------------------------
+    def simulate_games(self, innings: int = 9) -> BatchResult:
+        """Play ``innings`` innings in every game and return the scores."""
+
+        for inning in range(1, innings + 1):
+            self._play_half(self.away, self.home, inning)  # Top half
+            self._play_half(self.home, self.away, inning)  # Bottom half
+        return BatchResult(
+            home_runs=self.home.state.runs.copy(),
+            away_runs=self.away.state.runs.copy(),
+            home_inning_runs=np.stack(self.home.inning_runs, axis=1),
+            away_inning_runs=np.stack(self.away.inning_runs, axis=1),
+        )
+
+    def _play_half(self, offense: _TeamArrays, defense: _TeamArrays, inning: int) -> None:
+        self._defensive_sub(defense.state)
+
+        start_runs = offense.state.runs.copy()
+        # Only games still batting in this half are advanced; finished games
+        # are written back and dropped so long innings do not drag the rest.
+        rows = np.arange(self.n)
+        off = offense.state.take(rows)
+        dfn = defense.state.take(rows)
+        bases = np.full((self.n, 3), _EMPTY, dtype=np.int64)
+        outs = np.zeros(self.n, dtype=np.int64)
+        while rows.size:
+            rolls = self.rng.random((_N_ROLLS, rows.size))
+            outs += self._at_bat(offense, off, defense, dfn, bases, rolls, inning)
+            batting = outs < 3
+            if batting.all():
+                continue
+            finished = ~batting
+            offense.state.put(rows[finished], off.take(finished))
+            defense.state.put(rows[finished], dfn.take(finished))
+            rows = rows[batting]
+            off = off.take(batting)
+            dfn = dfn.take(batting)
+            bases = bases[batting]
+            outs = outs[batting]
+        offense.inning_runs.append(offense.state.runs - start_runs)
+
+    def _defensive_sub(self, team: _GameState) -> None:
+        if self.def_sub_chance <= 0:
+            return
+        tables = self.home if team is self.home.state else self.away
+        roll = self.rng.random(self.n)
+        worst_slot = tables.gf[team.lineup].argmin(axis=1)
+        worst = team.lineup[np.arange(self.n), worst_slot]
+        best, has_bench = team.best_bench(tables.gf)
+        swap = has_bench & (tables.gf[best] > tables.gf[worst]) & (roll < self.def_sub_chance)
+        rows = np.flatnonzero(swap)
+        team.bench[rows, best[rows]] = False
+        team.bench[rows, worst[rows]] = True
+        team.rank[rows, worst[rows]] = team.next_rank[rows]
+        team.next_rank += swap
+        team.lineup[rows, worst_slot[rows]] = best[rows]
+
+    def _at_bat(
+        self,
+        offense: _TeamArrays,
+        off: _GameState,
+        defense: _TeamArrays,
+        dfn: _GameState,
+        bases: "np.ndarray",
+        u: "np.ndarray",
+        inning: int,
+    ) -> "np.ndarray":
+        """Play one at-bat in every game of ``off``; return the outs recorded."""
+
+        count = bases.shape[0]
+        rows = np.arange(count)
+
+        # Pitching change when the current pitcher is tired
+        remaining = defense.endurance[dfn.pitcher] - dfn.pitches
+        tired = (remaining <= self.tired_thresh) & (
+            dfn.pitcher < len(defense.pitchers) - 1
+        )
+        dfn.change_pitcher(tired)
+
+        # Pinch runner for the runner on first
+        if self.pinch_run_chance > 0:
+            runner = bases[:, 0]
+            occupied = runner != _EMPTY
+            best, has_bench = off.best_bench(offense.sp)
+            swap = (
+                occupied
+                & has_bench
+                & (offense.sp[best] > offense.sp[np.where(occupied, runner, 0)])
+                & (u[_U_PINCH_RUN] < self.pinch_run_chance)
+            )
+            in_lineup = off.lineup == runner[:, None]
+            off.put_in_slot(swap & in_lineup.any(axis=1), in_lineup.argmax(axis=1), best)
+            off.bench[rows[swap], best[swap]] = False
+            bases[:, 0] = np.where(swap, best, runner)
+
+        # Batter selection: double switch, otherwise pinch hitter
+        slot = off.batting_index % off.lineup.shape[1]
+        starter = off.lineup[rows, slot]
+        switched = np.zeros(count, dtype=bool)
+        if self.double_switch_chance > 0:
+            switched = (
+                off.bench.any(axis=1)
+                & (dfn.pitcher < len(defense.pitchers) - 1)
+                & (u[_U_DOUBLE_SWITCH] < self.double_switch_chance)
+            )
+            dfn.change_pitcher(switched)
+            best, has_bench = off.best_bench(offense.ph)
+            off.put_in_slot(
+                switched & has_bench & (offense.ph[best] > offense.ph[starter]), slot, best
+            )
+        if self.pinch_hit_chance > 0:
+            best, has_bench = off.best_bench(offense.ph)
+            off.put_in_slot(
+                ~switched
+                & has_bench
+                & (offense.ph[best] > offense.ph[starter])
+                & (u[_U_PINCH_HIT] < self.pinch_hit_chance),
+                slot,
+                best,
+            )
+        batter = off.lineup[rows, slot]
+        off.batting_index += 1
+        dfn.pitches += 1
+
+        outs = np.zeros(count, dtype=np.int64)
+
+        # Hit and run, otherwise a sacrifice bunt, with a runner on first
+        runner = bases[:, 0]
+        on_first = runner != _EMPTY
+        runner_row = np.where(on_first, runner, 0)
+        hit_and_run = on_first & (u[_U_HIT_AND_RUN] < offense.hnr_p[runner_row, batter])
+        stole = hit_and_run & (u[_U_HNR_STEAL] < STEAL_SUCCESS_PROB)
+        bases[:, 1] = np.where(stole, bases[:, 0], bases[:, 1])
+        bases[:, 0] = np.where(hit_and_run, _EMPTY, bases[:, 0])
+        outs += hit_and_run & ~stole
+
+        close_late = (inning >= 7) & (np.abs(off.runs - dfn.runs) <= 1)
+        variant = np.where(close_late, 1 + (bases[:, 1] != _EMPTY), 0)
+        bunt = (
+            on_first
+            & ~hit_and_run
+            & (u[_U_SACRIFICE] < offense.sac_p[variant, batter])
+        )
+        off.runs += bunt & (bases[:, 2] != _EMPTY)
+        bases[:, 2] = np.where(bunt, bases[:, 1], bases[:, 2])
+        bases[:, 1] = np.where(bunt, bases[:, 0], bases[:, 1])
+        bases[:, 0] = np.where(bunt, _EMPTY, bases[:, 0])
+        outs += bunt
+        done = bunt
+
+        # Suicide squeeze with a runner on third
+        third = bases[:, 2]
+        on_third = ~done & (third != _EMPTY)
+        squeeze = on_third & (
+            u[_U_SQUEEZE] < offense.squeeze_p[batter, np.where(on_third, third, 0)]
+        )
+        off.runs += squeeze
+        bases[:, 2] = np.where(squeeze, _EMPTY, third)
+        outs += squeeze
+        done = done | squeeze
+
+        # Swing, runners advance on a hit and the new runner may steal
+        live = ~done
+        hit = live & (u[_U_SWING] < offense.hit_p[batter])
+        outs += live & ~hit
+        off.runs += hit & (bases[:, 2] != _EMPTY)
+        bases[:, 2] = np.where(hit, bases[:, 1], bases[:, 2])
+        bases[:, 1] = np.where(hit, bases[:, 0], bases[:, 1])
+        bases[:, 0] = np.where(hit, batter, bases[:, 0])
+
+        attempt = hit & (u[_U_STEAL_ATTEMPT] < offense.steal_p[batter, dfn.pitcher])
+        stole = attempt & (u[_U_STEAL] < STEAL_SUCCESS_PROB)
+        bases[:, 1] = np.where(stole, bases[:, 0], bases[:, 1])
+        bases[:, 0] = np.where(attempt, _EMPTY, bases[:, 0])
+        outs += attempt & ~stole
+
+        return outs
+
+
+def simulate_matchup(
+    home: TeamState,
+    away: TeamState,
+    config: PlayBalanceConfig,
+    n_games: int = 10000,
+    innings: int = 9,
+    seed: Optional[int] = None,
+) -> BatchResult:
+    """Convenience wrapper around :class:`BatchGameSimulation`."""
+
+    return BatchGameSimulation(home, away, config, n_games, seed).simulate_games(innings)
+
+
+__all__ = ["BatchGameSimulation", "BatchResult", "simulate_matchup"]
@@ -0,0 +1,186 @@
+"""Opt-in profiling counters for simulation decisions.
+
+Passing a :class:`DecisionStats` to :class:`~logic.simulation.GameSimulation`
+wraps :meth:`~logic.simulation.GameSimulation.play_at_bat` and every manager
+decision of that simulation.  Each wrapped call records how often it was
+called, how often it triggered and the cumulative nanoseconds it took.  The
+wrappers are installed on the instances only, so a simulation without a
+profile runs the plain methods and pays nothing.
+
+Times are inclusive: ``sim.play_at_bat`` contains the time of the manager
+decisions made during the at-bat.  :class:`DecisionStats` objects are plain
+picklable containers and are combined with :meth:`DecisionStats.merge`, for
+example across the worker processes of a season run.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+# Index of each counter in a ``DecisionStats.counters`` entry.
+CALLS = 0
+TRIGGERS = 1
+NANOSECONDS = 2
+
+
+class DecisionStats:
+    """Call, trigger and timing counters keyed by decision name."""
+
+    def __init__(self) -> None:
+        self.counters: Dict[str, List[int]] = {}
+
+    def record(self, name: str, triggered: bool, elapsed_ns: int) -> None:
+        """Add one call of ``name`` to the counters."""
+
+        entry = self.counters.get(name)
+        if entry is None:
+            entry = self.counters[name] = [0, 0, 0]
+        entry[CALLS] += 1
+        if triggered:
+            entry[TRIGGERS] += 1
+        entry[NANOSECONDS] += elapsed_ns
+
+    def merge(self, other: "DecisionStats") -> "DecisionStats":
+        """Add the counters of ``other`` to this object and return it."""
+
+        for name, (calls, triggers, ns) in other.counters.items():
+            entry = self.counters.setdefault(name, [0, 0, 0])
+            entry[CALLS] += calls
+            entry[TRIGGERS] += triggers
+            entry[NANOSECONDS] += ns
+        return self
+
+    @classmethod
+    def merged(cls, stats: Iterable[Optional["DecisionStats"]]) -> "DecisionStats":
+        """Return the sum of ``stats``; ``None`` entries are ignored."""
+
+        total = cls()
+        for item in stats:
+            if item is not None:
+                total.merge(item)
+        return total
+
+    def calls(self, name: str) -> int:
+        return self.counters.get(name, [0, 0, 0])[CALLS]
+
+    def triggers(self, name: str) -> int:
+        return self.counters.get(name, [0, 0, 0])[TRIGGERS]
+
+    def nanoseconds(self, name: str) -> int:
+        return self.counters.get(name, [0, 0, 0])[NANOSECONDS]
+
+    def report(self) -> str:
+        """Return a table of the counters, most expensive decision first."""
+
+        rows = sorted(
+            self.counters.items(), key=lambda item: item[1][NANOSECONDS], reverse=True
+        )
+        width = max([len("decision")] + [len(name) for name, _ in rows])
+        lines = [
+            f"{'decision':<{width}} {'calls':>10} {'triggers':>10} "
+            f"{'total ms':>10} {'ns/call':>8}"
+        ]
+        for name, (calls, triggers, ns) in rows:
+            per_call = ns // calls if calls else 0
+            lines.append(
+                f"{name:<{width}} {calls:>10} {triggers:>10} "
+                f"{ns / 1e6:>10.1f} {per_call:>8}"
+            )
+        return "\n".join(lines)
+
+
+# ----------------------------------------------------------------------
+# Instrumentation
+# ----------------------------------------------------------------------
+def _team_signature(team) -> Tuple[object, ...]:
+    """Return a value that changes whenever a substitution alters ``team``."""
+
+    return (
+        tuple(map(id, team.lineup)),
+        tuple(map(id, team.bases)),
+        id(team.current_pitcher_state),
+        len(team.bench),
+    )
+
+
+# ``True`` compares the team passed as first argument before and after the
+# call, for substitutions that report nothing through their return value.
+Trigger = Union[Callable[[object], bool], bool]
+
+_DECISIONS: Dict[str, List[Tuple[str, Trigger]]] = {
+    "sim": [
+        ("play_at_bat", lambda outs: outs > 0),
+        ("_swing_result", bool),
+        ("_attempt_steal", lambda result: result is not None),
+    ],
+    "defense": [
+        ("maybe_charge_bunt", bool),
+        ("maybe_hold_runner", bool),
+        ("maybe_pickoff", bool),
+        ("maybe_pitch_out", bool),
+        ("maybe_pitch_around", any),
+    ],
+    "offense": [
+        ("calculate_steal_chance", bool),
+        ("maybe_hit_and_run", bool),
+        ("maybe_sacrifice_bunt", bool),
+        ("maybe_suicide_squeeze", bool),
+    ],
+    "subs": [
+        ("maybe_pinch_hit", True),
+        ("maybe_pinch_run", True),
+        ("maybe_defensive_sub", True),
+        ("maybe_double_switch", lambda player: player is not None),
+        ("maybe_change_pitcher", bool),
+    ],
+}
+
+
+def _instrument(
+    target: object, attr: str, label: str, trigger: Trigger, stats: DecisionStats
+) -> None:
+    method = getattr(target, attr)
+    clock = time.perf_counter_ns
+    record = stats.record
+
+    if trigger is True:
+
+        def wrapper(team, *args, **kwargs):
+            before = _team_signature(team)
+            start = clock()
+            result = method(team, *args, **kwargs)
+            elapsed = clock() - start
+            record(label, _team_signature(team) != before, elapsed)
+            return result
+
+    else:
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            result = method(*args, **kwargs)
+            elapsed = clock() - start
+            record(label, trigger(result), elapsed)
+            return result
+
+    wrapper.__wrapped__ = method  # type: ignore[attr-defined]
+    setattr(target, attr, wrapper)
+
+
+def instrument_simulation(sim, stats: DecisionStats) -> None:
+    """Record the decisions of ``sim`` and its managers into ``stats``.
+
+    Counters are named ``"<component>.<method>"`` where component is one of
+    ``sim``, ``defense``, ``offense`` or ``subs``.  A call triggers when the
+    decision fires: a ``True`` result, a pitch around or walk, an attempted
+    steal, a hit, a substitution or, for ``sim.play_at_bat``, an out.  For
+    ``offense.calculate_steal_chance`` it counts a non-zero chance.
+    """
+
+    for component, decisions in _DECISIONS.items():
+        target = sim if component == "sim" else getattr(sim, component)
+        for attr, trigger in decisions:
+            _instrument(target, attr, f"{component}.{attr}", trigger, stats)
+
+
+__all__ = ["DecisionStats", "instrument_simulation"]
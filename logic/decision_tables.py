@@ -0,0 +1,243 @@
+"""Precomputed PlayBalance lookups for offensive decisions.
+
+:class:`~logic.offensive_manager.OffensiveManager` evaluates the same chains
+of ``PB.INI`` thresholds for every pitch.  Since almost all inputs are small
+integer ratings, each chain can be resolved ahead of time into a table
+indexed by the rating.  :func:`decision_tables` compiles those tables once
+per configuration and :meth:`PlayBalanceConfig.compiled` rebuilds them
+whenever an entry changes.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+from .playbalance_config import PlayBalanceConfig
+
+# Ratings are tabulated for ``0 <= value < RATING_LIMIT``; anything outside
+# that range falls back to walking the thresholds.
+RATING_LIMIT = 128
+
+# Counts tabulated for the count based adjustments.
+_COUNTS = [(balls, strikes) for balls in range(4) for strikes in range(3)]
+
+
+class Ladder:
+    """Adjustment chosen by the first ``value <= threshold`` match.
+
+    ``adjusts`` holds one more entry than ``thresholds``; the last one applies
+    when ``value`` exceeds every threshold.
+    """
+
+    __slots__ = ("thresholds", "adjusts", "table")
+
+    def __init__(self, thresholds: Sequence[float], adjusts: Sequence[float]) -> None:
+        self.thresholds = tuple(thresholds)
+        self.adjusts = tuple(adjusts)
+        self.table = tuple(self._walk(value) for value in range(RATING_LIMIT))
+
+    def _walk(self, value: float) -> float:
+        for thresh, adjust in zip(self.thresholds, self.adjusts):
+            if value <= thresh:
+                return adjust
+        return self.adjusts[-1]
+
+    def __call__(self, value: float) -> float:
+        if value.__class__ is int and 0 <= value < RATING_LIMIT:
+            return self.table[value]
+        return self._walk(value)
+
+
+def _ladder(cfg: PlayBalanceConfig, prefix: str, levels: Sequence[str]) -> Ladder:
+    """Build a :class:`Ladder` from ``<prefix><level>Thresh/Adjust`` entries."""
+
+    return Ladder(
+        [cfg.get(f"{prefix}{level}Thresh", 0) for level in levels[:-1]],
+        [cfg.get(f"{prefix}{level}Adjust", 0) for level in levels],
+    )
+
+
+def _rating_table(fn) -> Tuple[float, ...]:
+    return tuple(fn(value) for value in range(RATING_LIMIT))
+
+
+class StealTables:
+    """Lookups used by :meth:`OffensiveManager.calculate_steal_chance`."""
+
+    def __init__(self, cfg: PlayBalanceConfig) -> None:
+        self.base = cfg.get("offManStealChancePct", 0)
+        self.count: Dict[Tuple[int, int], float] = {
+            (b, s): cfg.get(f"stealChance{b}{s}Count", 0) for b, s in _COUNTS
+        }
+        self.speed = _ladder(
+            cfg, "stealChance", ["VerySlow", "Slow", "Med", "Fast", "VeryFast"]
+        )
+        self.hold = Ladder(
+            [
+                cfg.get(f"stealChance{level}HoldThresh", 0)
+                for level in ["VeryLow", "Low", "Med", "High"]
+            ],
+            [
+                cfg.get(f"stealChance{level}HoldAdjust", 0)
+                for level in ["VeryLow", "Low", "Med", "High", "VeryHigh"]
+            ],
+        )
+        # Indexed by ``pitcher_is_left``.
+        self.hand = (
+            cfg.get("stealChancePitcherBackAdjust", 0),
+            cfg.get("stealChancePitcherFaceAdjust", 0),
+        )
+        self.windup = cfg.get("stealChancePitcherWindupAdjust", 0)
+        self.wild = cfg.get("stealChancePitcherWildAdjust", 0)
+
+        # Runner on first: indexed by ``outs == 2`` then batter CH.
+        self.first_thresholds: List[Tuple[float, float, float, float]] = []
+        self.first: List[Tuple[float, ...]] = []
+        for key in ("01Out", "2Out"):
+            high_t = cfg.get(f"stealChanceOnFirst{key}HighCHThresh", 0)
+            high_a = cfg.get(f"stealChanceOnFirst{key}HighCHAdjust", 0)
+            low_t = cfg.get(f"stealChanceOnFirst{key}LowCHThresh", 0)
+            low_a = cfg.get(f"stealChanceOnFirst{key}LowCHAdjust", 0)
+            self.first_thresholds.append((high_t, high_a, low_t, low_a))
+            self.first.append(
+                _rating_table(
+                    lambda ch, ht=high_t, ha=high_a, lt=low_t, la=low_a: (
+                        (ha if ch >= ht else 0) + (la if ch <= lt else 0)
+                    )
+                )
+            )
+
+        # Runner on second: indexed by outs (two or more share an entry).
+        self.second_outs = tuple(
+            cfg.get(f"stealChanceOnSecond{outs}OutAdjust", 0) for outs in range(3)
+        )
+        self.second_high_thresh = cfg.get("stealChanceOnSecondHighCHThresh", 0)
+        self.second_high_adjust = cfg.get("stealChanceOnSecondHighCHAdjust", 0)
+
+        self.way_behind_thresh = cfg.get("stealChanceWayBehindThresh", -9999)
+        self.way_behind_adjust = cfg.get("stealChanceWayBehindAdjust", 0)
+
+    def count_adjust(self, balls: int, strikes: int) -> float:
+        adjust = self.count.get((balls, strikes))
+        if adjust is None:
+            return 0
+        return adjust
+
+    def first_adjust(self, outs: int, batter_ch: int) -> float:
+        two_out = outs == 2
+        if batter_ch.__class__ is int and 0 <= batter_ch < RATING_LIMIT:
+            return self.first[two_out][batter_ch]
+        high_t, high_a, low_t, low_a = self.first_thresholds[two_out]
+        adjust = 0
+        if batter_ch >= high_t:
+            adjust += high_a
+        if batter_ch <= low_t:
+            adjust += low_a
+        return adjust
+
+
+class HitAndRunTables:
+    """Lookups used by :meth:`OffensiveManager.hit_and_run_chance`."""
+
+    def __init__(self, cfg: PlayBalanceConfig) -> None:
+        self.base = cfg.get("hnrChanceBase", 0)
+        three_behind = cfg.get("hnrChance3MoreBehindAdjust", 0)
+        two_behind = cfg.get("hnrChance2BehindAdjust", 0)
+        one_ahead = cfg.get("hnrChance1AheadAdjust", 0)
+        two_ahead = cfg.get("hnrChance2MoreAheadAdjust", 0)
+        # Indexed by ``run_diff`` clamped to ``-3..2`` (offset by three).
+        self.run_diff = (three_behind, two_behind, 0, 0, one_ahead, two_ahead)
+        self.on_12 = cfg.get("hnrChanceOn12Adjust", 0)
+        self.wild = cfg.get("hnrChancePitcherWildAdjust", 0)
+        self.three_balls = cfg.get("hnrChance3BallsAdjust", 0)
+        self.two_strikes = cfg.get("hnrChance2StrikesAdjust", 0)
+        self.even_count = cfg.get("hnrChanceEvenCountAdjust", 0)
+        self.count_01 = cfg.get("hnrChance01CountAdjust", 0)
+        self.count = {(b, s): self._count_walk(b, s) for b, s in _COUNTS}
+        self.speed = _ladder(cfg, "hnrChance", ["SlowSP", "MedSP", "FastSP", "VeryFastSP"])
+        self.contact = _ladder(cfg, "hnrChance", ["LowCH", "MedCH", "HighCH", "VeryHighCH"])
+        self.power = _ladder(cfg, "hnrChance", ["LowPH", "MedPH", "HighPH", "VeryHighPH"])
+        self.pct = cfg.get("offManHNRChancePct", 100) / 100.0
+
+    def _count_walk(self, balls: int, strikes: int) -> float:
+        adjust = 0
+        if balls == 3:
+            adjust += self.three_balls
+        if strikes == 2:
+            adjust += self.two_strikes
+        if balls == strikes:
+            adjust += self.even_count
+        if balls == 0 and strikes == 1:
+            adjust += self.count_01
+        return adjust
+
+    def count_adjust(self, balls: int, strikes: int) -> float:
+        adjust = self.count.get((balls, strikes))
+        if adjust is None:
+            return self._count_walk(balls, strikes)
+        return adjust
+
+    def run_diff_adjust(self, run_diff: int) -> float:
+        return self.run_diff[min(max(run_diff, -3), 2) + 3]
+
+
+class SacrificeTables:
+    """Constants used by :meth:`OffensiveManager.sacrifice_bunt_chance`."""
+
+    def __init__(self, cfg: PlayBalanceConfig) -> None:
+        self.max_ch = cfg.get("sacChanceMaxCH", 1000)
+        self.max_ph = cfg.get("sacChanceMaxPH", 1000)
+        self.base = cfg.get("sacChanceBase", 0)
+        self.pitcher = cfg.get("sacChancePitcherAdjust", 0)
+        self.one_out = cfg.get("sacChance1OutAdjust", 0)
+        self.close_late = cfg.get("sacChanceCLAdjust", 0)
+        self.close_late_on_12 = cfg.get("sacChanceCL0OutOn12Adjust", 0)
+        self.cl_low_ch = cfg.get("sacChanceCLLowCHThresh", 0)
+        self.cl_low_ph = cfg.get("sacChanceCLLowPHThresh", 0)
+        self.cl_low_adjust = cfg.get("sacChanceCLLowCHPHAdjust", 0)
+        self.pitcher_low_ch = cfg.get("sacChancePitcherLowCHThresh", 0)
+        self.pitcher_low_ph = cfg.get("sacChancePitcherLowPHThresh", 0)
+        self.pitcher_low_adjust = cfg.get("sacChancePitcherLowCHPHAdjust", 0)
+        self.pct = cfg.get("offManSacChancePct", 100) / 100.0
+
+
+class SqueezeTables:
+    """Constants used by :meth:`OffensiveManager.suicide_squeeze_chance`."""
+
+    def __init__(self, cfg: PlayBalanceConfig) -> None:
+        self.max_ch = cfg.get("squeezeChanceMaxCH", 1000)
+        self.max_ph = cfg.get("squeezeChanceMaxPH", 1000)
+        self.base = cfg.get("offManSqueezeChancePct", 0)
+        low = cfg.get("squeezeChanceLowCountAdjust", 0)
+        med = cfg.get("squeezeChanceMedCountAdjust", 0)
+        self.count = {(0, 0): low, (1, 0): low, (0, 1): low, (1, 1): med, (2, 0): med}
+        self.fast_thresh = cfg.get("squeezeChanceThirdFastSPThresh", 0)
+        self.fast_adjust = cfg.get("squeezeChanceThirdFastAdjust", 0)
+
+
+class DecisionTables:
+    """All compiled offensive decision lookups for one configuration."""
+
+    def __init__(self, cfg: PlayBalanceConfig) -> None:
+        self.steal = StealTables(cfg)
+        self.hit_and_run = HitAndRunTables(cfg)
+        self.sacrifice = SacrificeTables(cfg)
+        self.squeeze = SqueezeTables(cfg)
+
+
+def decision_tables(config: PlayBalanceConfig) -> DecisionTables:
+    """Return the compiled tables for ``config``, rebuilding after changes."""
+
+    return config.compiled("offensive_decisions", DecisionTables)
+
+
+__all__ = [
+    "DecisionTables",
+    "HitAndRunTables",
+    "Ladder",
+    "RATING_LIMIT",
+    "SacrificeTables",
+    "SqueezeTables",
+    "StealTables",
+    "decision_tables",
+]
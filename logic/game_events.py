@@ -0,0 +1,272 @@
+"""Structured strategy events emitted during a simulated game.
+
+:class:`~logic.simulation.GameSimulation` and
+:class:`~logic.substitution_manager.SubstitutionManager` report decisions as
+``(code, player_id, other_id)`` records instead of pre-formatted strings.
+Records go to a pluggable sink:
+
+``NullSink``
+    Discards everything.  Emitters check :attr:`EventSink.enabled` before
+    building a record so a disabled stream costs a single attribute test.
+``MemorySink``
+    Keeps the most recent records in a preallocated ring buffer.
+``FileSink``
+    Appends records to a tab separated text file.
+
+The human readable strategy log shown in the exhibition dialog is rendered
+on demand by :func:`render_events`.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO
+
+from models.player import Player
+
+
+class EventCode(IntEnum):
+    """Kinds of strategy events."""
+
+    PINCH_HIT = 1
+    PINCH_RUN = 2
+    DEFENSIVE_SUB = 3
+    DOUBLE_SWITCH = 4
+    PITCHING_CHANGE = 5
+    CHARGE_BUNT = 6
+    HOLD_RUNNER = 7
+    PICKOFF = 8
+    PITCH_OUT = 9
+    INTENTIONAL_WALK = 10
+    PITCH_AROUND = 11
+    HIT_AND_RUN = 12
+    SACRIFICE_BUNT = 13
+    SUICIDE_SQUEEZE = 14
+
+
+class GameEvent(NamedTuple):
+    """A single strategy event.
+
+    ``player_id`` is the player entering the game or acting (pinch hitter,
+    new pitcher, held runner) and ``other_id`` the player being replaced.
+    """
+
+    code: EventCode
+    player_id: Optional[str] = None
+    other_id: Optional[str] = None
+
+
+# Text templates for :func:`format_event`; ``{player}`` and ``{other}`` are
+# replaced by player names.
+_TEMPLATES: Dict[EventCode, str] = {
+    EventCode.PINCH_HIT: "Pinch hitter {player} for {other}",
+    EventCode.PINCH_RUN: "Pinch runner {player} for {other}",
+    EventCode.DEFENSIVE_SUB: "Defensive sub {player} for {other}",
+    EventCode.DOUBLE_SWITCH: "Double switch: {player} for {other}",
+    EventCode.PITCHING_CHANGE: "Pitching change: {player} enters",
+    EventCode.CHARGE_BUNT: "Defense charges bunt",
+    EventCode.HOLD_RUNNER: "Defense holds runner",
+    EventCode.PICKOFF: "Pickoff attempt",
+    EventCode.PITCH_OUT: "Pitch out",
+    EventCode.INTENTIONAL_WALK: "Intentional walk issued",
+    EventCode.PITCH_AROUND: "Pitch around",
+    EventCode.HIT_AND_RUN: "Hit and run",
+    EventCode.SACRIFICE_BUNT: "Sacrifice bunt",
+    EventCode.SUICIDE_SQUEEZE: "Suicide squeeze",
+}
+
+
+def _name(player: Optional[Player], fallback: Optional[str]) -> str:
+    if player is None:
+        return fallback or ""
+    return f"{player.first_name} {player.last_name}"
+
+
+def format_event(
+    code: EventCode,
+    player: Optional[Player] = None,
+    other: Optional[Player] = None,
+    *,
+    player_id: Optional[str] = None,
+    other_id: Optional[str] = None,
+) -> str:
+    """Return the strategy log line for ``code``.
+
+    Player names are taken from ``player``/``other``; when those are unknown
+    the raw ``player_id``/``other_id`` are shown instead.
+    """
+
+    return _TEMPLATES[code].format(
+        player=_name(player, player_id), other=_name(other, other_id)
+    )
+
+
+def render_events(
+    events: Iterable[GameEvent], players: Iterable[Player] = ()
+) -> List[str]:
+    """Render ``events`` as strategy log lines using names from ``players``."""
+
+    by_id = {p.player_id: p for p in players}
+    return [
+        format_event(
+            event.code,
+            by_id.get(event.player_id),
+            by_id.get(event.other_id),
+            player_id=event.player_id,
+            other_id=event.other_id,
+        )
+        for event in events
+    ]
+
+
+# ----------------------------------------------------------------------
+# Sinks
+# ----------------------------------------------------------------------
+class EventSink:
+    """Base class for event sinks.
+
+    Emitters must test :attr:`enabled` before calling :meth:`emit` so that
+    disabled sinks never see any work.
+    """
+
+    enabled = True
+
+    def emit(
+        self,
+        code: EventCode,
+        player_id: Optional[str] = None,
+        other_id: Optional[str] = None,
+    ) -> None:
+        raise NotImplementedError
+
+    def events(self) -> Iterator[GameEvent]:
+        """Yield the retained events, oldest first."""
+
+        return iter(())
+
+
+class NullSink(EventSink):
+    """Sink that drops every event."""
+
+    enabled = False
+
+    def emit(
+        self,
+        code: EventCode,
+        player_id: Optional[str] = None,
+        other_id: Optional[str] = None,
+    ) -> None:
+        pass
+
+
+class MemorySink(EventSink):
+    """Keep the last ``capacity`` events in a preallocated ring buffer.
+
+    Once full, the oldest events are overwritten; :attr:`dropped` counts how
+    many were lost.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._codes: List[Optional[EventCode]] = [None] * capacity
+        self._players: List[Optional[str]] = [None] * capacity
+        self._others: List[Optional[str]] = [None] * capacity
+        self._count = 0
+
+    def emit(
+        self,
+        code: EventCode,
+        player_id: Optional[str] = None,
+        other_id: Optional[str] = None,
+    ) -> None:
+        slot = self._count % self.capacity
+        self._codes[slot] = code
+        self._players[slot] = player_id
+        self._others[slot] = other_id
+        self._count += 1
+
+    @property
+    def dropped(self) -> int:
+        return max(0, self._count - self.capacity)
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def events(self) -> Iterator[GameEvent]:
+        start = self._count - len(self)
+        for seq in range(start, self._count):
+            slot = seq % self.capacity
+            yield GameEvent(self._codes[slot], self._players[slot], self._others[slot])
+
+    def clear(self) -> None:
+        self._count = 0
+
+
+class FileSink(EventSink):
+    """Append events to ``path`` as ``CODE<TAB>player_id<TAB>other_id`` lines.
+
+    The file is opened lazily on the first event and kept open until
+    :meth:`close` is called; existing content is never rewritten.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._fh: Optional[TextIO] = None
+
+    def emit(
+        self,
+        code: EventCode,
+        player_id: Optional[str] = None,
+        other_id: Optional[str] = None,
+    ) -> None:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.path.open("a", encoding="utf-8")
+        self._fh.write(f"{code.name}\t{player_id or ''}\t{other_id or ''}\n")
+
+    def events(self) -> Iterator[GameEvent]:
+        if self._fh is not None:
+            self._fh.flush()
+        return read_event_file(self.path)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> "FileSink":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def read_event_file(path: str | Path) -> Iterator[GameEvent]:
+    """Yield the events stored in a :class:`FileSink` file."""
+
+    path = Path(path)
+    if not path.exists():
+        return
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            code, player_id, other_id = line.split("\t")
+            yield GameEvent(EventCode[code], player_id or None, other_id or None)
+
+
+__all__ = [
+    "EventCode",
+    "EventSink",
+    "FileSink",
+    "GameEvent",
+    "MemorySink",
+    "NullSink",
+    "format_event",
+    "read_event_file",
+    "render_events",
+]
@@ -1,13 +1,29 @@
 import os
 import csv
+import random
 import shutil
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
 from models.player import Player
 from models.pitcher import Pitcher
 from utils.player_writer import save_players_to_csv
-from logic.player_generator import generate_player
+from logic.player_batch import assign_names, generate_players
+from logic.player_generator import NAME_STATE_FILE, reset_name_cache, save_name_state
+from logic.rng_streams import derive_seed
+from utils.id_allocator import IdBlock, get_id_allocator
 from utils.user_manager import clear_users
 
+# ``(level, pitchers, hitters, age_range, one hitter per field position)``
+ROSTER_LAYOUT = (
+    ("ACT", 11, 14, (21, 38), True),
+    ("AAA", 7, 8, (21, 38), False),
+    ("LOW", 5, 5, (18, 21), False),
+)
+FIELD_POSITIONS = ["C", "1B", "2B", "3B", "SS", "LF", "CF", "RF"]
+PLAYERS_PER_TEAM = sum(p + h for _, p, h, _, _ in ROSTER_LAYOUT)
+
 
 def _abbr(city: str, name: str, existing: set) -> str:
     base = (city[:1] + name[:2]).upper()
@@ -73,7 +89,57 @@ def _dict_to_model(data: dict):
         )
 
 
-def create_league(base_dir: str, divisions: Dict[str, List[Tuple[str, str]]], league_name: str):
+def generate_team_players(
+    seed: int, today: Optional[date] = None, ids: Optional[IdBlock] = None
+) -> Dict[str, List[Dict]]:
+    """Return one team's players by roster level, following ``ROSTER_LAYOUT``.
+
+    ``ids`` is a block of ``PLAYERS_PER_TEAM`` reserved ids handed out in
+    roster order.  The players have no names yet; see
+    :func:`logic.player_batch.assign_names`.
+    """
+
+    rng = random.Random(seed)
+    id_iter = iter(ids or ())
+    levels = {}
+    for level, pitchers, hitters, age_range, ensure_positions in ROSTER_LAYOUT:
+        players = generate_players(
+            pitchers, True, age_range, seed=rng.getrandbits(64), today=today, ids=id_iter
+        )
+        players += generate_players(
+            hitters,
+            False,
+            age_range,
+            FIELD_POSITIONS if ensure_positions else (),
+            seed=rng.getrandbits(64),
+            today=today,
+            ids=id_iter,
+        )
+        levels[level] = players
+    return levels
+
+
+def create_league(
+    base_dir: str,
+    divisions: Dict[str, List[Tuple[str, str]]],
+    league_name: str,
+    seed: Optional[int] = None,
+    workers: int = 1,
+):
+    """Write a new league with full ACT/AAA/LOW rosters to ``base_dir``.
+
+    Each team's players are generated in one batch seeded with
+    ``derive_seed(seed, team_id)``, so the ratings of a league do not depend
+    on ``workers``.  ``seed`` defaults to a draw from the global
+    :mod:`random` state.  With ``workers`` above one the teams are spread
+    over a process pool.  Player names are drawn from a name allocator
+    reset with ``seed``; its state is saved as ``NAME_STATE_FILE``.  Player
+    ids restart at ``P1000`` and are reserved a team at a time from the
+    league's :class:`~utils.id_allocator.PlayerIdAllocator`.  Both are
+    continued by ``generate_draft_pool(data_dir=base_dir)``, so draft
+    prospects never reuse the league's names or ids.
+    """
+
     os.makedirs(base_dir, exist_ok=True)
     rosters_dir = os.path.join(base_dir, "rosters")
     if os.path.exists(rosters_dir):
@@ -86,31 +152,15 @@ def create_league(base_dir: str, divisions: Dict[str, List[Tuple[str, str]]], le
     players_path = os.path.join(base_dir, "players.csv")
     league_path = os.path.join(base_dir, "league.txt")
 
+    if seed is None:
+        seed = random.getrandbits(64)
+    reset_name_cache(seed)
+    today = date.today()
+
     team_rows = []
     all_players = []
     existing_abbr = set()
 
-    def generate_roster(num_pitchers: int, num_hitters: int, age_range: Tuple[int, int], ensure_positions: bool = False):
-        players = []
-        for _ in range(num_pitchers):
-            data = generate_player(is_pitcher=True, age_range=age_range)
-            data["is_pitcher"] = True
-            players.append(data)
-        if ensure_positions:
-            positions = ["C", "1B", "2B", "3B", "SS", "LF", "CF", "RF"]
-            for pos in positions:
-                data = generate_player(is_pitcher=False, age_range=age_range, primary_position=pos)
-                data["is_pitcher"] = False
-                players.append(data)
-            remaining = num_hitters - len(positions)
-        else:
-            remaining = num_hitters
-        for _ in range(remaining):
-            data = generate_player(is_pitcher=False, age_range=age_range)
-            data["is_pitcher"] = False
-            players.append(data)
-        return players
-
     for division, teams in divisions.items():
         for city, name in teams:
             abbr = _abbr(city, name, existing_abbr)
@@ -126,24 +176,40 @@ def create_league(base_dir: str, divisions: Dict[str, List[Tuple[str, str]]], le
                 "owner_id": "",
             })
 
-            act_players = generate_roster(11, 14, (21, 38), ensure_positions=True)
-            aaa_players = generate_roster(7, 8, (21, 38))
-            low_players = generate_roster(5, 5, (18, 21))
-
-            roster_levels = {"ACT": act_players, "AAA": aaa_players, "LOW": low_players}
-
-            for level_players in roster_levels.values():
-                all_players.extend(level_players)
-
-            roster_file = os.path.join(rosters_dir, f"{abbr}.csv")
-            with open(roster_file, "w", newline="") as f:
-                writer = csv.writer(f)
-                for level, players in roster_levels.items():
-                    for p in players:
-                        writer.writerow([p["player_id"], level])
+    seeds = [derive_seed(seed, row["team_id"]) for row in team_rows]
+    id_allocator = get_id_allocator(base_dir)
+    id_allocator.reset()
+    blocks = [id_allocator.reserve(PLAYERS_PER_TEAM) for _ in seeds]
+    workers = min(workers, len(seeds)) or 1
+    if workers == 1:
+        rosters = [generate_team_players(s, today, b) for s, b in zip(seeds, blocks)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rosters = list(
+                pool.map(
+                    generate_team_players,
+                    seeds,
+                    repeat(today),
+                    blocks,
+                    chunksize=max(1, len(seeds) // (workers * 4)),
+                )
+            )
+
+    for row, roster_levels in zip(team_rows, rosters):
+        for level_players in roster_levels.values():
+            assign_names(level_players)
+            all_players.extend(level_players)
+
+        roster_file = os.path.join(rosters_dir, f"{row['team_id']}.csv")
+        with open(roster_file, "w", newline="") as f:
+            writer = csv.writer(f)
+            for level, players in roster_levels.items():
+                for p in players:
+                    writer.writerow([p["player_id"], level])
 
     player_models = [_dict_to_model(p) for p in all_players]
     save_players_to_csv(player_models, players_path)
+    save_name_state(os.path.join(base_dir, NAME_STATE_FILE))
 
     with open(teams_path, "w", newline="") as f:
         fieldnames = [
@@ -0,0 +1,440 @@
+"""Exact run expectancy and win probability for fixed lineups.
+
+Within a half-inning :meth:`GameSimulation.play_at_bat` only ever looks at
+the outs, the runners on base, the batter due up and, for the sacrifice bunt,
+whether the game is close and late.  With the lineup and pitcher fixed the
+at-bat is therefore a Markov chain whose transition probabilities come from
+the same formulas the simulation rolls against:
+:func:`~logic.simulation.hit_probability`, the chance calculations of
+:class:`~logic.offensive_manager.OffensiveManager` and
+:data:`~logic.simulation.STEAL_SUCCESS_PROB`.
+
+:class:`HalfInningModel` propagates probability mass through that chain to
+get the exact distribution of runs scored in an inning.  :class:`GameModel`
+chains half-innings together into a game win probability.  Both replace
+repeated simulation with a single deterministic computation.
+
+Substitutions and pitching changes are not modelled: the lineup bats in
+order for the whole game against one pitcher.  The pre-at-bat defensive
+checks are ignored as well because they do not affect the play in the
+simulation.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from models.player import Player
+from models.pitcher import Pitcher
+from .offensive_manager import OffensiveManager
+from .playbalance_config import PlayBalanceConfig
+from .simulation import STEAL_SUCCESS_PROB, hit_probability
+
+# Empty base marker; occupied bases hold the lineup slot of the runner.
+EMPTY = -1
+Bases = Tuple[int, int, int]
+NO_RUNNERS: Bases = (EMPTY, EMPTY, EMPTY)
+
+# Probability mass below this value is discarded while propagating.
+EPSILON = 1e-15
+
+# ``(probability, outs added, bases after, runs added)``
+_Transition = Tuple[float, int, Bases, int]
+
+
+def _pct(chance: float) -> float:
+    return max(0.0, min(100.0, chance)) / 100.0
+
+
+class HalfInningModel:
+    """Markov chain for ``lineup`` batting against ``pitcher``.
+
+    Parameters
+    ----------
+    lineup:
+        Batting order.  Runners on base are identified by their slot in
+        this list.
+    pitcher:
+        Pitcher on the mound for the whole inning.
+    config:
+        PlayBalance configuration supplying the decision chances.
+    """
+
+    def __init__(
+        self,
+        lineup: Sequence[Player],
+        pitcher: Pitcher,
+        config: PlayBalanceConfig,
+    ) -> None:
+        if not lineup:
+            raise ValueError("Lineup must contain at least one player")
+        self.lineup = list(lineup)
+        self.pitcher = pitcher
+        self.config = config
+        offense = OffensiveManager(config)
+
+        players = self.lineup
+        self.hit_p = [hit_probability(config, p.ph) for p in players]
+        # Post-hit steal attempt by the batter who just reached first.
+        self.steal_p = [
+            offense.calculate_steal_chance(
+                runner_sp=p.sp,
+                pitcher_hold=pitcher.hold_runner,
+                pitcher_is_left=pitcher.bats == "L",
+                batter_ch=p.ch,
+            )
+            for p in players
+        ]
+        self.hnr_p = [
+            [
+                _pct(
+                    offense.hit_and_run_chance(
+                        runner_sp=runner.sp, batter_ch=batter.ch, batter_ph=batter.ph
+                    )
+                )
+                for batter in players
+            ]
+            for runner in players
+        ]
+        # Indexed by ``[close_and_late][runner_on_second][slot]``.
+        self.sac_p = [
+            [
+                [
+                    _pct(
+                        offense.sacrifice_bunt_chance(
+                            batter_is_pitcher=batter.primary_position == "P",
+                            batter_ch=batter.ch,
+                            batter_ph=batter.ph,
+                            outs=0,
+                            inning=7 if close else 1,
+                            on_first=True,
+                            on_second=on_second,
+                            run_diff=0,
+                        )
+                    )
+                    for batter in players
+                ]
+                for on_second in (False, True)
+            ]
+            for close in (False, True)
+        ]
+        self.squeeze_p = [
+            [
+                _pct(
+                    offense.suicide_squeeze_chance(
+                        batter_ch=batter.ch,
+                        batter_ph=batter.ph,
+                        balls=0,
+                        strikes=0,
+                        runner_on_third_sp=runner.sp,
+                    )
+                )
+                for runner in players
+            ]
+            for batter in players
+        ]
+        # The score only matters if a close and late game changes a bunt.
+        self.close_late_matters = self.sac_p[True] != self.sac_p[False]
+
+        self._transitions: Dict[Tuple[int, Bases, bool], List[_Transition]] = {}
+        self._kernels: Dict[Tuple[int, bool, int], Dict[Tuple[int, int], float]] = {}
+
+    # ------------------------------------------------------------------
+    # Single at-bat
+    # ------------------------------------------------------------------
+    def transitions(self, slot: int, bases: Bases, close_late: bool) -> List[_Transition]:
+        """Return the outcomes of one at-bat by ``slot`` with ``bases``."""
+
+        key = (slot, bases, close_late)
+        cached = self._transitions.get(key)
+        if cached is None:
+            merged: Dict[Tuple[int, Bases, int], float] = defaultdict(float)
+            for p, outs, after, runs in self._at_bat(slot, bases, close_late):
+                if p > 0:
+                    merged[(outs, after, runs)] += p
+            cached = [(p, outs, after, runs) for (outs, after, runs), p in merged.items()]
+            self._transitions[key] = cached
+        return cached
+
+    def _at_bat(self, slot: int, bases: Bases, close_late: bool) -> List[_Transition]:
+        out: List[_Transition] = []
+        first, second, third = bases
+        if first == EMPTY:
+            self._squeeze_or_swing(out, slot, 1.0, 0, bases, 0)
+            return out
+
+        hnr = self.hnr_p[first][slot]
+        steal = hnr * STEAL_SUCCESS_PROB
+        # A successful steal puts the runner on second, an unsuccessful one
+        # removes him; either way the at-bat continues.
+        self._squeeze_or_swing(out, slot, steal, 0, (EMPTY, first, third), 0)
+        self._squeeze_or_swing(out, slot, hnr - steal, 1, (EMPTY, second, third), 0)
+
+        rest = 1.0 - hnr
+        sac = self.sac_p[close_late][second != EMPTY][slot]
+        out.append((rest * sac, 1, (EMPTY, first, second), int(third != EMPTY)))
+        self._squeeze_or_swing(out, slot, rest * (1.0 - sac), 0, bases, 0)
+        return out
+
+    def _squeeze_or_swing(
+        self,
+        out: List[_Transition],
+        slot: int,
+        p: float,
+        outs: int,
+        bases: Bases,
+        runs: int,
+    ) -> None:
+        if p <= 0:
+            return
+        first, second, third = bases
+        if third != EMPTY:
+            squeeze = self.squeeze_p[slot][third]
+            out.append((p * squeeze, outs + 1, (first, second, EMPTY), runs + 1))
+            p *= 1.0 - squeeze
+
+        hit = self.hit_p[slot]
+        out.append((p * (1.0 - hit), outs + 1, bases, runs))
+
+        scored = runs + int(third != EMPTY)
+        attempt = self.steal_p[slot]
+        p_hit = p * hit
+        out.append((p_hit * (1.0 - attempt), outs, (slot, first, second), scored))
+        # The batter's steal replaces whoever was pushed to second.
+        success = p_hit * attempt * STEAL_SUCCESS_PROB
+        out.append((success, outs, (EMPTY, slot, second), scored))
+        out.append((p_hit * attempt - success, outs + 1, (EMPTY, first, second), scored))
+
+    # ------------------------------------------------------------------
+    # Whole inning
+    # ------------------------------------------------------------------
+    def outcomes(
+        self,
+        slot: int = 0,
+        *,
+        outs: int = 0,
+        bases: Bases = NO_RUNNERS,
+        inning: int = 1,
+        run_diff: int = 0,
+    ) -> Dict[Tuple[int, int], float]:
+        """Return ``{(runs, next_slot): probability}`` for the rest of the inning.
+
+        ``slot`` is the batter due up, ``run_diff`` the offense's lead at that
+        point and ``next_slot`` the batter leading off the team's next inning.
+        """
+
+        size = len(self.lineup)
+        late = inning >= 7 and self.close_late_matters
+        result: Dict[Tuple[int, int], float] = defaultdict(float)
+        frontier: Dict[Tuple[int, Bases, int], float] = {(outs, bases, 0): 1.0}
+        step = 0
+        while frontier:
+            current = (slot + step) % size
+            following = (current + 1) % size
+            nxt: Dict[Tuple[int, Bases, int], float] = defaultdict(float)
+            for (o, b, r), p in frontier.items():
+                close = late and -1 <= run_diff + r <= 1
+                for q, add_outs, after, add_runs in self.transitions(current, b, close):
+                    mass = p * q
+                    if mass < EPSILON:
+                        continue
+                    total_outs = o + add_outs
+                    if total_outs >= 3:
+                        result[(r + add_runs, following)] += mass
+                    else:
+                        nxt[(total_outs, after, r + add_runs)] += mass
+            frontier = nxt
+            step += 1
+        return dict(result)
+
+    def kernel(self, slot: int, inning: int, run_diff: int) -> Dict[Tuple[int, int], float]:
+        """Cached :meth:`outcomes` for an inning started from scratch."""
+
+        late = inning >= 7 and self.close_late_matters and run_diff < 2
+        key = (slot, late, run_diff if late else 0)
+        cached = self._kernels.get(key)
+        if cached is None:
+            cached = self.outcomes(slot, inning=inning if late else 1, run_diff=run_diff)
+            self._kernels[key] = cached
+        return cached
+
+    def run_distribution(
+        self,
+        slot: int = 0,
+        *,
+        outs: int = 0,
+        bases: Bases = NO_RUNNERS,
+        inning: int = 1,
+        run_diff: int = 0,
+    ) -> List[float]:
+        """Return ``P(runs == k)`` for the rest of the inning."""
+
+        probs: List[float] = []
+        dist = self.outcomes(slot, outs=outs, bases=bases, inning=inning, run_diff=run_diff)
+        for (runs, _), p in dist.items():
+            if runs >= len(probs):
+                probs.extend([0.0] * (runs + 1 - len(probs)))
+            probs[runs] += p
+        return probs
+
+    def expected_runs(
+        self,
+        slot: int = 0,
+        *,
+        outs: int = 0,
+        bases: Bases = NO_RUNNERS,
+        inning: int = 1,
+        run_diff: int = 0,
+    ) -> float:
+        """Return the expected runs for the rest of the inning."""
+
+        probs = self.run_distribution(
+            slot, outs=outs, bases=bases, inning=inning, run_diff=run_diff
+        )
+        return sum(runs * p for runs, p in enumerate(probs))
+
+    def expected_game_runs(self, innings: int = 9, slot: int = 0) -> float:
+        """Return expected runs over ``innings`` innings with ``slot`` leading off.
+
+        Close and late bunting is ignored, so this depends on the lineup alone.
+        """
+
+        leadoff: Dict[int, float] = {slot: 1.0}
+        total = 0.0
+        for _ in range(innings):
+            nxt: Dict[int, float] = defaultdict(float)
+            for start, p in leadoff.items():
+                for (runs, after), q in self.kernel(start, 1, 0).items():
+                    total += p * q * runs
+                    nxt[after] += p * q
+            leadoff = nxt
+        return total
+
+    def run_expectancy_table(self, slot: int = 0) -> Dict[Tuple[int, Tuple[bool, bool, bool]], float]:
+        """Expected runs for each of the 24 base/out states with ``slot`` up.
+
+        Runners are taken to be the batters immediately ahead of ``slot`` in
+        the order: the one on first batted last, second before that and so on.
+        """
+
+        size = len(self.lineup)
+        table: Dict[Tuple[int, Tuple[bool, bool, bool]], float] = {}
+        for outs in range(3):
+            for mask in range(8):
+                occupied = tuple(bool(mask & (1 << base)) for base in range(3))
+                bases = tuple(
+                    (slot - 1 - base) % size if occupied[base] else EMPTY
+                    for base in range(3)
+                )
+                table[(outs, occupied)] = self.expected_runs(
+                    slot, outs=outs, bases=bases  # type: ignore[arg-type]
+                )
+        return table
+
+
+@dataclass(frozen=True)
+class WinProbability:
+    """Exact probabilities of each final result."""
+
+    home: float
+    away: float
+    tie: float
+
+
+class GameModel:
+    """Chain :class:`HalfInningModel` innings into game win probabilities.
+
+    Like :meth:`GameSimulation.simulate_game`, every game lasts exactly
+    ``innings`` innings with both halves played, so ties are possible.
+    """
+
+    def __init__(
+        self,
+        home_lineup: Sequence[Player],
+        home_pitcher: Pitcher,
+        away_lineup: Sequence[Player],
+        away_pitcher: Pitcher,
+        config: PlayBalanceConfig,
+        innings: int = 9,
+    ) -> None:
+        self.home = HalfInningModel(home_lineup, away_pitcher, config)
+        self.away = HalfInningModel(away_lineup, home_pitcher, config)
+        self.innings = innings
+
+    def score_distribution(
+        self,
+        *,
+        inning: int = 1,
+        top: bool = True,
+        outs: int = 0,
+        bases: Bases = NO_RUNNERS,
+        home_runs: int = 0,
+        away_runs: int = 0,
+        home_slot: int = 0,
+        away_slot: int = 0,
+    ) -> Dict[int, float]:
+        """Return ``{home_runs - away_runs: probability}`` at the final out.
+
+        The keyword arguments describe the current game state; ``outs`` and
+        ``bases`` refer to the half-inning in progress.
+        """
+
+        # State: (away slot due up, home slot due up, home lead)
+        states: Dict[Tuple[int, int, int], float] = {
+            (away_slot, home_slot, home_runs - away_runs): 1.0
+        }
+        in_progress = True
+        for inn in range(inning, self.innings + 1):
+            for is_top in (True, False):
+                if inn == inning and is_top and not top:
+                    continue
+                model = self.away if is_top else self.home
+                # Runs scored by the away team lower the home lead.
+                sign = -1 if is_top else 1
+                nxt: Dict[Tuple[int, int, int], float] = defaultdict(float)
+                for (a_slot, h_slot, diff), p in states.items():
+                    slot = a_slot if is_top else h_slot
+                    if in_progress:
+                        dist = model.outcomes(
+                            slot, outs=outs, bases=bases, inning=inn, run_diff=sign * diff
+                        ).items()
+                    else:
+                        dist = model.kernel(slot, inn, sign * diff).items()
+                    for (runs, after), q in dist:
+                        mass = p * q
+                        if mass < EPSILON:
+                            continue
+                        if is_top:
+                            nxt[(after, h_slot, diff - runs)] += mass
+                        else:
+                            nxt[(a_slot, after, diff + runs)] += mass
+                states = nxt
+                in_progress = False
+
+        final: Dict[int, float] = defaultdict(float)
+        for (_, _, diff), p in states.items():
+            final[diff] += p
+        return dict(final)
+
+    def win_probability(self, **state: object) -> WinProbability:
+        """Return the exact :class:`WinProbability` from ``state``.
+
+        ``state`` accepts the same keywords as :meth:`score_distribution`.
+        """
+
+        final = self.score_distribution(**state)  # type: ignore[arg-type]
+        home = sum(p for diff, p in final.items() if diff > 0)
+        away = sum(p for diff, p in final.items() if diff < 0)
+        tie = final.get(0, 0.0)
+        return WinProbability(home=home, away=away, tie=tie)
+
+
+__all__ = [
+    "EMPTY",
+    "GameModel",
+    "HalfInningModel",
+    "NO_RUNNERS",
+    "WinProbability",
+]
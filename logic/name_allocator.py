@@ -0,0 +1,323 @@
+"""Unique player names handed out in O(1) from pre-shuffled pools.
+
+:class:`NameAllocator` draws names for generated players without repeats.
+Every ethnicity pool of ``data/names.csv`` is shuffled once from the
+allocator's seed and then read in order, so a draw is a cursor increment
+instead of a retry loop over a growing set of used names.  Once the pools
+are exhausted the allocator falls back to :class:`CombinedNames`, which
+walks every pairing of ``logic/FirstNames.txt`` and ``logic/Surnames.txt``
+(about 100 million names) in a keyed pseudo-random order without building
+the list.
+
+Because the shuffles are derived from the seed, the allocator's state is a
+handful of cursors.  :meth:`NameAllocator.snapshot` returns it as a JSON
+friendly dict, and :meth:`NameAllocator.restore` continues from it with no
+name handed out twice, e.g. when generating a draft pool for a league saved
+earlier.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import random
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .rng_streams import derive_seed
+
+Name = Tuple[str, str]
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+NAMES_CSV = os.path.join(BASE_DIR, "..", "data", "names.csv")
+FIRST_NAMES_TXT = os.path.join(BASE_DIR, "FirstNames.txt")
+SURNAMES_TXT = os.path.join(BASE_DIR, "Surnames.txt")
+
+FALLBACK_NAME: Name = ("John", "Doe")
+SNAPSHOT_VERSION = 1
+
+
+def load_name_csv(path: str = NAMES_CSV) -> Dict[str, List[Name]]:
+    """Return ``ethnicity -> [(first, last), ...]`` from ``path``."""
+
+    pool: Dict[str, List[Name]] = {}
+    if os.path.exists(path):
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                pool.setdefault(row["ethnicity"], []).append(
+                    (row["first_name"], row["last_name"])
+                )
+    return pool
+
+
+def load_name_list(path: str) -> List[str]:
+    """Return the names of a census list such as ``FirstNames.txt``.
+
+    Each line starts with an upper-case name followed by frequency columns;
+    names are returned capitalised (``"JAMES"`` becomes ``"James"``).
+    """
+
+    names = []
+    with open(path, "r") as f:
+        for line in f:
+            parts = line.split()
+            if parts:
+                names.append(parts[0].capitalize())
+    return names
+
+
+# ----------------------------------------------------------------------
+# Pools
+# ----------------------------------------------------------------------
+class ShuffledNames:
+    """A list of names read in an order shuffled once from ``seed``."""
+
+    def __init__(self, names: Sequence[Name], seed: int) -> None:
+        self._names = list(names)
+        random.Random(seed).shuffle(self._names)
+        self.cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def remaining(self) -> int:
+        return len(self._names) - self.cursor
+
+    def take(self) -> Optional[Name]:
+        """Return the next name, or ``None`` when the pool is used up."""
+
+        if self.cursor >= len(self._names):
+            return None
+        name = self._names[self.cursor]
+        self.cursor += 1
+        return name
+
+    def taken(self) -> List[Name]:
+        """Return the names handed out so far."""
+
+        return self._names[: self.cursor]
+
+
+class CombinedNames:
+    """Every ``first × last`` pairing, in a seeded pseudo-random order.
+
+    Position ``i`` of the order is mapped to a pairing by a keyed Feistel
+    permutation of ``range(len(first) * len(last))``, so no list of pairs is
+    built and each draw costs a few hashes.  The name lists are read on
+    first use.
+    """
+
+    ROUNDS = 4
+
+    def __init__(
+        self,
+        seed: int,
+        first_path: str = FIRST_NAMES_TXT,
+        last_path: str = SURNAMES_TXT,
+    ) -> None:
+        self.first_path = first_path
+        self.last_path = last_path
+        self.cursor = 0
+        rng = random.Random(seed)
+        self._keys = [rng.getrandbits(64).to_bytes(8, "big") for _ in range(self.ROUNDS)]
+        self._first: Optional[List[str]] = None
+        self._last: List[str] = []
+
+    def _load(self) -> None:
+        if self._first is not None:
+            return
+        self._first = load_name_list(self.first_path)
+        self._last = load_name_list(self.last_path)
+        size = len(self._first) * len(self._last)
+        self._half = max(1, (size.bit_length() + 1) // 2)
+        self._mask = (1 << self._half) - 1
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._first) * len(self._last)
+
+    def remaining(self) -> int:
+        return len(self) - self.cursor
+
+    def _round(self, value: int, key: bytes) -> int:
+        digest = hashlib.blake2b(value.to_bytes(8, "big"), digest_size=8, key=key).digest()
+        return int.from_bytes(digest, "big") & self._mask
+
+    def _permute(self, index: int) -> int:
+        size = len(self)
+        value = index
+        # Cycle-walk: the Feistel network permutes a power-of-two domain at
+        # most four times larger than ``size``.
+        while True:
+            left, right = value >> self._half, value & self._mask
+            for key in self._keys:
+                left, right = right, left ^ self._round(right, key)
+            value = (left << self._half) | right
+            if value < size:
+                return value
+
+    def pair(self, index: int) -> Name:
+        """Return the name at position ``index`` of the order."""
+
+        first, last = divmod(self._permute(index), len(self._last))
+        return self._first[first], self._last[last]
+
+    def take(self) -> Optional[Name]:
+        if self.cursor >= len(self):
+            return None
+        name = self.pair(self.cursor)
+        self.cursor += 1
+        return name
+
+    def taken(self) -> List[Name]:
+        return [self.pair(i) for i in range(self.cursor)]
+
+
+# ----------------------------------------------------------------------
+# Allocator
+# ----------------------------------------------------------------------
+class NameAllocator:
+    """Hand out unique names from ethnicity pools, then a combined pool.
+
+    Parameters
+    ----------
+    pools:
+        ``ethnicity -> names``; defaults to :func:`load_name_csv`.
+    seed:
+        Seed of the shuffles and of the ethnicity draws.  ``None`` draws one
+        from the global :mod:`random` state.
+    fallback:
+        Use :class:`CombinedNames` once the pools are exhausted.  When
+        false, or when it is exhausted too, :data:`FALLBACK_NAME` is
+        returned.
+    """
+
+    def __init__(
+        self,
+        pools: Optional[Dict[str, Sequence[Name]]] = None,
+        seed: Optional[int] = None,
+        fallback: bool = True,
+    ) -> None:
+        if pools is None:
+            pools = load_name_csv()
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._names = {key: list(names) for key, names in pools.items()}
+        self._use_fallback = fallback
+        self._reseed(seed)
+
+    def _reseed(self, seed: int) -> None:
+        self.seed = seed
+        self._pools = {
+            key: ShuffledNames(names, derive_seed(seed, key)) for key, names in self._names.items()
+        }
+        self._fallback = (
+            CombinedNames(derive_seed(seed, "combined")) if self._use_fallback else None
+        )
+        self._rng = random.Random(derive_seed(seed, "ethnicity"))
+        self._reserved: Set[Name] = set()
+        self._used: Set[Name] = set()
+        self._live: List[str] = [key for key, pool in self._pools.items() if len(pool)]
+
+    def reserve(self, names: Sequence[Name]) -> None:
+        """Mark ``names`` as taken, e.g. those of players already in a league."""
+
+        for name in names:
+            name = tuple(name)
+            self._reserved.add(name)
+            self._used.add(name)
+
+    def _take_live(self) -> Optional[Name]:
+        while self._live:
+            i = self._rng.randrange(len(self._live))
+            name = self._pools[self._live[i]].take()
+            if name is None:
+                # Drop the exhausted ethnicity in O(1).
+                self._live[i] = self._live[-1]
+                self._live.pop()
+                continue
+            return name
+        return None
+
+    def allocate(self) -> Name:
+        """Return a name not handed out or reserved before."""
+
+        while True:
+            name = self._take_live()
+            if name is None and self._fallback is not None:
+                name = self._fallback.take()
+            if name is None:
+                return FALLBACK_NAME
+            if name not in self._used:
+                self._used.add(name)
+                return name
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, object]:
+        """Return the allocator state as a JSON serialisable dict."""
+
+        version, internal, gauss = self._rng.getstate()
+        return {
+            "version": SNAPSHOT_VERSION,
+            "seed": self.seed,
+            "cursors": {key: pool.cursor for key, pool in self._pools.items()},
+            "sizes": {key: len(pool) for key, pool in self._pools.items()},
+            "fallback": None if self._fallback is None else self._fallback.cursor,
+            "live": list(self._live),
+            "rng": [version, list(internal), gauss],
+            "reserved": sorted(list(n) for n in self._reserved),
+        }
+
+    def restore(self, snapshot: Dict[str, object]) -> "NameAllocator":
+        """Continue from ``snapshot``, taken from an allocator over the same pools.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot is from another version or the pools differ.
+        """
+
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError("Unsupported name allocator snapshot")
+        sizes = {key: len(pool) for key, pool in self._pools.items()}
+        if snapshot["sizes"] != sizes:
+            raise ValueError("Name allocator snapshot does not match the name pools")
+        self._reseed(snapshot["seed"])
+        self.reserve([tuple(n) for n in snapshot["reserved"]])
+        for key, pool in self._pools.items():
+            pool.cursor = snapshot["cursors"][key]
+            self._used.update(pool.taken())
+        if self._fallback is not None and snapshot["fallback"]:
+            self._fallback.cursor = snapshot["fallback"]
+            self._used.update(self._fallback.taken())
+        self._live = list(snapshot["live"])
+        version, internal, gauss = snapshot["rng"]
+        self._rng.setstate((version, tuple(internal), gauss))
+        return self
+
+    def save(self, path: str) -> None:
+        """Write :meth:`snapshot` to ``path``."""
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as fh:
+            json.dump(self.snapshot(), fh)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> "NameAllocator":
+        """Restore the snapshot stored at ``path``."""
+
+        with open(path, "r") as fh:
+            return self.restore(json.load(fh))
+
+
+__all__ = [
+    "CombinedNames",
+    "FALLBACK_NAME",
+    "NameAllocator",
+    "ShuffledNames",
+    "load_name_csv",
+    "load_name_list",
+]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, TypeVar
 
 from .pbini_loader import load_pbini
 
@@ -143,6 +143,56 @@ _DEFAULTS: Dict[str, Any] = {
 }
 
 
+T = TypeVar("T")
+
+
+class _VersionedDict(dict):
+    """``dict`` that counts mutations so derived data can be invalidated.
+
+    Tests and tools tweak configuration entries in place through
+    ``config.values``; bumping :attr:`version` on every write lets compiled
+    lookup tables notice those edits without comparing the whole mapping.
+    """
+
+    version = 0
+
+    def _touch(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    def __ior__(self, other: Any) -> "_VersionedDict":
+        super().__ior__(other)
+        self._touch()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._touch()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._touch()
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        self._touch()
+        return super().pop(*args)
+
+    def popitem(self) -> Any:
+        self._touch()
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+
 @dataclass
 class PlayBalanceConfig:
     """Container providing convenient access to ``PlayBalance`` entries.
@@ -155,6 +205,9 @@ class PlayBalanceConfig:
 
     values: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        self.values = self.values
+
     # ------------------------------------------------------------------
     # Construction helpers
     # ------------------------------------------------------------------
@@ -189,13 +242,45 @@ class PlayBalanceConfig:
         return self.values.get(key, default)
 
     def __getattr__(self, item: str) -> Any:  # pragma: no cover - simple delegation
+        # ``values`` is missing only while unpickling; dunder lookups such as
+        # ``__setstate__`` must fail normally instead of becoming config keys.
+        if item == "values" or (item.startswith("__") and item.endswith("__")):
+            raise AttributeError(item)
         return self.values.get(item, _DEFAULTS.get(item, 0))
 
     def __setattr__(self, key: str, value: Any) -> None:  # pragma: no cover - simple
         if key == "values":
+            if not isinstance(value, _VersionedDict):
+                value = _VersionedDict(value)
             super().__setattr__(key, value)
         else:
             self.values[key] = value
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled tables are rebuilt on demand, so only the entries travel
+        # to worker processes.
+        return {"values": dict(self.values)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.values = state["values"]
+
+    # ------------------------------------------------------------------
+    # Derived data
+    # ------------------------------------------------------------------
+    def compiled(self, name: str, builder: Callable[["PlayBalanceConfig"], T]) -> T:
+        """Return ``builder(self)`` cached under ``name``.
+
+        The cached value is rebuilt automatically once any configuration
+        entry changes, including edits made directly through ``values``.
+        """
+
+        values = self.values
+        cache = values.__dict__.setdefault("_compiled", {})
+        entry = cache.get(name)
+        if entry is None or entry[0] != values.version:
+            entry = (values.version, builder(self))
+            cache[name] = entry
+        return entry[1]
+
 
 __all__ = ["PlayBalanceConfig"]
@@ -0,0 +1,353 @@
+"""Generate many players at once with column-wise random draws.
+
+:func:`~logic.player_generator.generate_player` builds one player at a time
+from a few dozen scalar ``random`` calls.  :func:`generate_players` builds
+``count`` players of one kind together: ages, measurements, every rating and
+every potential are drawn as whole columns, and handedness, positions,
+delivery and repertoire are sampled for all players in one call each.  The
+distributions are the ones used by :func:`bounded_rating`,
+:func:`bounded_potential`, :func:`assign_bats_throws`,
+:func:`assign_secondary_positions` and :func:`generate_pitches`, and the
+returned dictionaries have the same keys as :func:`generate_player`'s.
+
+Draws come from a generator seeded with ``seed`` rather than the global
+:mod:`random` state, so a batch can be reproduced on any worker process.
+Ids are taken from a block reserved up front (see
+:mod:`utils.id_allocator`).  Names must be unique across a whole league and
+are therefore left empty; :func:`assign_names` fills them in once the
+batches are collected.
+
+NumPy is optional.  Without it the same columns are drawn with
+:class:`random.Random`, which is slower and yields different (equally
+distributed) players for a given seed.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+from . import player_generator as pg
+
+MIN_RATING = 10
+MAX_RATING = 99
+
+PITCHER_RATINGS = ("endurance", "arm", "fa", "control", "movement", "hold_runner")
+HITTER_RATINGS = ("ch", "ph", "sp", "gf", "pl", "vl", "sc", "fa", "arm")
+PITCHER_POTENTIALS = ("control", "movement", "endurance", "hold_runner", "arm", "fa")
+HITTER_POTENTIALS = ("ch", "ph", "sp", "fa", "arm")
+
+# Potential offsets by age, as in ``bounded_potential``: ``(max_age, low, high)``.
+_POTENTIAL_OFFSETS = ((22, 10, 30), (28, 5, 15), (32, -5, 5), (None, -10, 0))
+
+_DELIVERIES = ("overhand", "sidearm")
+_DELIVERY_WEIGHTS = (95, 5)
+
+
+# ----------------------------------------------------------------------
+# Column draws
+# ----------------------------------------------------------------------
+class _Columns:
+    """Draw whole columns from NumPy when available, else :mod:`random`."""
+
+    def __init__(self, seed: Optional[int]) -> None:
+        if np is not None:
+            self._np = np.random.default_rng(seed)
+        else:  # pragma: no cover - exercised only without numpy
+            self._np = None
+            self._py = random.Random(seed)
+
+    def integers(self, low, high, size: int) -> List[int]:
+        """Uniform integers in ``[low, high]``; bounds may be per-row lists."""
+
+        if self._np is not None:
+            return self._np.integers(low, np.asarray(high) + 1, size).tolist()
+        lows = low if isinstance(low, list) else [low] * size
+        highs = high if isinstance(high, list) else [high] * size
+        return [self._py.randint(lo, hi) for lo, hi in zip(lows, highs)]
+
+    def block(self, low, high, count: int, width: int) -> List[List[int]]:
+        """Return ``width`` columns of :meth:`integers` drawn in one call."""
+
+        if self._np is not None:
+            low = np.asarray(low).reshape(-1, 1)
+            high = np.asarray(high).reshape(-1, 1) + 1
+            return self._np.integers(low, high, (count, width)).T.tolist()
+        return [self.integers(low, high, count) for _ in range(width)]
+
+    def choice(self, options: Sequence, weights: Sequence[float], size: int) -> List:
+        """Weighted draws with replacement from ``options``."""
+
+        if self._np is not None:
+            p = np.asarray(weights, dtype=float)
+            picks = self._np.choice(len(options), size=size, p=p / p.sum())
+            return [options[i] for i in picks.tolist()]
+        return self._py.choices(options, weights=weights, k=size)
+
+    def ordering(self, weights: List[List[float]]) -> List[List[int]]:
+        """Return, per row, column indices in weighted random order.
+
+        The first ``k`` indices of a row are a weighted sample without
+        replacement of ``k`` columns, matching repeated
+        :func:`~logic.player_generator._weighted_choice` draws that remove
+        each pick.  Zero-weight columns come last.
+        """
+
+        if self._np is not None:
+            w = np.asarray(weights, dtype=float)
+            u = self._np.random(w.shape)
+            with np.errstate(divide="ignore"):
+                keys = np.where(w > 0, np.log(u) / w, -np.inf)
+            return np.argsort(-keys, axis=1, kind="stable").tolist()
+        result = []
+        for row in weights:
+            keys = [
+                (self._py.random() ** (1.0 / w) if w > 0 else -1.0, i)
+                for i, w in enumerate(row)
+            ]
+            result.append([i for _, i in sorted(keys, key=lambda k: -k[0])])
+        return result
+
+
+def _potential_bounds(ages: List[int]) -> Tuple[List[int], List[int]]:
+    """Return the per-player potential offset range for ``ages``."""
+
+    lows, highs = [], []
+    for age in ages:
+        for max_age, low, high in _POTENTIAL_OFFSETS:
+            if max_age is None or age < max_age:
+                lows.append(low)
+                highs.append(high)
+                break
+    return lows, highs
+
+
+def _potentials(
+    cols: _Columns, actual: List[List[int]], bounds: Tuple[List[int], List[int]]
+) -> List[List[int]]:
+    """Vectorised :func:`~logic.player_generator.bounded_potential`.
+
+    ``actual`` is a list of rating columns; one potential column is
+    returned for each.
+    """
+
+    offsets = cols.block(bounds[0], bounds[1], len(bounds[0]), len(actual))
+    return [
+        [max(MIN_RATING, min(MAX_RATING, a + o)) for a, o in zip(column, extra)]
+        for column, extra in zip(actual, offsets)
+    ]
+
+
+def _secondary_positions(cols: _Columns, primaries: List[str]) -> List[List[str]]:
+    """Vectorised :func:`~logic.player_generator.assign_secondary_positions`."""
+
+    result: List[List[str]] = [[] for _ in primaries]
+    rolls = cols.integers(1, 100, len(primaries))
+    by_primary: Dict[str, List[int]] = {}
+    for i, (primary, roll) in enumerate(zip(primaries, rolls)):
+        info = pg.SECONDARY_POSITIONS.get(primary)
+        if info and roll <= info["chance"]:
+            by_primary.setdefault(primary, []).append(i)
+    for primary, rows in by_primary.items():
+        weights = pg.SECONDARY_POSITIONS[primary]["weights"]
+        picks = cols.choice(list(weights), list(weights.values()), len(rows))
+        for i, pos in zip(rows, picks):
+            result[i] = [pos]
+    return result
+
+
+def _bats_throws(cols: _Columns, primaries: List[str]) -> List[Tuple[str, str]]:
+    """Vectorised :func:`~logic.player_generator.assign_bats_throws`."""
+
+    result: List[Tuple[str, str]] = [("R", "R")] * len(primaries)
+    by_primary: Dict[str, List[int]] = {}
+    for i, primary in enumerate(primaries):
+        by_primary.setdefault(primary, []).append(i)
+    for primary, rows in by_primary.items():
+        combos = pg.BATS_THROWS.get(primary, pg.BATS_THROWS["1B"])
+        picks = cols.choice(
+            [(b, t) for b, t, _ in combos], [c[2] for c in combos], len(rows)
+        )
+        for i, pick in zip(rows, picks):
+            result[i] = pick
+    return result
+
+
+def _birthdates(
+    cols: _Columns, count: int, age_range: Tuple[int, int], today: date
+) -> Tuple[List[date], List[int]]:
+    """Vectorised :func:`~logic.player_generator.generate_birthdate`."""
+
+    ages = cols.integers(age_range[0], age_range[1], count)
+    extra = cols.integers(0, 364, count)
+    births = [today - timedelta(days=a * 365 + d) for a, d in zip(ages, extra)]
+    return births, ages
+
+
+# ----------------------------------------------------------------------
+# Batches
+# ----------------------------------------------------------------------
+def _pitch_columns(
+    cols: _Columns,
+    throws: List[str],
+    deliveries: List[str],
+    bounds: Tuple[List[int], List[int]],
+) -> Dict[str, List[int]]:
+    """Vectorised :func:`~logic.player_generator.generate_pitches`."""
+
+    count = len(throws)
+    extra = [p for p in pg.PITCH_LIST if p != "fb"]
+    weights = [
+        [pg.PITCH_WEIGHTS[(t, d)][p] for p in extra] for t, d in zip(throws, deliveries)
+    ]
+    num_pitches = cols.integers(2, 5, count)
+    orders = cols.ordering(weights)
+    selected = [
+        {"fb"} | {extra[i] for i in order[: n - 1]}
+        for order, n in zip(orders, num_pitches)
+    ]
+
+    ratings = cols.block(MIN_RATING, MAX_RATING, count, len(pg.PITCH_LIST))
+    pots = _potentials(cols, ratings, bounds)
+    columns: Dict[str, List[int]] = {}
+    for pitch, rating, pot in zip(pg.PITCH_LIST, ratings, pots):
+        columns[pitch] = [r if pitch in s else 0 for r, s in zip(rating, selected)]
+        columns[f"pot_{pitch}"] = [p if pitch in s else 0 for p, s in zip(pot, selected)]
+    return columns
+
+
+def generate_players(
+    count: int,
+    is_pitcher: bool,
+    age_range: Tuple[int, int] = (18, 38),
+    primary_positions: Sequence[str] = (),
+    seed: Optional[int] = None,
+    today: Optional[date] = None,
+    ids: Iterable[str] = (),
+) -> List[Dict]:
+    """Generate ``count`` pitchers or hitters in one batch.
+
+    Parameters
+    ----------
+    count:
+        Number of players to create.
+    is_pitcher:
+        Create pitchers when true, otherwise hitters.
+    age_range:
+        ``(min_age, max_age)`` of the players.
+    primary_positions:
+        Hitters only: primary positions forced on the first
+        ``len(primary_positions)`` players; the rest are drawn with
+        :data:`~logic.player_generator.PRIMARY_POSITION_WEIGHTS`.
+    seed:
+        Seed of the batch's generator.  ``None`` draws fresh entropy.
+    today:
+        Reference date for birthdates; defaults to :meth:`date.today`.
+    ids:
+        Player ids given to the players in order, e.g. an
+        :class:`~utils.id_allocator.IdBlock`.  Players beyond the supplied
+        ids get an empty ``player_id``.
+
+    Returns
+    -------
+    List[Dict]
+        Player dictionaries as produced by :func:`generate_player`, with
+        empty ``first_name`` and ``last_name``.
+    """
+
+    if count <= 0:
+        return []
+    cols = _Columns(seed)
+    today = today or date.today()
+    births, ages = _birthdates(cols, count, age_range, today)
+    bounds = _potential_bounds(ages)
+    heights = cols.integers(68, 78, count)
+    weights = cols.integers(160, 250, count)
+
+    if is_pitcher:
+        primaries = ["P"] * count
+    else:
+        forced = list(primary_positions)[:count]
+        primaries = forced + cols.choice(
+            list(pg.PRIMARY_POSITION_WEIGHTS),
+            list(pg.PRIMARY_POSITION_WEIGHTS.values()),
+            count - len(forced),
+        )
+    hands = _bats_throws(cols, primaries)
+    others = _secondary_positions(cols, primaries)
+
+    names = PITCHER_RATINGS if is_pitcher else HITTER_RATINGS
+    ratings = dict(zip(names, cols.block(MIN_RATING, MAX_RATING, count, len(names))))
+    potential_names = PITCHER_POTENTIALS if is_pitcher else HITTER_POTENTIALS
+    potential_columns = _potentials(cols, [ratings[n] for n in potential_names], bounds)
+    potentials = {
+        f"pot_{name}": column for name, column in zip(potential_names, potential_columns)
+    }
+    if is_pitcher:
+        deliveries = cols.choice(_DELIVERIES, _DELIVERY_WEIGHTS, count)
+        pitches = _pitch_columns(cols, [t for _, t in hands], deliveries, bounds)
+    else:
+        potentials["pot_sc"] = ratings["sc"]
+        potentials["pot_gf"] = ratings["gf"]
+
+    id_iter = iter(ids)
+    players = []
+    for i in range(count):
+        player = {
+            "first_name": "",
+            "last_name": "",
+            "injured": 0,
+            "injury_description": 0,
+            "return_date": 0,
+            "player_id": next(id_iter, ""),
+            "is_pitcher": is_pitcher,
+            "birthdate": births[i],
+            "bats": hands[i][0],
+            "throws": hands[i][1],
+            "height": heights[i],
+            "weight": weights[i],
+            "primary_position": primaries[i],
+            "other_positions": others[i],
+        }
+        for name, column in ratings.items():
+            player[name] = column[i]
+        for name, column in potentials.items():
+            player[name] = column[i]
+        if is_pitcher:
+            player["role"] = "SP" if player["endurance"] > 55 else "RP"
+            player["delivery"] = deliveries[i]
+            for name, column in pitches.items():
+                player[name] = column[i]
+        players.append(player)
+    return players
+
+
+# ----------------------------------------------------------------------
+# Names
+# ----------------------------------------------------------------------
+def assign_names(players: Iterable[Dict]) -> None:
+    """Give each player a name from the shared name allocator.
+
+    Names come from :func:`~logic.player_generator.generate_name`, so they
+    are unique across everything generated since the last
+    :func:`~logic.player_generator.reset_name_cache`.
+    """
+
+    for player in players:
+        player["first_name"], player["last_name"] = pg.generate_name()
+
+
+__all__ = [
+    "HITTER_POTENTIALS",
+    "HITTER_RATINGS",
+    "PITCHER_POTENTIALS",
+    "PITCHER_RATINGS",
+    "assign_names",
+    "generate_players",
+]
@@ -1,9 +1,11 @@
 # ARR-inspired Player Generator Script
 import random
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Set, Optional
-import csv
+from typing import Dict, List, Tuple, Optional
 import os
+
+from logic.name_allocator import NameAllocator, load_name_csv
+from utils.id_allocator import PlayerIdAllocator, get_id_allocator
 
 # Constants
 base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -11,27 +13,34 @@ NAME_PATH = os.path.join(base_dir, "..", "data", "names.csv")
 
 
 def _load_name_pool() -> Dict[str, List[Tuple[str, str]]]:
-    pool: Dict[str, List[Tuple[str, str]]] = {}
-    if os.path.exists(NAME_PATH):
-        with open(NAME_PATH, newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                pool.setdefault(row["ethnicity"], []).append(
-                    (row["first_name"], row["last_name"])
-                )
-    return pool
+    return load_name_csv(NAME_PATH)
 
 
 name_pool = _load_name_pool()
-used_names: Set[Tuple[str, str]] = set()
+name_allocator = NameAllocator(name_pool)
+# Name allocator state saved with a league, see ``generate_draft_pool``.
+NAME_STATE_FILE = "name_state.json"
+# Ids for players generated without a league allocator; kept in memory only.
+default_id_allocator = PlayerIdAllocator()
 
 
-def reset_name_cache():
-    global name_pool, used_names
+def reset_name_cache(seed: Optional[int] = None):
+    """Start handing out names afresh, shuffled from ``seed``."""
+    global name_pool, name_allocator
     name_pool = _load_name_pool()
-    used_names = set()
+    name_allocator = NameAllocator(name_pool, seed)
 
     
+def save_name_state(path: str):
+    """Store the name allocator's state, e.g. next to a league's players."""
+    name_allocator.save(path)
+
+
+def load_name_state(path: str):
+    """Continue handing out names from a state written by :func:`save_name_state`."""
+    name_allocator.load(path)
+
+
 # Helper Functions
 
 def generate_birthdate(age_range=(18, 38)):
@@ -56,17 +65,7 @@ def bounded_potential(actual, age):
     return max(10, min(99, pot))
 
 def generate_name() -> tuple[str, str]:
-    if name_pool:
-        total_names = sum(len(v) for v in name_pool.values())
-        if len(used_names) >= total_names:
-            return "John", "Doe"
-        while True:
-            ethnicity = random.choice(list(name_pool.keys()))
-            name = random.choice(name_pool[ethnicity])
-            if name not in used_names:
-                used_names.add(name)
-                return name
-    return "John", "Doe"
+    return name_allocator.allocate()
 
 PRIMARY_POSITION_WEIGHTS = {
     "C": 19,
@@ -238,6 +237,7 @@ def generate_player(
     for_draft: bool = False,
     age_range: Optional[Tuple[int, int]] = None,
     primary_position: Optional[str] = None,
+    id_allocator: Optional[PlayerIdAllocator] = None,
 ) -> Dict:
     """Generate a single player record.
 
@@ -255,11 +255,16 @@ def generate_player(
     primary_position: Optional[str]
         When generating hitters this can be used to force a specific primary
         position rather than selecting one at random.
+    id_allocator: Optional[PlayerIdAllocator]
+        Allocator of the league the player joins, e.g.
+        ``get_id_allocator(data_dir)``.  Defaults to
+        ``default_id_allocator``, which keeps its ids in memory only.
 
     Returns
     -------
     Dict
-        A dictionary describing the generated player.
+        A dictionary describing the generated player.  Its ``player_id``
+        comes from ``id_allocator``.
     """
 
     # Determine the effective age range for the player and pass it directly to
@@ -268,7 +273,7 @@ def generate_player(
     effective_age_range = age_range or ((17, 21) if for_draft else (18, 38))
     birthdate, age = generate_birthdate(effective_age_range)
     first_name, last_name = generate_name()
-    player_id = f"P{random.randint(1000, 9999)}"
+    player_id = (id_allocator or default_id_allocator).allocate()
     height = random.randint(68, 78)
     weight = random.randint(160, 250)
 
@@ -392,17 +397,47 @@ def generate_player(
         return player
 
 
-def generate_draft_pool(num_players: int = 75) -> List[Dict]:
+def generate_draft_pool(
+    num_players: int = 75,
+    name_state: Optional[str] = None,
+    id_allocator: Optional[PlayerIdAllocator] = None,
+    data_dir: Optional[str] = None,
+) -> List[Dict]:
+    """Return ``num_players`` draft prospects for a league.
+
+    ``data_dir`` is the league's directory.  ``name_state`` defaults to its
+    ``NAME_STATE_FILE``; names continue from that state, so prospects never
+    share a name with the league's players, and the advanced state is
+    written back for the next pool.  ``id_allocator`` defaults to the
+    league's persisted ``get_id_allocator(data_dir)`` (the directory of
+    ``name_state`` when only that is given), so prospect ids never collide
+    with the league's.  Without either, ids come from
+    ``default_id_allocator``.
+    """
+    if name_state is None and data_dir is not None:
+        name_state = os.path.join(data_dir, NAME_STATE_FILE)
+    if id_allocator is None:
+        league_dir = data_dir
+        if league_dir is None and name_state:
+            league_dir = os.path.dirname(name_state) or "."
+        if league_dir is not None:
+            id_allocator = get_id_allocator(league_dir)
+    if name_state and os.path.exists(name_state):
+        load_name_state(name_state)
     players = []
     for _ in range(num_players):
         is_pitcher = random.random() < 0.45  # roughly 45% pitchers, 55% hitters
-        players.append(generate_player(is_pitcher=is_pitcher, for_draft=True))
+        players.append(generate_player(
+            is_pitcher=is_pitcher, for_draft=True, id_allocator=id_allocator
+        ))
     # Ensure all players have all keys filled
     all_keys = set(k for player in players for k in player.keys())
     for player in players:
         for key in all_keys:
             player.setdefault(key, 0)
 
+    if name_state:
+        save_name_state(name_state)
     return players
 
 if __name__ == "__main__":
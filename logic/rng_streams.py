@@ -0,0 +1,87 @@
+"""Independent, reproducible random number streams for simulated games.
+
+By default every manager of a :class:`~logic.simulation.GameSimulation`
+shares one :class:`random.Random`, so each roll depends on every roll made
+before it.  :class:`RandomStreams` instead derives a separate generator for
+each decision category from ``(season_seed, game_id, category)``.  A game
+can then be replayed bit for bit on any worker without simulating earlier
+games, and a change to how one manager rolls leaves the other streams
+untouched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Dict, List
+
+# Decision categories used by ``GameSimulation``.
+PLAY = "play"
+OFFENSE = "offense"
+DEFENSE = "defense"
+SUBSTITUTION = "substitution"
+
+
+def derive_seed(*parts: object) -> int:
+    """Return a 64-bit seed derived from ``parts``, e.g. a seed and a key.
+
+    A cryptographic digest is used instead of :func:`hash` because string
+    hashing is randomised per interpreter and would differ between workers.
+    """
+
+    key = ":".join(str(part) for part in parts).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "big")
+
+
+def stream_seed(season_seed: int, game_id: str, category: str) -> int:
+    """Return the seed of ``category``'s stream for ``game_id``."""
+
+    return derive_seed(season_seed, game_id, category)
+
+
+class RandomStreams:
+    """Per-category :class:`random.Random` streams for one game.
+
+    Parameters
+    ----------
+    season_seed:
+        Seed shared by every game of a season.
+    game_id:
+        Identifier of the game within the season.
+    """
+
+    def __init__(self, season_seed: int, game_id: str) -> None:
+        self.season_seed = season_seed
+        self.game_id = str(game_id)
+        self._streams: Dict[str, random.Random] = {}
+
+    def stream(self, category: str) -> random.Random:
+        """Return the generator for ``category``, creating it on first use."""
+
+        rng = self._streams.get(category)
+        if rng is None:
+            rng = random.Random(stream_seed(self.season_seed, self.game_id, category))
+            self._streams[category] = rng
+        return rng
+
+    def block(self, category: str, size: int) -> List[float]:
+        """Draw the next ``size`` values of ``category`` in one call.
+
+        The values are exactly those ``size`` calls to ``random()`` on the
+        stream would return, so a block can be generated ahead of time and
+        consumed later without changing results.
+        """
+
+        draw = self.stream(category).random
+        return [draw() for _ in range(size)]
+
+
+__all__ = [
+    "DEFENSE",
+    "OFFENSE",
+    "PLAY",
+    "RandomStreams",
+    "SUBSTITUTION",
+    "derive_seed",
+    "stream_seed",
+]
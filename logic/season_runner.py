@@ -0,0 +1,302 @@
+"""Play a schedule of :class:`GameSimulation` games across a process pool.
+
+Every game draws from its own :class:`~logic.rng_streams.RandomStreams`
+keyed by the season seed and the game's identifier.  Results therefore do
+not depend on which worker plays a game or in which order games finish:
+running with ``workers=1`` plays the schedule serially in the current process
+and yields exactly the same box scores as a parallel run, and any single game
+can be replayed with :func:`play_game` alone.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from models.player import Player
+from models.pitcher import Pitcher
+from .game_events import NullSink
+from .decision_profile import DecisionStats
+from .playbalance_config import PlayBalanceConfig
+from .rng_streams import RandomStreams
+from .simulation import GameSimulation, TeamState, generate_boxscore
+
+# ``(lineup, bench, pitchers)`` for a team.  A fresh :class:`TeamState` is
+# built from copies of these lists for every game so substitutions made in one
+# game never leak into the next.
+TeamRoster = Tuple[List[Player], List[Player], List[Pitcher]]
+
+
+@dataclass(frozen=True)
+class ScheduledGame:
+    """A single game on the schedule."""
+
+    game_id: str
+    home: str
+    away: str
+
+
+@dataclass
+class GameResult:
+    """Outcome of a simulated game.
+
+    ``boxscore`` mirrors :func:`logic.simulation.generate_boxscore` but refers
+    to players by ``player_id`` so results are cheap to send between
+    processes.  ``profile`` holds the game's decision counters when the game
+    was played with profiling enabled.
+    """
+
+    game_id: str
+    home: str
+    away: str
+    home_runs: int
+    away_runs: int
+    boxscore: Dict[str, Dict[str, object]] = field(default_factory=dict)
+    profile: Optional[DecisionStats] = None
+
+    @property
+    def winner(self) -> Optional[str]:
+        """Return the winning team id or ``None`` for a tied game."""
+
+        if self.home_runs == self.away_runs:
+            return None
+        return self.home if self.home_runs > self.away_runs else self.away
+
+
+def normalize_schedule(
+    schedule: Iterable[ScheduledGame | Tuple[str, str]]
+) -> List[ScheduledGame]:
+    """Return ``schedule`` as :class:`ScheduledGame` entries.
+
+    Plain ``(home, away)`` tuples are numbered in schedule order.
+    """
+
+    games: List[ScheduledGame] = []
+    for idx, entry in enumerate(schedule):
+        if isinstance(entry, ScheduledGame):
+            games.append(entry)
+        else:
+            home, away = entry
+            games.append(ScheduledGame(str(idx), home, away))
+    return games
+
+
+def load_team_rosters(
+    team_ids: Iterable[str],
+    players_file: str = "data/players.csv",
+    roster_dir: str = "data/rosters",
+) -> Dict[str, TeamRoster]:
+    """Return default ``(lineup, bench, pitchers)`` lists for ``team_ids``."""
+
+    from utils.lineup_loader import _build_default_lists
+
+    return {
+        team_id: _build_default_lists(team_id, players_file, roster_dir)
+        for team_id in team_ids
+    }
+
+
+# ----------------------------------------------------------------------
+# Game execution
+# ----------------------------------------------------------------------
+def _team_state(roster: TeamRoster) -> TeamState:
+    lineup, bench, pitchers = roster
+    return TeamState(lineup=list(lineup), bench=list(bench), pitchers=list(pitchers))
+
+
+def _compact_boxscore(box: Dict[str, Dict[str, object]]) -> Dict[str, Dict[str, object]]:
+    compact: Dict[str, Dict[str, object]] = {}
+    for side, section in box.items():
+        compact[side] = {
+            "score": section["score"],
+            "inning_runs": list(section["inning_runs"]),
+            "batting": [
+                {**entry, "player": entry["player"].player_id}
+                for entry in section["batting"]
+            ],
+            "pitching": [
+                {**entry, "player": entry["player"].player_id}
+                for entry in section["pitching"]
+            ],
+        }
+    return compact
+
+
+def play_game(
+    game: ScheduledGame,
+    rosters: Dict[str, TeamRoster],
+    config: PlayBalanceConfig,
+    season_seed: int,
+    innings: int = 9,
+    profile: bool = False,
+) -> GameResult:
+    """Simulate ``game`` with its season-derived RNG streams and return the result.
+
+    With ``profile`` the result carries the game's
+    :class:`~logic.decision_profile.DecisionStats`.
+    """
+
+    home = _team_state(rosters[game.home])
+    away = _team_state(rosters[game.away])
+    streams = RandomStreams(season_seed, game.game_id)
+    # Nobody reads the strategy log of a batch run, so skip recording it.
+    stats = DecisionStats() if profile else None
+    sim = GameSimulation(
+        home, away, config, events=NullSink(), streams=streams, profile=stats
+    )
+    sim.simulate_game(innings)
+    return GameResult(
+        game_id=game.game_id,
+        home=game.home,
+        away=game.away,
+        home_runs=home.runs,
+        away_runs=away.runs,
+        boxscore=_compact_boxscore(generate_boxscore(home, away)),
+        profile=stats,
+    )
+
+
+# Per-process state installed by ``_init_worker`` so rosters and the config
+# are sent once per worker instead of once per game.
+_WORKER_STATE: Dict[str, object] = {}
+
+
+def _init_worker(
+    rosters: Dict[str, TeamRoster],
+    config: PlayBalanceConfig,
+    season_seed: int,
+    innings: int,
+    profile: bool,
+) -> None:
+    _WORKER_STATE.update(
+        rosters=rosters,
+        config=config,
+        season_seed=season_seed,
+        innings=innings,
+        profile=profile,
+    )
+
+
+def _worker_play(game: ScheduledGame) -> GameResult:
+    return play_game(
+        game,
+        _WORKER_STATE["rosters"],  # type: ignore[arg-type]
+        _WORKER_STATE["config"],  # type: ignore[arg-type]
+        _WORKER_STATE["season_seed"],  # type: ignore[arg-type]
+        _WORKER_STATE["innings"],  # type: ignore[arg-type]
+        _WORKER_STATE["profile"],  # type: ignore[arg-type]
+    )
+
+
+def run_season(
+    schedule: Iterable[ScheduledGame | Tuple[str, str]],
+    rosters: Dict[str, TeamRoster],
+    config: PlayBalanceConfig,
+    season_seed: int = 0,
+    *,
+    workers: Optional[int] = None,
+    innings: int = 9,
+    callback: Optional[Callable[[GameResult], None]] = None,
+    profile: bool = False,
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator[GameResult]:
+    """Simulate every game in ``schedule`` and yield results as they finish.
+
+    Parameters
+    ----------
+    schedule:
+        :class:`ScheduledGame` entries or ``(home, away)`` team id tuples.
+    rosters:
+        Mapping of team id to ``(lineup, bench, pitchers)``, e.g. from
+        :func:`load_team_rosters`.
+    config:
+        PlayBalance configuration shared by all games.
+    season_seed:
+        Seed from which each game's RNG is derived.
+    workers:
+        Number of worker processes.  Defaults to one per CPU core; ``1`` runs
+        the schedule serially in the current process.
+    callback:
+        Optional callable invoked with each :class:`GameResult` as it arrives.
+    profile:
+        Record decision counters for every game in :attr:`GameResult.profile`.
+        Combine them with :meth:`DecisionStats.merged`.
+    mp_context:
+        :mod:`multiprocessing` context of the worker pool, e.g.
+        ``multiprocessing.get_context("spawn")``.  Defaults to the
+        platform's start method.
+
+    Results from a parallel run arrive in completion order; sort by
+    ``game_id`` when schedule order matters.
+    """
+
+    games = normalize_schedule(schedule)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(games)) or 1
+
+    if workers == 1:
+        for game in games:
+            result = play_game(game, rosters, config, season_seed, innings, profile)
+            if callback:
+                callback(result)
+            yield result
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(rosters, config, season_seed, innings, profile),
+    ) as pool:
+        futures = [pool.submit(_worker_play, game) for game in games]
+        for future in as_completed(futures):
+            result = future.result()
+            if callback:
+                callback(result)
+            yield result
+
+
+def simulate_season(
+    schedule: Sequence[ScheduledGame | Tuple[str, str]],
+    rosters: Dict[str, TeamRoster],
+    config: PlayBalanceConfig,
+    season_seed: int = 0,
+    *,
+    workers: Optional[int] = None,
+    innings: int = 9,
+    profile: bool = False,
+    mp_context: Optional[BaseContext] = None,
+) -> List[GameResult]:
+    """Return all results of :func:`run_season` in schedule order."""
+
+    games = normalize_schedule(schedule)
+    order = {g.game_id: i for i, g in enumerate(games)}
+    results = list(
+        run_season(
+            games,
+            rosters,
+            config,
+            season_seed,
+            workers=workers,
+            innings=innings,
+            profile=profile,
+            mp_context=mp_context,
+        )
+    )
+    results.sort(key=lambda r: order[r.game_id])
+    return results
+
+
+__all__ = [
+    "GameResult",
+    "ScheduledGame",
+    "TeamRoster",
+    "load_team_rosters",
+    "normalize_schedule",
+    "play_game",
+    "run_season",
+    "simulate_season",
+]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional
 
 from models.player import Player
@@ -9,8 +9,29 @@ from models.pitcher import Pitcher
 from logic.defensive_manager import DefensiveManager
 from logic.offensive_manager import OffensiveManager
 from logic.substitution_manager import SubstitutionManager
+from logic.game_events import (
+    EventCode,
+    EventSink,
+    MemorySink,
+    NullSink,
+    render_events,
+)
+from logic.decision_profile import DecisionStats, instrument_simulation
+from logic.rng_streams import DEFENSE, OFFENSE, PLAY, SUBSTITUTION, RandomStreams
 from logic.playbalance_config import PlayBalanceConfig
 
+# Probability that an attempted steal of second succeeds.
+STEAL_SUCCESS_PROB = 0.7
+
+
+def hit_probability(config: PlayBalanceConfig, batter_ph: int) -> float:
+    """Return the chance that a swing by a batter with ``batter_ph`` is a hit."""
+
+    base = config.get("swingSpeedBase", 50)
+    pct = config.get("swingSpeedPHPct", 0)
+    swing_speed = base + pct * batter_ph / 100.0
+    return max(0.0, min(0.95, swing_speed / 100.0))
+
 
 @dataclass
 class BatterState:
@@ -53,6 +74,112 @@ class TeamState:
         else:
             self.current_pitcher_state = None
 
+    def copy(self) -> "TeamState":
+        """Return an independent copy of the mutable game state.
+
+        Player and pitcher ratings never change during a game, so the copy
+        shares those objects and only duplicates the containers and the
+        per-game stat records.  Runners on base remain the same records as
+        in ``lineup_stats``.
+        """
+
+        memo: Dict[int, object] = {}
+
+        def batter(state: Optional[BatterState]) -> Optional[BatterState]:
+            if state is None:
+                return None
+            clone = memo.get(id(state))
+            if clone is None:
+                clone = memo[id(state)] = replace(state)
+            return clone  # type: ignore[return-value]
+
+        def pitcher(state: Optional[PitcherState]) -> Optional[PitcherState]:
+            if state is None:
+                return None
+            clone = memo.get(id(state))
+            if clone is None:
+                clone = memo[id(state)] = replace(state)
+            return clone  # type: ignore[return-value]
+
+        new = TeamState.__new__(TeamState)
+        new.lineup = list(self.lineup)
+        new.bench = list(self.bench)
+        new.pitchers = list(self.pitchers)
+        new.lineup_stats = {k: batter(v) for k, v in self.lineup_stats.items()}
+        new.pitcher_stats = {k: pitcher(v) for k, v in self.pitcher_stats.items()}
+        new.batting_index = self.batting_index
+        new.bases = [batter(b) for b in self.bases]
+        new.runs = self.runs
+        new.inning_runs = list(self.inning_runs)
+        new.current_pitcher_state = pitcher(self.current_pitcher_state)
+        return new
+
+
+@dataclass
+class GameSnapshot:
+    """Checkpoint of a :class:`GameSimulation` between two at-bats.
+
+    Created by :meth:`GameSimulation.snapshot`.  The snapshot owns private
+    copies of both teams, so the original game and every fork may continue
+    without affecting it.  Call :meth:`fork` as often as needed to branch the
+    rest of the game.
+    """
+
+    home: TeamState
+    away: TeamState
+    config: PlayBalanceConfig
+    half_innings: int
+    outs: int
+    half_start_runs: Optional[int]
+    # RNG state per role (play, defense, offense, substitution) and which
+    # roles shared a generator in the original game.
+    rng_states: List[tuple]
+    rng_groups: List[int]
+    players: List[Player]
+
+    def fork(
+        self,
+        rng: Optional[random.Random] = None,
+        events: Optional[EventSink] = None,
+        profile: Optional[DecisionStats] = None,
+    ) -> "GameSimulation":
+        """Return a new simulation resuming from this checkpoint.
+
+        Without ``rng`` the fork restores the captured generator states and
+        therefore continues exactly like the original game would have.  Pass
+        a fresh ``rng`` to sample a different continuation; it is then shared
+        by all managers.  Forks discard strategy events unless ``events`` is
+        given.  ``profile`` records the fork's decisions as for a new game.
+        """
+
+        events = events if events is not None else NullSink()
+        sim = GameSimulation(
+            self.home.copy(),
+            self.away.copy(),
+            self.config,
+            rng,
+            events,
+            profile=profile,
+        )
+        if rng is None:
+            generators: Dict[int, random.Random] = {}
+            for group, state in zip(self.rng_groups, self.rng_states):
+                if group not in generators:
+                    gen = random.Random()
+                    gen.setstate(state)
+                    generators[group] = gen
+            play, defense, offense, subs = (generators[g] for g in self.rng_groups)
+            sim.rng = play
+            sim.defense.rng = defense
+            sim.offense.rng = offense
+            sim.subs.rng = subs
+        sim.half_innings = self.half_innings
+        sim.outs = self.outs
+        sim._half_start_runs = self.half_start_runs
+        if events.enabled:
+            sim._players = list(self.players)
+        return sim
+
 
 class GameSimulation:
     """A very small game simulation used for tests.
@@ -62,6 +189,24 @@ class GameSimulation:
     strategies such as pinch hitting, stealing and pitching changes.  The
     behaviour is heavily driven by values from the parsed PB.INI file so
     that tests can verify that configuration is respected.
+
+    Strategy decisions are reported to ``events`` (see
+    :mod:`logic.game_events`).  By default the most recent events are kept in
+    memory so :attr:`debug_log` can render them; pass a
+    :class:`~logic.game_events.NullSink` when nobody reads the log.
+
+    Random rolls come from ``rng``, shared by all managers.  Passing
+    ``streams`` instead gives the simulation and each manager an independent
+    stream from :class:`~logic.rng_streams.RandomStreams`, which makes a game
+    reproducible from its season seed and game id alone.
+
+    The game advances one at-bat at a time via :meth:`step`, and
+    :meth:`snapshot` checkpoints it between at-bats so that the remainder
+    can be replayed from :meth:`GameSnapshot.fork` under different
+    decisions.
+
+    Passing a :class:`~logic.decision_profile.DecisionStats` as ``profile``
+    records call counts, trigger counts and time spent in every decision.
     """
 
     def __init__(
@@ -70,73 +215,160 @@ class GameSimulation:
         away: TeamState,
         config: PlayBalanceConfig,
         rng: Optional[random.Random] = None,
+        events: Optional[EventSink] = None,
+        streams: Optional[RandomStreams] = None,
+        profile: Optional[DecisionStats] = None,
     ) -> None:
+        if rng is not None and streams is not None:
+            raise ValueError("Pass either rng or streams, not both")
         self.home = home
         self.away = away
         self.config = config
-        self.rng = rng or random.Random()
-        self.defense = DefensiveManager(config, self.rng)
-        self.offense = OffensiveManager(config, self.rng)
-        self.subs = SubstitutionManager(config, self.rng)
-        self.debug_log: List[str] = []
+        self.events = events if events is not None else MemorySink()
+        if streams is not None:
+            self.rng = streams.stream(PLAY)
+            defense_rng = streams.stream(DEFENSE)
+            offense_rng = streams.stream(OFFENSE)
+            subs_rng = streams.stream(SUBSTITUTION)
+        else:
+            self.rng = rng or random.Random()
+            defense_rng = offense_rng = subs_rng = self.rng
+        self.defense = DefensiveManager(config, defense_rng)
+        self.offense = OffensiveManager(config, offense_rng)
+        self.subs = SubstitutionManager(config, subs_rng, self.events)
+        # Progress through the game: completed half-innings, outs in the
+        # current half and the batting team's runs when the half began.
+        self.half_innings = 0
+        self.outs = 0
+        self._half_start_runs: Optional[int] = None
+        self.profile = profile
+        if profile is not None:
+            instrument_simulation(self, profile)
+        # Everyone who can appear in an event, captured before substitutions
+        # move players around so names can be rendered later.
+        self._players: List[Player] = []
+        if self.events.enabled:
+            for team in (home, away):
+                self._players += team.lineup + team.bench + team.pitchers
+
+    @property
+    def debug_log(self) -> List[str]:
+        """Strategy log lines rendered from the retained events."""
+
+        return render_events(self.events.events(), self._players)
 
     # ------------------------------------------------------------------
     # Core loop helpers
     # ------------------------------------------------------------------
     def simulate_game(self, innings: int = 9) -> None:
-        """Simulate ``innings`` innings.
+        """Simulate the game until ``innings`` innings are complete.
 
         Only very small parts of a real baseball game are modelled – enough to
-        exercise decision making paths for the tests.
+        exercise decision making paths for the tests.  A game resumed from a
+        snapshot continues where the snapshot was taken.
         """
 
-        for _ in range(innings):
-            self._play_half(self.away, self.home)  # Top half
-            self._play_half(self.home, self.away)  # Bottom half
+        self.simulate_until(2 * innings)
 
-    def _play_half(self, offense: TeamState, defense: TeamState) -> None:
-        # Allow the defensive team to consider a late inning defensive swap
-        self.subs.maybe_defensive_sub(defense, self.debug_log)
+    def simulate_until(self, half_innings: int) -> None:
+        """Play at-bats until ``half_innings`` half-innings are complete."""
+
+        while self.half_innings < half_innings:
+            self.step()
 
-        start_runs = offense.runs
+    def step(self) -> None:
+        """Play the next at-bat of the game."""
+
+        if self.half_innings % 2 == 0:
+            offense, defense = self.away, self.home  # Top half
+        else:
+            offense, defense = self.home, self.away  # Bottom half
+        if self._half_start_runs is None:
+            self._half_start_runs = self._start_half(offense, defense)
+        self.outs += self.play_at_bat(offense, defense)
+        if self.outs >= 3:
+            self._end_half(offense, self._half_start_runs)
+            self.half_innings += 1
+            self.outs = 0
+            self._half_start_runs = None
+
+    def snapshot(self) -> GameSnapshot:
+        """Return a checkpoint of the game as it stands between at-bats."""
+
+        roles = [self.rng, self.defense.rng, self.offense.rng, self.subs.rng]
+        groups: List[int] = []
+        states: List[tuple] = []
+        seen: Dict[int, int] = {}
+        for gen in roles:
+            group = seen.setdefault(id(gen), len(seen))
+            groups.append(group)
+            states.append(gen.getstate())
+        players = self._players or [
+            p
+            for team in (self.home, self.away)
+            for p in team.lineup + team.bench + team.pitchers
+        ]
+        return GameSnapshot(
+            home=self.home.copy(),
+            away=self.away.copy(),
+            config=self.config,
+            half_innings=self.half_innings,
+            outs=self.outs,
+            half_start_runs=self._half_start_runs,
+            rng_states=states,
+            rng_groups=groups,
+            players=list(players),
+        )
+
+    def _play_half(self, offense: TeamState, defense: TeamState) -> None:
+        start_runs = self._start_half(offense, defense)
         outs = 0
         while outs < 3:
             outs += self.play_at_bat(offense, defense)
+        self._end_half(offense, start_runs)
+
+    def _start_half(self, offense: TeamState, defense: TeamState) -> int:
+        # Allow the defensive team to consider a late inning defensive swap
+        self.subs.maybe_defensive_sub(defense)
+        return offense.runs
+
+    def _end_half(self, offense: TeamState, start_runs: int) -> None:
         offense.bases = [None, None, None]
         offense.inning_runs.append(offense.runs - start_runs)
 
     def play_at_bat(self, offense: TeamState, defense: TeamState) -> int:
         """Play a single at-bat.  Returns the number of outs recorded."""
 
-        self.subs.maybe_change_pitcher(defense, self.debug_log)
+        self.subs.maybe_change_pitcher(defense)
 
         # Check if any existing runner should be replaced with a pinch runner
-        self.subs.maybe_pinch_run(offense, log=self.debug_log)
+        self.subs.maybe_pinch_run(offense)
 
         # Defensive decisions prior to the at-bat.  These mostly log the
         # outcome for manual inspection in the exhibition dialog.  The
         # simplified simulation does not yet modify gameplay based on them.
+        events = self.events
         runner = offense.bases[0].player if offense.bases[0] else None
-        if self.defense.maybe_charge_bunt():
-            self.debug_log.append("Defense charges bunt")
+        if self.defense.maybe_charge_bunt() and events.enabled:
+            events.emit(EventCode.CHARGE_BUNT)
         if runner and self.defense.maybe_hold_runner(runner.sp):
-            self.debug_log.append("Defense holds runner")
-            if self.defense.maybe_pickoff():
-                self.debug_log.append("Pickoff attempt")
-            if self.defense.maybe_pitch_out():
-                self.debug_log.append("Pitch out")
+            if events.enabled:
+                events.emit(EventCode.HOLD_RUNNER, runner.player_id)
+            if self.defense.maybe_pickoff() and events.enabled:
+                events.emit(EventCode.PICKOFF, runner.player_id)
+            if self.defense.maybe_pitch_out() and events.enabled:
+                events.emit(EventCode.PITCH_OUT, runner.player_id)
         pitch_around, ibb = self.defense.maybe_pitch_around()
-        if ibb:
-            self.debug_log.append("Intentional walk issued")
-        elif pitch_around:
-            self.debug_log.append("Pitch around")
+        if events.enabled:
+            if ibb:
+                events.emit(EventCode.INTENTIONAL_WALK)
+            elif pitch_around:
+                events.emit(EventCode.PITCH_AROUND)
 
         batter_idx = offense.batting_index % len(offense.lineup)
-        batter = self.subs.maybe_double_switch(
-            offense, defense, batter_idx, self.debug_log
-        )
+        batter = self.subs.maybe_double_switch(offense, defense, batter_idx)
         if batter is None:
-            batter = self.subs.maybe_pinch_hit(offense, batter_idx, self.debug_log)
+            batter = self.subs.maybe_pinch_hit(offense, batter_idx)
         offense.batting_index += 1
 
         batter_state = offense.lineup_stats.setdefault(
@@ -161,7 +393,10 @@ class GameSimulation:
                 batter_ch=batter.ch,
                 batter_ph=batter.ph,
             ):
-                self.debug_log.append("Hit and run")
+                if events.enabled:
+                    events.emit(
+                        EventCode.HIT_AND_RUN, batter.player_id, runner_state.player.player_id
+                    )
                 steal_result = self._attempt_steal(
                     offense, pitcher_state.player, force=True
                 )
@@ -177,7 +412,8 @@ class GameSimulation:
                 on_second=offense.bases[1] is not None,
                 run_diff=run_diff,
             ):
-                self.debug_log.append("Sacrifice bunt")
+                if events.enabled:
+                    events.emit(EventCode.SACRIFICE_BUNT, batter.player_id)
                 b = offense.bases
                 if b[2]:
                     offense.runs += 1
@@ -198,7 +434,12 @@ class GameSimulation:
             strikes=0,
             runner_on_third_sp=offense.bases[2].player.sp,
         ):
-            self.debug_log.append("Suicide squeeze")
+            if events.enabled:
+                events.emit(
+                    EventCode.SUICIDE_SQUEEZE,
+                    batter.player_id,
+                    offense.bases[2].player.player_id,
+                )
             offense.runs += 1
             offense.bases[2] = None
             outs += 1
@@ -224,11 +465,7 @@ class GameSimulation:
     # Swing outcome
     # ------------------------------------------------------------------
     def _swing_result(self, batter: Player, pitcher: Pitcher) -> bool:
-        base = self.config.get("swingSpeedBase", 50)
-        pct = self.config.get("swingSpeedPHPct", 0)
-        swing_speed = base + pct * batter.ph / 100.0
-        hit_prob = max(0.0, min(0.95, swing_speed / 100.0))
-        return self.rng.random() < hit_prob
+        return self.rng.random() < hit_probability(self.config, batter.ph)
 
     def _advance_runners(self, team: TeamState, batter_state: BatterState) -> None:
         b = team.bases
@@ -267,8 +504,7 @@ class GameSimulation:
             )
             attempt = self.rng.random() < chance
         if attempt:
-            success_prob = 0.7
-            if self.rng.random() < success_prob:
+            if self.rng.random() < STEAL_SUCCESS_PROB:
                 offense.bases[0] = None
                 offense.bases[1] = runner_state
                 runner_state.steals += 1
@@ -309,9 +545,12 @@ def generate_boxscore(home: TeamState, away: TeamState) -> Dict[str, Dict[str, o
 
 
 __all__ = [
+    "STEAL_SUCCESS_PROB",
     "BatterState",
+    "GameSnapshot",
     "PitcherState",
     "TeamState",
     "GameSimulation",
     "generate_boxscore",
+    "hit_probability",
 ]
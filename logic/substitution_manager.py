@@ -9,9 +9,10 @@ repository we only model a very small, deterministic subset of that behaviour.
 ``SubstitutionManager`` centralises these decisions so that the main
 ``GameSimulation`` class can delegate the various checks to a single place.
 Each method operates on the mutable ``TeamState`` structure used by the
-simulation and will append a human readable entry to ``log`` whenever a change
-occurs.  The log is later displayed in the exhibition game dialog so that the
-user can manually verify that substitutions occurred.
+simulation and reports every change as a :class:`~logic.game_events.GameEvent`
+on the manager's event sink.  Callers may additionally pass a ``log`` list to
+receive a human readable entry, which is how substitutions used to be shown in
+the exhibition game dialog.
 """
 
 import random
@@ -19,6 +20,7 @@ from typing import Optional, TYPE_CHECKING
 
 from models.player import Player
 from models.pitcher import Pitcher
+from .game_events import EventCode, EventSink, NullSink, format_event
 from .playbalance_config import PlayBalanceConfig
 
 if TYPE_CHECKING:  # pragma: no cover - used only for type checking
@@ -36,10 +38,28 @@ class SubstitutionManager:
     """
 
     def __init__(
-        self, config: PlayBalanceConfig, rng: Optional[random.Random] = None
+        self,
+        config: PlayBalanceConfig,
+        rng: Optional[random.Random] = None,
+        events: Optional[EventSink] = None,
     ) -> None:
         self.config = config
         self.rng = rng or random.Random()
+        self.events = events if events is not None else NullSink()
+
+    def _report(
+        self,
+        code: EventCode,
+        player: Player,
+        other: Optional[Player],
+        log: Optional[list[str]],
+    ) -> None:
+        if self.events.enabled:
+            self.events.emit(
+                code, player.player_id, other.player_id if other else None
+            )
+        if log is not None:
+            log.append(format_event(code, player, other))
 
     # ------------------------------------------------------------------
     # Pinch hitting
@@ -68,10 +88,7 @@ class SubstitutionManager:
         ):
             team.bench.remove(best)
             team.lineup[idx] = best
-            if log is not None:
-                log.append(
-                    f"Pinch hitter {best.first_name} {best.last_name} for {starter.first_name} {starter.last_name}"
-                )
+            self._report(EventCode.PINCH_HIT, best, starter, log)
             return best
         return starter
 
@@ -105,10 +122,7 @@ class SubstitutionManager:
             state = BatterState(best)
             team.lineup_stats[best.player_id] = state
             team.bases[base] = state
-            if log is not None:
-                log.append(
-                    f"Pinch runner {best.first_name} {best.last_name} for {runner_state.player.first_name} {runner_state.player.last_name}"
-                )
+            self._report(EventCode.PINCH_RUN, best, runner_state.player, log)
 
     # ------------------------------------------------------------------
     # Defensive substitution
@@ -139,10 +153,7 @@ class SubstitutionManager:
             team.bench.remove(best)
             team.bench.append(worst)
             team.lineup[worst_idx] = best
-            if log is not None:
-                log.append(
-                    f"Defensive sub {best.first_name} {best.last_name} for {worst.first_name} {worst.last_name}"
-                )
+            self._report(EventCode.DEFENSIVE_SUB, best, worst, log)
 
     # ------------------------------------------------------------------
     # Double switch
@@ -188,10 +199,7 @@ class SubstitutionManager:
         if best and best.ph > starter.ph:
             offense.bench.remove(best)
             offense.lineup[idx] = best
-            if log is not None:
-                log.append(
-                    f"Double switch: {best.first_name} {best.last_name} for {starter.first_name} {starter.last_name}"
-                )
+            self._report(EventCode.DOUBLE_SWITCH, best, starter, log)
             return best
 
         return starter
@@ -222,10 +230,7 @@ class SubstitutionManager:
                 new_pitcher.player_id, PitcherState(new_pitcher)
             )
             defense.current_pitcher_state = state
-            if log is not None:
-                log.append(
-                    f"Pitching change: {new_pitcher.first_name} {new_pitcher.last_name} enters"
-                )
+            self._report(EventCode.PITCHING_CHANGE, new_pitcher, None, log)
             return True
         return False
 
@@ -0,0 +1,388 @@
+"""Memory-compact, slotted counterparts of the player models.
+
+:class:`CompactPlayer` and :class:`CompactPitcher` accept exactly the same
+constructor arguments as :class:`~models.player.Player` and
+:class:`~models.pitcher.Pitcher` but keep their fields in ``__slots__``
+instead of a per-instance ``__dict__``.  String fields are interned, and the
+potential ratings are stored once in a fixed-layout ``array('h')`` rather
+than in a dict plus ``Player``'s separate ``pot_*`` fields.
+
+The classes do not derive from the dataclass models.  Code that accepts
+either form checks against :data:`PITCHER_TYPES`, as
+:func:`utils.player_writer.save_players_to_csv` does.
+
+Two behaviours differ from the dataclasses:
+
+* ``potential`` returns a new dict built from the compact layout; assign a
+  whole dict to change it.
+* ``CompactPlayer.pot_ch`` and the other ``pot_*`` attributes are aliases of
+  the matching ``potential`` entries (0 when absent) instead of separate
+  fields.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from dataclasses import fields
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from models.base_player import BasePlayer
+from models.pitcher import Pitcher
+from models.player import Player
+
+# Marks a potential rating that is absent from the ``potential`` dict.
+MISSING = -32768
+
+HITTER_POTENTIALS = ("ch", "ph", "sp", "gf", "pl", "vl", "sc", "fa", "arm")
+PITCHER_POTENTIALS = (
+    "gf",
+    "fb",
+    "cu",
+    "cb",
+    "sl",
+    "si",
+    "scb",
+    "kn",
+    "control",
+    "movement",
+    "endurance",
+    "hold_runner",
+    "arm",
+    "fa",
+)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+class CompactBasePlayer:
+    """Slotted fields shared by :class:`CompactPlayer` and :class:`CompactPitcher`."""
+
+    __slots__ = (
+        "player_id",
+        "first_name",
+        "last_name",
+        "birthdate",
+        "height",
+        "weight",
+        "bats",
+        "primary_position",
+        "other_positions",
+        "gf",
+        "injured",
+        "injury_description",
+        "return_date",
+        "_potential",
+    )
+
+    # Keys of the fixed potential layout, set by each subclass.
+    POTENTIAL_KEYS: Tuple[str, ...] = ()
+    # Dataclass model the compact class mirrors.
+    MODEL: type = BasePlayer
+
+    def _init_base(
+        self,
+        player_id: str,
+        first_name: str,
+        last_name: str,
+        birthdate: str,
+        height: int,
+        weight: int,
+        bats: str,
+        primary_position: str,
+        other_positions: List[str],
+        gf: int,
+        injured: bool,
+        injury_description: Optional[str],
+        return_date: Optional[str],
+    ) -> None:
+        self.player_id = player_id
+        self.first_name = sys.intern(first_name)
+        self.last_name = sys.intern(last_name)
+        self.birthdate = sys.intern(birthdate)
+        self.height = height
+        self.weight = weight
+        self.bats = sys.intern(bats)
+        self.primary_position = sys.intern(primary_position)
+        self.other_positions = [sys.intern(p) for p in other_positions]
+        self.gf = gf
+        self.injured = injured
+        self.injury_description = _intern(injury_description)
+        self.return_date = _intern(return_date)
+
+    # ------------------------------------------------------------------
+    # Potential ratings
+    # ------------------------------------------------------------------
+    @property
+    def potential(self) -> Dict[str, int]:
+        return {
+            key: value
+            for key, value in zip(self.POTENTIAL_KEYS, self._potential)
+            if value != MISSING
+        }
+
+    @potential.setter
+    def potential(self, values: Optional[Mapping[str, int]]) -> None:
+        values = values or {}
+        unknown = set(values) - set(self.POTENTIAL_KEYS)
+        if unknown:
+            raise ValueError(
+                f"Unsupported potential ratings for {type(self).__name__}: "
+                f"{sorted(unknown)}"
+            )
+        self._potential = array(
+            "h", [values.get(key, MISSING) for key in self.POTENTIAL_KEYS]
+        )
+
+    def _get_potential(self, key: str) -> int:
+        value = self._potential[self.POTENTIAL_KEYS.index(key)]
+        return 0 if value == MISSING else value
+
+    def _set_potential(self, key: str, value: int) -> None:
+        self._potential[self.POTENTIAL_KEYS.index(key)] = value
+
+    # ------------------------------------------------------------------
+    # Conversion and comparison
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_model(cls, player: BasePlayer) -> "CompactBasePlayer":
+        """Return a compact copy of dataclass ``player``."""
+
+        kwargs = {f.name: getattr(player, f.name) for f in fields(cls.MODEL)}
+        return cls(**kwargs)
+
+    def to_model(self) -> BasePlayer:
+        """Return an equivalent instance of the dataclass model.
+
+        ``Player``'s separate ``pot_*`` fields keep their defaults; the
+        ratings are carried by ``potential``.
+        """
+
+        kwargs = {
+            f.name: getattr(self, f.name)
+            for f in fields(self.MODEL)
+            if not (self.MODEL is Player and f.name.startswith("pot_"))
+        }
+        return self.MODEL(**kwargs)
+
+    def _values(self) -> Tuple[object, ...]:
+        return tuple(getattr(self, f.name) for f in fields(self.MODEL))
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        body = ", ".join(
+            f"{f.name}={getattr(self, f.name)!r}" for f in fields(self.MODEL)
+        )
+        return f"{type(self).__name__}({body})"
+
+
+class CompactPlayer(CompactBasePlayer):
+    """Slotted position player with the constructor of :class:`Player`."""
+
+    __slots__ = ("ch", "ph", "sp", "pl", "vl", "sc", "fa", "arm")
+
+    POTENTIAL_KEYS = HITTER_POTENTIALS
+    MODEL = Player
+
+    def __init__(
+        self,
+        player_id: str,
+        first_name: str,
+        last_name: str,
+        birthdate: str,
+        height: int,
+        weight: int,
+        bats: str,
+        primary_position: str,
+        other_positions: List[str],
+        gf: int,
+        injured: bool = False,
+        injury_description: Optional[str] = None,
+        return_date: Optional[str] = None,
+        ch: int = 0,
+        ph: int = 0,
+        sp: int = 0,
+        pl: int = 0,
+        vl: int = 0,
+        sc: int = 0,
+        fa: int = 0,
+        arm: int = 0,
+        pot_ch: int = 0,
+        pot_ph: int = 0,
+        pot_sp: int = 0,
+        pot_fa: int = 0,
+        pot_arm: int = 0,
+        pot_sc: int = 0,
+        pot_gf: int = 0,
+        potential: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self._init_base(
+            player_id,
+            first_name,
+            last_name,
+            birthdate,
+            height,
+            weight,
+            bats,
+            primary_position,
+            other_positions,
+            gf,
+            injured,
+            injury_description,
+            return_date,
+        )
+        self.ch = ch
+        self.ph = ph
+        self.sp = sp
+        self.pl = pl
+        self.vl = vl
+        self.sc = sc
+        self.fa = fa
+        self.arm = arm
+        merged = dict(potential or {})
+        # Non-zero ``pot_*`` arguments fill ratings the dict does not set.
+        for key, value in (
+            ("ch", pot_ch),
+            ("ph", pot_ph),
+            ("sp", pot_sp),
+            ("fa", pot_fa),
+            ("arm", pot_arm),
+            ("sc", pot_sc),
+            ("gf", pot_gf),
+        ):
+            if value and key not in merged:
+                merged[key] = value
+        self.potential = merged
+
+
+def _pot_alias(key: str) -> property:
+    return property(
+        lambda self: self._get_potential(key),
+        lambda self, value: self._set_potential(key, value),
+    )
+
+
+for _key in ("ch", "ph", "sp", "fa", "arm", "sc", "gf"):
+    setattr(CompactPlayer, f"pot_{_key}", _pot_alias(_key))
+del _key
+
+
+class CompactPitcher(CompactBasePlayer):
+    """Slotted pitcher with the constructor of :class:`Pitcher`."""
+
+    __slots__ = (
+        "endurance",
+        "control",
+        "movement",
+        "hold_runner",
+        "role",
+        "fb",
+        "cu",
+        "cb",
+        "sl",
+        "si",
+        "scb",
+        "kn",
+        "arm",
+        "fa",
+    )
+
+    POTENTIAL_KEYS = PITCHER_POTENTIALS
+    MODEL = Pitcher
+
+    def __init__(
+        self,
+        player_id: str,
+        first_name: str,
+        last_name: str,
+        birthdate: str,
+        height: int,
+        weight: int,
+        bats: str,
+        primary_position: str,
+        other_positions: List[str],
+        gf: int,
+        injured: bool = False,
+        injury_description: Optional[str] = None,
+        return_date: Optional[str] = None,
+        endurance: int = 0,
+        control: int = 0,
+        movement: int = 0,
+        hold_runner: int = 0,
+        role: str = "",
+        fb: int = 0,
+        cu: int = 0,
+        cb: int = 0,
+        sl: int = 0,
+        si: int = 0,
+        scb: int = 0,
+        kn: int = 0,
+        arm: int = 0,
+        fa: int = 0,
+        potential: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self._init_base(
+            player_id,
+            first_name,
+            last_name,
+            birthdate,
+            height,
+            weight,
+            bats,
+            primary_position,
+            other_positions,
+            gf,
+            injured,
+            injury_description,
+            return_date,
+        )
+        self.endurance = endurance
+        self.control = control
+        self.movement = movement
+        self.hold_runner = hold_runner
+        self.role = sys.intern(role)
+        self.fb = fb
+        self.cu = cu
+        self.cb = cb
+        self.sl = sl
+        self.si = si
+        self.scb = scb
+        self.kn = kn
+        self.arm = arm
+        self.fa = fa
+        self.potential = potential
+
+
+# ``isinstance`` targets matching the dataclass and compact models alike.
+PLAYER_TYPES = (BasePlayer, CompactBasePlayer)
+PITCHER_TYPES = (Pitcher, CompactPitcher)
+
+
+def to_compact(player: BasePlayer) -> CompactBasePlayer:
+    """Return the compact counterpart of a ``Player`` or ``Pitcher``."""
+
+    if isinstance(player, CompactBasePlayer):
+        return player
+    if isinstance(player, Pitcher):
+        return CompactPitcher.from_model(player)
+    return CompactPlayer.from_model(player)
+
+
+__all__ = [
+    "CompactBasePlayer",
+    "CompactPitcher",
+    "CompactPlayer",
+    "HITTER_POTENTIALS",
+    "PITCHER_POTENTIALS",
+    "PITCHER_TYPES",
+    "PLAYER_TYPES",
+    "to_compact",
+]
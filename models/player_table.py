@@ -0,0 +1,387 @@
+"""Columnar storage for large numbers of players.
+
+A :class:`PlayerTable` keeps every numeric rating in one 16-bit column and
+every string field in an interned column, instead of a dataclass instance
+(with its own ``__dict__`` and ``potential`` dict) per player.  Rows are
+addressed by position or through an id index.
+
+:meth:`PlayerTable.view` returns a lightweight :class:`PlayerView` or
+:class:`PitcherView`.  These subclass :class:`~models.player.Player` and
+:class:`~models.pitcher.Pitcher`, so ``isinstance`` checks and attribute
+access in existing code keep working, but their fields read from and write
+to the table.  Use :meth:`PlayerTable.to_player` when a detached dataclass
+is needed, e.g. for a hot simulation loop.
+
+With NumPy installed the columns are ``numpy.int16`` arrays that share
+memory with the table, so whole-league queries such as
+``table.top("ph", 50, mask=free_agents)`` are vectorised.  Without NumPy
+they are :class:`array.array` columns and the same queries run in Python.
+"""
+
+from __future__ import annotations
+
+import heapq
+import sys
+from array import array
+from dataclasses import fields
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from models.base_player import BasePlayer
+from models.compact_player import PITCHER_TYPES
+from models.pitcher import Pitcher
+from models.player import Player
+
+try:  # pragma: no cover - numpy is optional
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+# Dataclass fields stored in interned string columns.  ``None`` is kept for
+# the optional injury fields.
+STRING_COLUMNS = (
+    "player_id",
+    "first_name",
+    "last_name",
+    "birthdate",
+    "bats",
+    "primary_position",
+    "role",
+    "injury_description",
+    "return_date",
+)
+
+# Every integer dataclass field of ``Player`` and ``Pitcher``.  Fields a
+# player type does not have are stored as 0.
+RATING_COLUMNS = tuple(
+    dict.fromkeys(
+        f.name
+        for cls in (Player, Pitcher)
+        for f in fields(cls)
+        if f.type in ("int", int)
+    )
+)
+
+# Keys used in the ``potential`` dicts built by the CSV loader.  They are
+# stored as ``potential.<key>`` columns.
+POTENTIAL_KEYS = (
+    "ch",
+    "ph",
+    "sp",
+    "gf",
+    "pl",
+    "vl",
+    "sc",
+    "fa",
+    "arm",
+    "fb",
+    "cu",
+    "cb",
+    "sl",
+    "si",
+    "scb",
+    "kn",
+    "control",
+    "movement",
+    "endurance",
+    "hold_runner",
+)
+
+Mask = Union[Sequence[bool], "np.ndarray"]
+
+
+class PlayerTable:
+    """Column-oriented collection of players indexed by ``player_id``."""
+
+    def __init__(self, use_numpy: Optional[bool] = None) -> None:
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy and np is None:
+            raise RuntimeError("PlayerTable(use_numpy=True) requires numpy")
+        self.use_numpy = use_numpy
+        self._buffers: Dict[str, array] = {name: array("h") for name in RATING_COLUMNS}
+        self._buffers.update({f"potential.{k}": array("h") for k in POTENTIAL_KEYS})
+        self._columns: Dict[str, object] = {}
+        self.strings: Dict[str, List[Optional[str]]] = {n: [] for n in STRING_COLUMNS}
+        self.other_positions: List[Tuple[str, ...]] = []
+        self.potential_keys: List[Tuple[str, ...]] = []
+        self.is_pitcher = array("b")
+        self.injured = array("b")
+        self.index: Dict[str, int] = {}
+        self._wrap_columns()
+
+    def _wrap_columns(self) -> None:
+        # ``frombuffer`` shares memory with the array, which therefore must
+        # not grow while the NumPy column exists.
+        for name, buf in self._buffers.items():
+            self._columns[name] = (
+                np.frombuffer(buf, dtype=np.int16) if self.use_numpy else buf
+            )
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_players(
+        cls, players: Iterable[BasePlayer], use_numpy: Optional[bool] = None
+    ) -> "PlayerTable":
+        """Build a table from ``Player``/``Pitcher`` objects.
+
+        The slotted :mod:`models.compact_player` variants are accepted too.
+
+        Every player gets a row.  As with ``{p.player_id: p ...}`` lookups
+        elsewhere, the id index points at the last row of a duplicated id.
+        Raises :class:`OverflowError` when a rating does not fit in 16 bits.
+        """
+
+        table = cls(use_numpy)
+        # Drop the NumPy views so the underlying arrays may grow.
+        table._columns.clear()
+        ratings = [(name, table._buffers[name]) for name in RATING_COLUMNS]
+        potentials = [(key, table._buffers[f"potential.{key}"]) for key in POTENTIAL_KEYS]
+        strings = list(table.strings.items())
+        interned_tuples: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+        def intern_tuple(values: Iterable[str]) -> Tuple[str, ...]:
+            key = tuple(sys.intern(str(v)) for v in values)
+            return interned_tuples.setdefault(key, key)
+
+        for row, player in enumerate(players):
+            table.index[player.player_id] = row
+            for name, column in ratings:
+                column.append(getattr(player, name, 0) or 0)
+            potential = player.potential or {}
+            unknown = set(potential) - set(POTENTIAL_KEYS)
+            if unknown:
+                raise ValueError(f"Unsupported potential ratings: {sorted(unknown)}")
+            for key, column in potentials:
+                column.append(potential.get(key, 0))
+            for name, column in strings:
+                value = getattr(player, name, None)
+                column.append(None if value is None else sys.intern(str(value)))
+            table.other_positions.append(intern_tuple(player.other_positions))
+            table.potential_keys.append(intern_tuple(potential))
+            table.is_pitcher.append(isinstance(player, PITCHER_TYPES))
+            table.injured.append(bool(player.injured))
+
+        table._wrap_columns()
+        return table
+
+    @classmethod
+    def from_csv(
+        cls, file_path: str, use_numpy: Optional[bool] = None, use_cache: bool = False
+    ) -> "PlayerTable":
+        """Build a table from a players CSV.
+
+        ``use_cache`` is passed to
+        :func:`~utils.player_loader.load_players_from_csv`, which then keeps
+        a binary sidecar next to the CSV.
+        """
+
+        from utils.player_loader import load_players_from_csv
+
+        return cls.from_players(
+            load_players_from_csv(file_path, use_cache=use_cache), use_numpy
+        )
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.is_pitcher)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self.index
+
+    def __iter__(self) -> Iterator[Player]:
+        for row in range(len(self)):
+            yield self.view(row)
+
+    def column(self, name: str):
+        """Return the rating column ``name`` (a NumPy array when enabled).
+
+        Potential ratings are available as ``"potential.<key>"``.  The
+        column shares memory with the table; writes to it update the
+        players.
+        """
+
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(f"Unknown rating column: {name}") from None
+
+    def value(self, name: str, row: int) -> object:
+        """Return the value of field ``name`` for ``row`` as a Python object."""
+
+        column = self._columns.get(name)
+        if column is not None:
+            return int(column[row])
+        if name in self.strings:
+            return self.strings[name][row]
+        if name == "other_positions":
+            return list(self.other_positions[row])
+        if name == "injured":
+            return bool(self.injured[row])
+        if name == "potential":
+            return {
+                key: int(self._columns[f"potential.{key}"][row])
+                for key in self.potential_keys[row]
+            }
+        raise KeyError(name)
+
+    def set_value(self, name: str, row: int, value: object) -> None:
+        """Store ``value`` in field ``name`` of ``row``."""
+
+        column = self._columns.get(name)
+        if column is not None:
+            column[row] = value
+        elif name in self.strings:
+            self.strings[name][row] = None if value is None else sys.intern(str(value))
+        elif name == "other_positions":
+            self.other_positions[row] = tuple(sys.intern(str(v)) for v in value)
+        elif name == "injured":
+            self.injured[row] = bool(value)
+        elif name == "potential":
+            for key, rating in dict(value).items():
+                if key not in POTENTIAL_KEYS:
+                    raise KeyError(f"Unsupported potential rating: {key}")
+                self._columns[f"potential.{key}"][row] = rating
+            self.potential_keys[row] = tuple(sys.intern(k) for k in dict(value))
+        else:
+            raise KeyError(name)
+
+    def row(self, player_id: str) -> int:
+        return self.index[player_id]
+
+    def view(self, row: int) -> Player:
+        """Return a view of ``row`` that behaves like its ``Player``/``Pitcher``."""
+
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        cls = PitcherView if self.is_pitcher[row] else PlayerView
+        return cls(self, row)
+
+    def get(self, player_id: str) -> Optional[Player]:
+        """Return the view for ``player_id`` or ``None`` when unknown."""
+
+        row = self.index.get(player_id)
+        return None if row is None else self.view(row)
+
+    def __getitem__(self, player_id: str) -> Player:
+        return self.view(self.index[player_id])
+
+    def to_player(self, row: int) -> BasePlayer:
+        """Return a detached ``Player``/``Pitcher`` copy of ``row``."""
+
+        cls = Pitcher if self.is_pitcher[row] else Player
+        return cls(**{f.name: self.value(f.name, row) for f in fields(cls)})
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def mask_ids(self, player_ids: Iterable[str]) -> Mask:
+        """Return a row mask that is true for every row of ``player_ids``."""
+
+        wanted = set(player_ids)
+        hits = (pid in wanted for pid in self.strings["player_id"])
+        if self.use_numpy:
+            return np.fromiter(hits, dtype=bool, count=len(self))
+        return list(hits)
+
+    def pitcher_mask(self) -> Mask:
+        """Return a row mask that is true for pitchers."""
+
+        if self.use_numpy:
+            return np.frombuffer(self.is_pitcher, dtype=np.int8).astype(bool)
+        return [bool(v) for v in self.is_pitcher]
+
+    def top(self, name: str, n: int, mask: Optional[Mask] = None) -> List[Player]:
+        """Return views of the ``n`` rows with the highest ``name`` rating.
+
+        ``mask`` restricts the candidates.  Ties keep table order.
+        """
+
+        column = self.column(name)
+        if self.use_numpy:
+            candidates = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+            values = column[candidates].astype(np.int32)
+            if 0 < n < len(candidates):
+                # Keep every row tied with the n-th best so ties resolve in
+                # table order below.
+                nth = -np.partition(-values, n - 1)[n - 1]
+                keep = values >= nth
+                candidates, values = candidates[keep], values[keep]
+            order = np.lexsort((candidates, -values))
+            rows = candidates[order][: max(n, 0)].tolist()
+        else:
+            rows_iter = (
+                range(len(self))
+                if mask is None
+                else (r for r, keep in enumerate(mask) if keep)
+            )
+            rows = heapq.nsmallest(n, rows_iter, key=lambda r: (-column[r], r))
+        return [self.view(r) for r in rows]
+
+
+# ----------------------------------------------------------------------
+# Views
+# ----------------------------------------------------------------------
+def _field_property(name: str) -> property:
+    def getter(self):
+        return self._table.value(name, self._row)
+
+    def setter(self, value):
+        self._table.set_value(name, self._row, value)
+
+    return property(getter, setter)
+
+
+def _view_repr(self) -> str:
+    return f"{type(self).__name__}(player_id={self.player_id!r}, row={self._row})"
+
+
+class PlayerView(Player):
+    """A :class:`Player` whose fields live in a :class:`PlayerTable` row."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: PlayerTable, row: int) -> None:  # noqa: D107
+        self._table = table
+        self._row = row
+
+    __repr__ = _view_repr
+
+
+class PitcherView(Pitcher):
+    """A :class:`Pitcher` whose fields live in a :class:`PlayerTable` row."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: PlayerTable, row: int) -> None:  # noqa: D107
+        self._table = table
+        self._row = row
+
+    __repr__ = _view_repr
+
+
+for _view, _base in ((PlayerView, Player), (PitcherView, Pitcher)):
+    for _field in fields(_base):
+        setattr(_view, _field.name, _field_property(_field.name))
+    # Compare views field by field with each other and with plain objects.
+    _view.__eq__ = lambda self, other, _base=_base: (  # type: ignore[assignment]
+        isinstance(other, _base)
+        and all(
+            getattr(self, f.name) == getattr(other, f.name) for f in fields(_base)
+        )
+    )
+    _view.__hash__ = None  # type: ignore[assignment]
+del _view, _base, _field
+
+
+__all__ = [
+    "POTENTIAL_KEYS",
+    "PitcherView",
+    "PlayerTable",
+    "PlayerView",
+    "RATING_COLUMNS",
+    "STRING_COLUMNS",
+]
@@ -0,0 +1,401 @@
+"""Search batting orders for the lineup that scores the most runs.
+
+Batting orders are scored with the exact Markov model from
+:mod:`logic.markov_model`: the expected runs a lineup scores over a game
+against a given opposing pitcher.  Scoring every one of the ``9!`` orders
+exactly is too slow, so the search runs in three stages:
+
+1. **Prefix pass.**  Every order is scored by the expected runs of an
+   inning's first nine plate appearances, summed over all nine leadoff
+   rotations.  Orders are enumerated depth first so the probability state
+   after each batting-order prefix is computed once and shared by every
+   order that starts with it.  The work is split by leadoff batter across a
+   process pool.
+2. **Pruning.**  Only the best ``candidates`` orders of the prefix pass are
+   kept and scored exactly.
+3. **Polish.**  Pairwise swaps of the best order are tried until none
+   improves it.
+
+:func:`optimize_team_lineups` runs the search for a team against a left and
+a right handed pitcher and writes ``data/lineups/<TEAM>_vs_lhp.csv`` and
+``<TEAM>_vs_rhp.csv``.  :func:`optimize_all_lineups` does the same for a list
+of teams, e.g. as an overnight job.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import statistics
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from logic.markov_model import NO_RUNNERS, HalfInningModel
+from logic.playbalance_config import PlayBalanceConfig
+from models.player import Player
+from models.pitcher import Pitcher
+from utils.lineup_loader import _build_default_lists, save_lineup
+from utils.league_repository import get_repository
+
+Order = Tuple[int, ...]
+
+# Positions filled before the designated hitter, scarcest first.
+_FIELD_POSITIONS = ["C", "SS", "2B", "CF", "3B", "RF", "LF", "1B"]
+
+
+@dataclass
+class LineupResult:
+    """Best batting order found and its expected runs per game."""
+
+    lineup: List[Player]
+    expected_runs: float
+    positions: Dict[str, str]
+
+    def rows(self) -> List[Tuple[str, str]]:
+        """Return ``(player_id, position)`` pairs in batting order."""
+
+        return [(p.player_id, self.positions[p.player_id]) for p in self.lineup]
+
+
+class LineupEvaluator:
+    """Expected runs per game for batting orders of a fixed group of hitters.
+
+    Orders are tuples of indices into ``hitters``.  Inning results are cached
+    per leadoff rotation, so orders that are rotations of each other share
+    their work.
+    """
+
+    def __init__(
+        self,
+        hitters: Sequence[Player],
+        pitcher: Pitcher,
+        config: PlayBalanceConfig,
+        innings: int = 9,
+    ) -> None:
+        self.hitters = list(hitters)
+        self.innings = innings
+        # Slots of the model are indices into ``hitters`` so its transition
+        # cache is shared by every order.
+        self.model = HalfInningModel(self.hitters, pitcher, config)
+        self._innings: Dict[Order, Tuple[float, Tuple[float, ...]]] = {}
+
+    def _step(
+        self, frontier: Dict[Tuple[int, tuple], float], batter: int
+    ) -> Tuple[Dict[Tuple[int, tuple], float], float, float]:
+        """Advance ``frontier`` by one plate appearance.
+
+        Returns the new frontier, the expected runs scored and the
+        probability that the inning ended.
+        """
+
+        transitions = self.model.transitions
+        nxt: Dict[Tuple[int, tuple], float] = defaultdict(float)
+        runs = 0.0
+        ended = 0.0
+        for (outs, bases), p in frontier.items():
+            for q, add_outs, after, add_runs in transitions(batter, bases, False):
+                mass = p * q
+                runs += mass * add_runs
+                total = outs + add_outs
+                if total >= 3:
+                    ended += mass
+                else:
+                    nxt[(total, after)] += mass
+        return nxt, runs, ended
+
+    def inning(self, order: Order) -> Tuple[float, Tuple[float, ...]]:
+        """Return expected runs and next-leadoff offsets for ``order[0]`` leading off."""
+
+        cached = self._innings.get(order)
+        if cached is not None:
+            return cached
+        size = len(order)
+        frontier: Dict[Tuple[int, tuple], float] = {(0, NO_RUNNERS): 1.0}
+        offsets = [0.0] * size
+        runs = 0.0
+        step = 0
+        while frontier:
+            frontier, scored, ended = self._step(frontier, order[step % size])
+            runs += scored
+            offsets[(step + 1) % size] += ended
+            frontier = {k: p for k, p in frontier.items() if p >= 1e-15}
+            step += 1
+        cached = (runs, tuple(offsets))
+        self._innings[order] = cached
+        return cached
+
+    def expected_runs(self, order: Order) -> float:
+        """Return the exact expected runs per game for ``order``."""
+
+        size = len(order)
+        kernels = [self.inning(order[s:] + order[:s]) for s in range(size)]
+        leadoff = [0.0] * size
+        leadoff[0] = 1.0
+        total = 0.0
+        for _ in range(self.innings):
+            nxt = [0.0] * size
+            for slot, p in enumerate(leadoff):
+                if p == 0.0:
+                    continue
+                runs, offsets = kernels[slot]
+                total += p * runs
+                for offset, q in enumerate(offsets):
+                    nxt[(slot + offset) % size] += p * q
+            leadoff = nxt
+        return total
+
+    def prefix_scores(self, first: int) -> List[float]:
+        """Expected runs in the first ``len(hitters)`` plate appearances.
+
+        Scores are returned for every order starting with ``first`` in
+        lexicographic order.  The state after each prefix is computed once
+        and reused for all of its extensions.
+        """
+
+        size = len(self.hitters)
+        scores: List[float] = []
+
+        def extend(prefix: List[int], frontier, runs: float) -> None:
+            if len(prefix) == size:
+                scores.append(runs)
+                return
+            for batter in range(size):
+                if batter in prefix:
+                    continue
+                nxt, scored, _ = self._step(frontier, batter)
+                prefix.append(batter)
+                extend(prefix, nxt, runs + scored)
+                prefix.pop()
+
+        start, scored, _ = self._step({(0, NO_RUNNERS): 1.0}, first)
+        extend([first], start, scored)
+        return scores
+
+
+# ----------------------------------------------------------------------
+# Search
+# ----------------------------------------------------------------------
+_WORKER_STATE: Dict[str, LineupEvaluator] = {}
+
+
+def _init_worker(
+    hitters: List[Player], pitcher: Pitcher, config: PlayBalanceConfig, innings: int
+) -> None:
+    _WORKER_STATE["evaluator"] = LineupEvaluator(hitters, pitcher, config, innings)
+
+
+def _worker_prefix_scores(first: int) -> List[float]:
+    return _WORKER_STATE["evaluator"].prefix_scores(first)
+
+
+def _prefix_pass(
+    evaluator: LineupEvaluator,
+    pitcher: Pitcher,
+    config: PlayBalanceConfig,
+    workers: int,
+    mp_context: Optional[BaseContext] = None,
+) -> Dict[Order, float]:
+    size = len(evaluator.hitters)
+    leaders = list(range(size))
+    if workers == 1:
+        blocks = [evaluator.prefix_scores(first) for first in leaders]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(evaluator.hitters, pitcher, config, evaluator.innings),
+        ) as pool:
+            blocks = list(pool.map(_worker_prefix_scores, leaders))
+    # ``itertools.permutations`` yields orders grouped by leadoff batter in
+    # the same lexicographic order the prefix pass uses.
+    scores = itertools.chain.from_iterable(blocks)
+    return dict(zip(itertools.permutations(leaders), scores))
+
+
+def optimize_order(
+    hitters: Sequence[Player],
+    pitcher: Pitcher,
+    config: PlayBalanceConfig,
+    *,
+    workers: Optional[int] = None,
+    candidates: int = 64,
+    innings: int = 9,
+    mp_context: Optional[BaseContext] = None,
+) -> Tuple[List[Player], float]:
+    """Return the best batting order of ``hitters`` against ``pitcher``.
+
+    Parameters
+    ----------
+    hitters:
+        The players to order; usually the nine starters.
+    pitcher:
+        Opposing pitcher the lineup is scored against.
+    config:
+        PlayBalance configuration supplying the decision chances.
+    workers:
+        Processes used for the prefix pass.  Defaults to one per CPU core;
+        ``1`` runs in the current process.
+    candidates:
+        Number of prefix pass leaders that are scored exactly.
+    mp_context:
+        :mod:`multiprocessing` context of the worker pool, e.g.
+        ``multiprocessing.get_context("spawn")``.
+
+    Returns the ordered players and their expected runs per game.
+    """
+
+    if not hitters:
+        raise ValueError("At least one hitter is required")
+    if len(hitters) > 9:
+        raise ValueError("At most nine hitters can be ordered")
+    evaluator = LineupEvaluator(hitters, pitcher, config, innings)
+    size = len(evaluator.hitters)
+    workers = min(workers or os.cpu_count() or 1, size)
+
+    prefix = _prefix_pass(evaluator, pitcher, config, workers, mp_context)
+    # Summing over leadoff rotations approximates a batter's share of plate
+    # appearances anywhere in the game, not just the first inning.
+    proxy = {
+        order: sum(prefix[order[s:] + order[:s]] for s in range(size))
+        for order in prefix
+    }
+    shortlist = heapq.nlargest(candidates, proxy, key=proxy.__getitem__)
+
+    best = max(shortlist, key=evaluator.expected_runs)
+    best_runs = evaluator.expected_runs(best)
+    improved = True
+    while improved:
+        improved = False
+        for i, j in itertools.combinations(range(size), 2):
+            swapped = list(best)
+            swapped[i], swapped[j] = swapped[j], swapped[i]
+            runs = evaluator.expected_runs(tuple(swapped))
+            if runs > best_runs + 1e-12:
+                best, best_runs, improved = tuple(swapped), runs, True
+
+    return [evaluator.hitters[i] for i in best], best_runs
+
+
+def assign_positions(players: Iterable[Player]) -> Dict[str, str]:
+    """Return ``{player_id: position}`` covering the field plus a DH.
+
+    Positions are filled scarcest first by the best ``gf`` player listing it
+    as primary position, then by players listing it as a secondary position
+    and finally by whoever is left.  Anyone without a position is the
+    designated hitter.
+    """
+
+    available = list(players)
+    positions: Dict[str, str] = {}
+    open_positions = list(_FIELD_POSITIONS)
+    matchers = [
+        lambda p, pos: p.primary_position == pos,
+        lambda p, pos: pos in p.other_positions,
+        lambda p, pos: True,
+    ]
+    for matches in matchers:
+        for position in list(open_positions):
+            candidates = [p for p in available if matches(p, position)]
+            if not candidates:
+                continue
+            best = max(candidates, key=lambda p: p.gf)
+            available.remove(best)
+            open_positions.remove(position)
+            positions[best.player_id] = position
+    for player in available:
+        positions[player.player_id] = "DH"
+    return positions
+
+
+def representative_pitcher(pitchers: Iterable[Pitcher], throws: str) -> Optional[Pitcher]:
+    """Return the median ``hold_runner`` starter throwing with ``throws``.
+
+    The simulation reads the pitcher's handedness from ``bats``.  Relievers
+    are used when no starter matches, and ``None`` is returned when nobody
+    does.
+    """
+
+    matching = [p for p in pitchers if p.bats == throws]
+    starters = [p for p in matching if getattr(p, "role", "") == "SP"] or matching
+    if not starters:
+        return None
+    starters.sort(key=lambda p: p.hold_runner)
+    median = statistics.median_low([p.hold_runner for p in starters])
+    return next(p for p in starters if p.hold_runner == median)
+
+
+def optimize_team_lineups(
+    team_id: str,
+    config: PlayBalanceConfig,
+    *,
+    players_file: str = "data/players.csv",
+    roster_dir: str = "data/rosters",
+    lineup_dir: str = "data/lineups",
+    opponents: Optional[Dict[str, Pitcher]] = None,
+    workers: Optional[int] = None,
+    candidates: int = 64,
+    mp_context: Optional[BaseContext] = None,
+) -> Dict[str, LineupResult]:
+    """Optimise and save ``team_id``'s lineups against each opponent.
+
+    ``opponents`` maps the lineup suffix (``"lhp"``/``"rhp"``) to the
+    opposing pitcher.  By default a representative league starter of each
+    hand is used.  The nine starters are the default lineup from
+    :func:`utils.lineup_loader._build_default_lists`; only their order is
+    searched.
+    """
+
+    hitters, _, _ = _build_default_lists(team_id, players_file, roster_dir)
+    if opponents is None:
+        players = get_repository().players(players_file).values()
+        league = [p for p in players if isinstance(p, Pitcher)]
+        opponents = {}
+        for vs, throws in (("lhp", "L"), ("rhp", "R")):
+            pitcher = representative_pitcher(league, throws)
+            if pitcher is not None:
+                opponents[vs] = pitcher
+
+    positions = assign_positions(hitters)
+    results: Dict[str, LineupResult] = {}
+    for vs, pitcher in opponents.items():
+        order, runs = optimize_order(
+            hitters,
+            pitcher,
+            config,
+            workers=workers,
+            candidates=candidates,
+            mp_context=mp_context,
+        )
+        result = LineupResult(order, runs, positions)
+        save_lineup(team_id, vs, result.rows(), lineup_dir)
+        results[vs] = result
+    return results
+
+
+def optimize_all_lineups(
+    team_ids: Iterable[str],
+    config: PlayBalanceConfig,
+    **kwargs: object,
+) -> Dict[str, Dict[str, LineupResult]]:
+    """Run :func:`optimize_team_lineups` for every team in ``team_ids``."""
+
+    return {
+        team_id: optimize_team_lineups(team_id, config, **kwargs)  # type: ignore[arg-type]
+        for team_id in team_ids
+    }
+
+
+__all__ = [
+    "LineupEvaluator",
+    "LineupResult",
+    "assign_positions",
+    "optimize_all_lineups",
+    "optimize_order",
+    "optimize_team_lineups",
+    "representative_pitcher",
+]
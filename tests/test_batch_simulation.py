@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from logic.batch_simulation import BatchGameSimulation, simulate_matchup
+from logic.season_runner import load_team_rosters
+from logic.simulation import GameSimulation, TeamState
+from tests.util.pbini_factory import load_config
+
+
+def _team(roster):
+    lineup, bench, pitchers = roster
+    return TeamState(lineup=list(lineup), bench=list(bench), pitchers=list(pitchers))
+
+
+def test_batch_results_are_seeded_and_consistent():
+    cfg = load_config()
+    rosters = load_team_rosters(["ABU", "ARG"])
+    first = simulate_matchup(_team(rosters["ABU"]), _team(rosters["ARG"]), cfg, 500, seed=3)
+    second = simulate_matchup(_team(rosters["ABU"]), _team(rosters["ARG"]), cfg, 500, seed=3)
+
+    assert first.games == 500
+    assert np.array_equal(first.home_runs, second.home_runs)
+    assert np.array_equal(first.away_runs, second.away_runs)
+    assert first.home_inning_runs.shape == (500, 9)
+    assert np.array_equal(first.home_inning_runs.sum(axis=1), first.home_runs)
+    assert first.home_win_prob + first.away_win_prob + first.tie_prob == pytest.approx(1.0)
+    assert first.run_distribution("away").sum() == pytest.approx(1.0)
+
+
+def test_batch_matches_scalar_run_expectancy():
+    cfg = load_config()
+    cfg.values.update(
+        {"pinchRunChance": 30, "defSubChance": 40, "offManStealChancePct": 40}
+    )
+    rosters = load_team_rosters(["ABU", "ARG"])
+    home, away = rosters["ABU"], rosters["ARG"]
+
+    scalar_home = []
+    scalar_away = []
+    rng = random.Random(11)
+    for _ in range(1500):
+        h, a = _team(home), _team(away)
+        GameSimulation(h, a, cfg, rng).simulate_game()
+        scalar_home.append(h.runs)
+        scalar_away.append(a.runs)
+
+    batch = BatchGameSimulation(_team(home), _team(away), cfg, 20000, seed=11)
+    result = batch.simulate_games()
+
+    assert result.expected_runs("home") == pytest.approx(np.mean(scalar_home), abs=0.6)
+    assert result.expected_runs("away") == pytest.approx(np.mean(scalar_away), abs=0.6)
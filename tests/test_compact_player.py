@@ -0,0 +1,94 @@
+import copy
+import inspect
+import pickle
+
+import pytest
+
+from benchmarks.player_memory import measure
+from models.base_player import BasePlayer
+from models.compact_player import (
+    PITCHER_TYPES,
+    PLAYER_TYPES,
+    CompactPitcher,
+    CompactPlayer,
+    to_compact,
+)
+from models.pitcher import Pitcher
+from models.player import Player
+from utils.player_loader import load_players_from_csv
+from utils.player_writer import save_players_to_csv
+
+
+def _players():
+    return load_players_from_csv("data/players.csv", use_cache=False)
+
+
+def _params(cls):
+    return [(p.name, p.kind) for p in inspect.signature(cls).parameters.values()]
+
+
+def test_constructors_match_the_dataclasses():
+    assert _params(CompactPlayer) == _params(Player)
+    assert _params(CompactPitcher) == _params(Pitcher)
+
+
+def test_compact_players_round_trip_to_the_models():
+    for player in _players():
+        compact = to_compact(player)
+        assert type(compact) is (CompactPitcher if isinstance(player, Pitcher) else CompactPlayer)
+        assert isinstance(compact, PLAYER_TYPES)
+        assert isinstance(compact, PITCHER_TYPES) == isinstance(player, Pitcher)
+        assert not hasattr(compact, "__dict__")
+        assert compact.potential == player.potential
+        assert compact.to_model() == player
+        assert to_compact(compact) is compact
+
+
+def test_csv_round_trip_through_the_writer(tmp_path):
+    players = _players()
+    plain = tmp_path / "plain.csv"
+    compact = tmp_path / "compact.csv"
+    save_players_to_csv(players, str(plain))
+    save_players_to_csv([to_compact(p) for p in players], str(compact))
+    assert compact.read_text() == plain.read_text()
+
+    loaded = load_players_from_csv(str(compact), use_cache=False, compact=True)
+    assert [p.to_model() for p in loaded] == players
+
+
+def test_models_keep_their_own_metaclass():
+    assert type(BasePlayer) is type
+    assert not isinstance(to_compact(_players()[0]), BasePlayer)
+
+
+def test_potential_is_stored_in_a_fixed_layout():
+    hitter = CompactPlayer(
+        "P1", "A", "B", "2000-01-01", 72, 180, "R", "SS", ["2B"], 50,
+        ch=40, potential={"ch": 60}, pot_ph=55,
+    )
+    assert hitter.potential == {"ch": 60, "ph": 55}
+    assert hitter.pot_ch == 60 and hitter.pot_sp == 0
+    hitter.pot_sp = 70
+    assert hitter.potential["sp"] == 70
+    with pytest.raises(ValueError):
+        hitter.potential = {"fb": 50}
+
+    pitcher = CompactPitcher(
+        "P2", "C", "D", "1999-01-01", 75, 200, "L", "P", [], 30,
+        role="SP", fb=70, potential={"fb": 80, "endurance": 65},
+    )
+    assert pitcher.potential == {"fb": 80, "endurance": 65}
+    assert pitcher.role == "SP"
+
+
+def test_compact_players_pickle_and_copy():
+    player = to_compact(_players()[0])
+    for clone in (pickle.loads(pickle.dumps(player)), copy.deepcopy(player)):
+        assert clone == player and clone is not player
+        assert clone.potential == player.potential
+
+
+def test_memory_benchmark_reports_smaller_compact_players():
+    dataclass, compact = measure(500)
+    assert (dataclass.name, compact.name) == ("dataclass", "compact")
+    assert 0 < compact.bytes_per_player < dataclass.bytes_per_player
@@ -0,0 +1,73 @@
+import pickle
+
+from logic.decision_profile import DecisionStats
+from logic.rng_streams import RandomStreams
+from logic.season_runner import _team_state, load_team_rosters, simulate_season
+from logic.simulation import GameSimulation, TeamState
+from tests.test_simulation import MockRandom, make_pitcher, make_player
+from tests.util.pbini_factory import load_config, make_cfg
+
+
+def test_counters_track_calls_and_triggers():
+    cfg = make_cfg(chargeChanceBaseThird=100, defManChargeChancePct=100)
+    home = TeamState(lineup=[make_player("h1")], bench=[], pitchers=[make_pitcher("hp")])
+    away = TeamState(lineup=[make_player("a1")], bench=[], pitchers=[make_pitcher("ap")])
+    stats = DecisionStats()
+    # One swing roll: a hit with no steal attempt.
+    sim = GameSimulation(home, away, cfg, MockRandom([0.0, 0.9]), profile=stats)
+
+    outs = sim.play_at_bat(away, home)
+
+    assert outs == 0
+    assert stats.calls("sim.play_at_bat") == 1
+    assert stats.triggers("sim.play_at_bat") == 0
+    assert stats.calls("defense.maybe_charge_bunt") == 1
+    assert stats.triggers("defense.maybe_charge_bunt") == 1
+    assert stats.triggers("sim._swing_result") == 1
+    assert stats.calls("subs.maybe_pinch_hit") == 1
+    assert stats.triggers("subs.maybe_pinch_hit") == 0
+    assert stats.nanoseconds("sim.play_at_bat") >= stats.nanoseconds(
+        "sim._swing_result"
+    )
+
+
+def test_profiling_is_off_by_default_and_does_not_change_results():
+    cfg = load_config()
+    rosters = load_team_rosters(["ABU", "BCH"])
+    games = []
+    for stats in (None, DecisionStats()):
+        home, away = _team_state(rosters["ABU"]), _team_state(rosters["BCH"])
+        sim = GameSimulation(home, away, cfg, streams=RandomStreams(1, "1"), profile=stats)
+        if stats is None:
+            assert "play_at_bat" not in vars(sim)
+            assert "maybe_pinch_hit" not in vars(sim.subs)
+        sim.simulate_game()
+        games.append((home.inning_runs, away.inning_runs))
+    assert games[0] == games[1]
+    assert stats.calls("sim.play_at_bat") > 0
+
+
+def test_stats_merge_and_pickle():
+    first, second = DecisionStats(), DecisionStats()
+    first.record("a", True, 10)
+    second.record("a", False, 5)
+    second.record("b", True, 1)
+    total = DecisionStats.merged([first, None, pickle.loads(pickle.dumps(second))])
+    assert total.counters == {"a": [2, 1, 15], "b": [1, 1, 1]}
+    assert total.report().splitlines()[1].startswith("a ")
+
+
+def test_season_profiles_merge_across_workers():
+    cfg = load_config()
+    teams = ["ABU", "BCH", "BRA"]
+    rosters = load_team_rosters(teams)
+    schedule = [(h, a) for h in teams for a in teams if h != a]
+    totals = []
+    for workers in (1, 2):
+        results = simulate_season(
+            schedule, rosters, cfg, season_seed=3, workers=workers, profile=True
+        )
+        merged = DecisionStats.merged(r.profile for r in results)
+        totals.append({k: v[:2] for k, v in merged.counters.items()})
+    assert totals[0] == totals[1]
+    assert totals[0]["sim.play_at_bat"][0] > 0
@@ -0,0 +1,59 @@
+from logic.game_events import (
+    EventCode,
+    FileSink,
+    GameEvent,
+    MemorySink,
+    NullSink,
+    read_event_file,
+    render_events,
+)
+from logic.simulation import GameSimulation, TeamState
+from tests.test_simulation import MockRandom, make_pitcher, make_player
+from tests.util.pbini_factory import load_config
+
+
+def _pinch_hit_game(events=None):
+    cfg = load_config()
+    bench = make_player("bench", ph=80)
+    starter = make_player("start", ph=10)
+    home = TeamState(lineup=[make_player("h1")], bench=[], pitchers=[make_pitcher("hp")])
+    away = TeamState(lineup=[starter], bench=[bench], pitchers=[make_pitcher("ap")])
+    sim = GameSimulation(home, away, cfg, MockRandom([0.0, 0.0, 1.0]), events=events)
+    sim.play_at_bat(away, home)
+    return sim
+
+
+def test_debug_log_is_rendered_from_events():
+    sim = _pinch_hit_game()
+    assert list(sim.events.events()) == [GameEvent(EventCode.PINCH_HIT, "bench", "start")]
+    assert sim.debug_log == ["Pinch hitter Fbench Lbench for Fstart Lstart"]
+
+
+def test_null_sink_records_nothing():
+    sim = _pinch_hit_game(NullSink())
+    assert sim.away.lineup[0].player_id == "bench"
+    assert sim.debug_log == []
+
+
+def test_memory_sink_ring_buffer_keeps_latest():
+    sink = MemorySink(capacity=3)
+    for i in range(5):
+        sink.emit(EventCode.PITCHING_CHANGE, f"p{i}")
+    assert len(sink) == 3
+    assert sink.dropped == 2
+    assert [e.player_id for e in sink.events()] == ["p2", "p3", "p4"]
+
+
+def test_file_sink_appends_and_reads_back(tmp_path):
+    path = tmp_path / "events.tsv"
+    with FileSink(path) as sink:
+        sink.emit(EventCode.HIT_AND_RUN, "b", "r")
+    with FileSink(path) as sink:
+        sink.emit(EventCode.PITCH_AROUND)
+        assert len(list(sink.events())) == 2
+    events = list(read_event_file(path))
+    assert events == [
+        GameEvent(EventCode.HIT_AND_RUN, "b", "r"),
+        GameEvent(EventCode.PITCH_AROUND),
+    ]
+    assert render_events(events) == ["Hit and run", "Pitch around"]
@@ -0,0 +1,73 @@
+import random
+
+from logic.game_events import MemorySink
+from logic.rng_streams import RandomStreams
+from logic.season_runner import _team_state, load_team_rosters
+from logic.simulation import GameSimulation, generate_boxscore
+from tests.util.pbini_factory import load_config
+
+
+def _new_game(**kwargs):
+    cfg = load_config()
+    rosters = load_team_rosters(["ABU", "BCH"])
+    return GameSimulation(
+        _team_state(rosters["ABU"]), _team_state(rosters["BCH"]), cfg, **kwargs
+    )
+
+
+def _score(sim):
+    return sim.home.inning_runs, sim.away.inning_runs
+
+
+def test_stepping_matches_simulate_game():
+    whole = _new_game(rng=random.Random(5))
+    whole.simulate_game()
+    stepped = _new_game(rng=random.Random(5))
+    while stepped.half_innings < 18:
+        stepped.step()
+    assert _score(stepped) == _score(whole)
+
+
+def test_fork_continues_like_the_original_game():
+    for kwargs in ({"rng": random.Random(5)}, {"streams": RandomStreams(5, "1")}):
+        sim = _new_game(**kwargs)
+        sim.simulate_until(13)
+        sim.step()  # checkpoint in the middle of a half-inning
+        snap = sim.snapshot()
+        sim.simulate_game()
+
+        for _ in range(2):
+            fork = snap.fork()
+            fork.simulate_game()
+            assert generate_boxscore(fork.home, fork.away) == generate_boxscore(
+                sim.home, sim.away
+            )
+
+
+def test_forks_do_not_share_mutable_state():
+    sim = _new_game(rng=random.Random(3))
+    sim.simulate_until(12)
+    snap = sim.snapshot()
+    runs = (snap.home.runs, snap.away.runs)
+
+    fork = snap.fork(rng=random.Random(99))
+    fork.home.lineup.pop()
+    fork.simulate_game(innings=7)
+
+    assert (snap.home.runs, snap.away.runs) == runs
+    assert len(snap.home.lineup) == len(sim.home.lineup)
+    assert len(snap.home.inning_runs) == 6
+    assert fork.home.lineup[0] is snap.home.lineup[0]
+
+
+def test_fork_events_are_opt_in():
+    sim = _new_game(rng=random.Random(1))
+    sim.simulate_until(10)
+    snap = sim.snapshot()
+    assert not snap.fork().events.enabled
+
+    sink = MemorySink()
+    fork = snap.fork(events=sink)
+    fork.simulate_game()
+    assert fork.events is sink
+    assert len(fork.debug_log) == len(sink) > 0
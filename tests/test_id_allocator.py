@@ -0,0 +1,78 @@
+import json
+
+from utils.id_allocator import (
+    ID_STATE_FILE,
+    IdBlock,
+    PlayerIdAllocator,
+    format_player_id,
+    get_id_allocator,
+    parse_player_id,
+)
+
+
+def test_format_and_parse_keep_existing_style():
+    assert format_player_id(1234) == "P1234"
+    assert format_player_id(12345) == "P12345"
+    assert parse_player_id("P0042") == 42
+    assert parse_player_id("X1") is None
+    assert list(IdBlock(9998, 10001)) == ["P9998", "P9999", "P10000"]
+
+
+def test_allocate_is_sequential_and_persists_blocks(tmp_path):
+    state = tmp_path / ID_STATE_FILE
+    allocator = PlayerIdAllocator(str(state), block_size=10)
+    ids = [allocator.allocate() for _ in range(12)]
+    assert ids == [f"P{n}" for n in range(1000, 1012)]
+    # The mark covers the whole second block before any of it is used up.
+    assert json.loads(state.read_text())["next"] == 1020
+
+    reopened = PlayerIdAllocator(str(state), block_size=10)
+    assert reopened.allocate() == "P1020"
+
+
+def test_reserve_skips_ids_reserved_by_another_allocator(tmp_path):
+    state = str(tmp_path / ID_STATE_FILE)
+    first = PlayerIdAllocator(state)
+    second = PlayerIdAllocator(state)
+    a = first.reserve(50)
+    b = second.reserve(50)
+    c = first.reserve(5)
+    assert a == IdBlock(1000, 1050)
+    assert b == IdBlock(1050, 1100)
+    assert c == IdBlock(1100, 1105)
+
+
+def test_new_state_starts_above_existing_players(tmp_path):
+    players = tmp_path / "players.csv"
+    players.write_text("player_id,first_name\nP4755,A\nP9985,B\nX1,C\n")
+    allocator = PlayerIdAllocator(str(tmp_path / ID_STATE_FILE), str(players))
+    assert allocator.allocate() == "P9986"
+    allocator.reset()
+    assert allocator.allocate() == "P1000"
+
+
+def test_get_id_allocator_is_shared_per_league(tmp_path):
+    allocator = get_id_allocator(str(tmp_path))
+    assert get_id_allocator(str(tmp_path)) is allocator
+    assert allocator.state_path == str(tmp_path / ID_STATE_FILE)
+
+
+def test_allocator_without_state_file_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    allocator = PlayerIdAllocator(block_size=2)
+    assert [allocator.allocate() for _ in range(3)] == ["P1000", "P1001", "P1002"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_generate_player_uses_the_given_allocator(tmp_path, monkeypatch):
+    from logic.player_generator import generate_player
+
+    # Without an allocator no league directory is needed or touched.
+    monkeypatch.chdir(tmp_path)
+    assert parse_player_id(generate_player(is_pitcher=False)["player_id"]) is not None
+    assert list(tmp_path.iterdir()) == []
+
+    league = get_id_allocator(str(tmp_path))
+    player = generate_player(is_pitcher=True, id_allocator=league)
+    assert player["player_id"] == "P1000"
+    assert json.loads((tmp_path / ID_STATE_FILE).read_text())["next"] > 1000
@@ -132,3 +132,50 @@ def test_create_league_clears_users_and_rosters(tmp_path, monkeypatch):
     assert users_file.exists()
     assert users_file.read_text() == "admin,pass,admin,\n"
     assert not stray.exists()
+
+
+def _league_players(path):
+    with open(path / "players.csv", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_create_league_ratings_depend_only_on_seed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    divisions = {"East": [("CityA", "Cats"), ("CityB", "Dogs"), ("CityC", "Owls")]}
+    rating_keys = (
+        "first_name", "last_name", "birthdate", "primary_position", "ch", "ph", "endurance", "control", "fb"
+    )
+
+    leagues = []
+    for name, workers in (("serial", 1), ("pool", 2)):
+        create_league(str(tmp_path / name), divisions, "Test League", seed=42, workers=workers)
+        leagues.append(_league_players(tmp_path / name))
+        assert (tmp_path / name / "name_state.json").exists()
+
+    serial, pooled = leagues
+    assert len(serial) == len(pooled) == 150
+    assert sorted(p["player_id"] for p in serial) == [f"P{n}" for n in range(1000, 1150)]
+    assert [p["player_id"] for p in serial] == [p["player_id"] for p in pooled]
+    assert [[p[k] for k in rating_keys] for p in serial] == [
+        [p[k] for k in rating_keys] for p in pooled
+    ]
+
+
+def test_draft_pool_ids_do_not_collide_with_the_league(tmp_path):
+    from logic.player_generator import NAME_STATE_FILE, generate_draft_pool
+
+    divisions = {"East": [("CityA", "Cats"), ("CityB", "Dogs")]}
+    create_league(str(tmp_path), divisions, "Test League", seed=3)
+    with open(tmp_path / "players.csv", newline="") as f:
+        league_ids = {p["player_id"] for p in csv.DictReader(f)}
+
+    by_dir = {p["player_id"] for p in generate_draft_pool(20, data_dir=str(tmp_path))}
+    by_state = {
+        p["player_id"]
+        for p in generate_draft_pool(20, name_state=str(tmp_path / NAME_STATE_FILE))
+    }
+    assert len(by_dir) == len(by_state) == 20
+    assert not by_dir & league_ids
+    assert not by_state & (league_ids | by_dir)
+    reset_name_cache()
@@ -0,0 +1,72 @@
+import os
+import shutil
+
+import pytest
+
+from utils.league_repository import LeagueRepository, get_repository
+from utils.lineup_loader import _build_default_lists, save_lineup
+from utils.roster_loader import load_roster
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_players_are_parsed_once_until_the_file_changes(tmp_path):
+    players_file = tmp_path / "players.csv"
+    shutil.copy("data/players.csv", players_file)
+    repo = LeagueRepository()
+
+    first = repo.players(str(players_file))
+    assert repo.players(str(players_file)) is first
+    assert repo.loads == 1
+    with pytest.raises(TypeError):
+        first["P0"] = None  # type: ignore[index]
+
+    _bump_mtime(players_file)
+    reloaded = repo.players(str(players_file))
+    assert reloaded is not first
+    assert reloaded.keys() == first.keys()
+    assert repo.loads == 2
+
+
+def test_rosters_are_copies_and_track_edits(tmp_path):
+    roster_dir = tmp_path / "rosters"
+    shutil.copytree("data/rosters", roster_dir)
+    repo = LeagueRepository()
+
+    roster = repo.roster("ABU", str(roster_dir))
+    assert roster == load_roster("ABU", str(roster_dir))
+    roster.act.clear()
+    assert repo.roster("ABU", str(roster_dir)).act
+    assert repo.loads == 1
+
+    with open(roster_dir / "ABU.csv", "a", newline="") as fh:
+        fh.write("P9999,LOW\n")
+    assert repo.roster("ABU", str(roster_dir)).low[-1] == "P9999"
+
+    with pytest.raises(FileNotFoundError):
+        repo.roster("NOPE", str(roster_dir))
+
+
+def test_teams_and_lineups(tmp_path):
+    repo = LeagueRepository()
+    teams = repo.teams("data/teams.csv")
+    assert list(teams)[0] == "DRO"
+    assert teams["ABU"].team_id == "ABU"
+
+    save_lineup("ABU", "lhp", [("P1", "C"), ("P2", "1B")], str(tmp_path))
+    assert repo.lineup("ABU", "lhp", str(tmp_path)) == [("P1", "C"), ("P2", "1B")]
+    repo.invalidate(str(tmp_path / "ABU_vs_lhp.csv"))
+    repo.lineup("ABU", "lhp", str(tmp_path))
+    assert repo.loads == 3
+
+
+def test_default_lists_share_cached_players():
+    repo = get_repository()
+    lineup, _, _ = _build_default_lists("ABU", "data/players.csv", "data/rosters")
+    loads = repo.loads
+    again, _, _ = _build_default_lists("ABU", "data/players.csv", "data/rosters")
+    assert repo.loads == loads
+    assert all(a is b for a, b in zip(lineup, again))
@@ -44,3 +44,12 @@ def test_build_default_game_state_creates_expected_lineup():
     assert [p.player_id for p in state.lineup] == [p.player_id for p in lineup]
     assert [p.player_id for p in state.bench] == [p.player_id for p in bench]
     assert [p.player_id for p in state.pitchers] == [p.player_id for p in pitchers]
+
+
+def test_save_lineup_round_trips(tmp_path):
+    from utils.lineup_loader import load_lineup, save_lineup
+
+    rows = [("P1", "C"), ("P2", "1B"), ("P3", "DH")]
+    path = save_lineup("TST", "RHP", rows, str(tmp_path))
+    assert path.endswith("TST_vs_rhp.csv")
+    assert load_lineup("TST", "rhp", str(tmp_path)) == rows
@@ -0,0 +1,67 @@
+import dataclasses
+import itertools
+import multiprocessing
+
+from services.lineup_optimizer import (
+    LineupEvaluator,
+    assign_positions,
+    optimize_order,
+    representative_pitcher,
+)
+from tests.test_simulation import make_pitcher, make_player
+from tests.util.pbini_factory import load_config
+
+
+def _hitters():
+    ratings = [(20, 90, 30), (80, 40, 70), (55, 55, 55), (90, 10, 80), (10, 70, 20)]
+    return [make_player(f"h{i}", ph=ph, sp=sp, ch=ch) for i, (ph, sp, ch) in enumerate(ratings)]
+
+
+def test_optimize_order_finds_best_permutation():
+    cfg = load_config()
+    hitters = _hitters()
+    pitcher = make_pitcher("p", hold_runner=20)
+    evaluator = LineupEvaluator(hitters, pitcher, cfg)
+    best = max(itertools.permutations(range(len(hitters))), key=evaluator.expected_runs)
+
+    lineup, runs = optimize_order(hitters, pitcher, cfg, workers=1, candidates=4)
+    assert [p.player_id for p in lineup] == [hitters[i].player_id for i in best]
+    assert runs == evaluator.expected_runs(best)
+
+
+def test_optimize_order_runs_under_spawn():
+    cfg = load_config()
+    hitters = _hitters()
+    pitcher = make_pitcher("p", hold_runner=20)
+    serial = optimize_order(hitters, pitcher, cfg, workers=1, candidates=4)
+    spawned = optimize_order(
+        hitters,
+        pitcher,
+        cfg,
+        workers=2,
+        candidates=4,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    assert [p.player_id for p in spawned[0]] == [p.player_id for p in serial[0]]
+    assert spawned[1] == serial[1]
+
+
+def test_assign_positions_prefers_primary_then_secondary():
+    catcher = dataclasses.replace(make_player("c"), primary_position="C")
+    utility = dataclasses.replace(make_player("u", ph=10), primary_position="1B", other_positions=["SS"])
+    first = dataclasses.replace(make_player("f"), primary_position="1B", gf=80)
+    slugger = dataclasses.replace(make_player("s"), primary_position="LF")
+    positions = assign_positions([catcher, utility, first, slugger])
+    assert positions == {"c": "C", "u": "SS", "s": "LF", "f": "1B"}
+
+
+def test_representative_pitcher_picks_median_hold_for_hand():
+    lefties = [
+        dataclasses.replace(make_pitcher(f"l{i}", hold_runner=hold), bats="L")
+        for i, hold in enumerate([10, 50, 90])
+    ]
+    righty = make_pitcher("r", hold_runner=70)
+    assert representative_pitcher(lefties + [righty], "L").player_id == "l1"
+    assert representative_pitcher(lefties + [righty], "R").player_id == "r"
+    assert representative_pitcher([righty], "L") is None
@@ -14,3 +14,85 @@ def test_logo_determinism_same_mascot():
     h1 = hashlib.sha256(img1.tobytes()).hexdigest()
     h2 = hashlib.sha256(img2.tobytes()).hexdigest()
     assert h1 == h2
+
+
+@pytest.mark.parametrize("template", ["circle", "shield", "cap"])
+def test_array_rendering_matches_pixel_fallback(monkeypatch, template):
+    pytest.importorskip("numpy")
+    import images.auto_logo as auto_logo
+
+    spec = TeamSpec(location="Test City", mascot="Cobras", template=template)
+    fast = generate_logo(spec, size=65)
+    monkeypatch.setattr(auto_logo, "np", None)
+    slow = generate_logo(spec, size=65)
+    assert fast.mode == slow.mode == "RGB"
+    assert fast.tobytes() == slow.tobytes()
+
+
+def _specs():
+    return [
+        TeamSpec(location="Albany", mascot="Eagles", abbrev="ALB", template="circle"),
+        TeamSpec(location="Boston", mascot="Tigers", abbrev="BOS", template="shield"),
+        TeamSpec(location="Chicago", mascot="Sharks", abbrev="CHI", template="cap"),
+    ]
+
+
+def test_batch_generate_renders_only_changed_specs(tmp_path, monkeypatch):
+    import images.auto_logo as auto_logo
+
+    out_dir = tmp_path / "out"
+    cache_dir = tmp_path / "cache"
+    rendered = []
+    original = auto_logo._render_logo_file
+
+    def counting(spec, size, font_path, path):
+        rendered.append(spec.abbrev)
+        return original(spec, size, font_path, path)
+
+    monkeypatch.setattr(auto_logo, "_render_logo_file", counting)
+    specs = _specs()
+    done = []
+    auto_logo.batch_generate(
+        specs, str(out_dir), size=32, cache_dir=str(cache_dir),
+        callback=lambda spec, path: done.append(path),
+    )
+    assert sorted(rendered) == ["ALB", "BOS", "CHI"]
+    assert len(done) == 3 and len(list(cache_dir.iterdir())) == 3
+    first = (out_dir / "bos.png").read_bytes()
+
+    rendered.clear()
+    specs[1].primary, specs[1].secondary = "#000000", "#ffffff"
+    auto_logo.batch_generate(specs, str(out_dir), size=32, cache_dir=str(cache_dir))
+    assert rendered == ["BOS"]
+    assert (out_dir / "bos.png").read_bytes() != first
+    # The render of the old colours is evicted.
+    keys = {f"{auto_logo.logo_cache_key(spec, 32)}.png" for spec in specs}
+    assert {p.name for p in cache_dir.iterdir()} == keys
+
+    rendered.clear()
+    auto_logo.batch_generate(specs, str(out_dir), size=48, cache_dir=str(cache_dir))
+    assert sorted(rendered) == ["ALB", "BOS", "CHI"]
+    assert len(list(cache_dir.iterdir())) == 3
+
+    auto_logo.batch_generate(
+        specs[:1], str(out_dir), size=32, cache_dir=str(cache_dir), prune=False
+    )
+    assert len(list(cache_dir.iterdir())) == 4
+
+
+def test_batch_generate_in_workers_matches_serial(tmp_path):
+    from images.auto_logo import batch_generate, logo_cache_key
+
+    progress = []
+    batch_generate(_specs(), str(tmp_path / "serial"), size=32)
+    batch_generate(
+        _specs(), str(tmp_path / "pool"), size=32, workers=2,
+        cache_dir=str(tmp_path / "cache"),
+        callback=lambda spec, path: progress.append(spec.abbrev),
+    )
+    assert sorted(progress) == ["ALB", "BOS", "CHI"]
+    for name in ("alb.png", "bos.png", "chi.png"):
+        assert (tmp_path / "serial" / name).read_bytes() == (tmp_path / "pool" / name).read_bytes()
+    spec = _specs()[0]
+    assert (tmp_path / "cache" / f"{logo_cache_key(spec, 32)}.png").exists()
+    assert logo_cache_key(spec, 32) != logo_cache_key(spec, 64)
@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("PIL")
+
+from utils.logo_generator import generate_team_logos
+from utils.team_loader import load_teams
+
+
+def test_generate_team_logos_reports_progress_and_reuses_cache(tmp_path):
+    teams = load_teams("data/teams.csv")
+    calls = []
+    out_dir = generate_team_logos(
+        str(tmp_path), size=24, progress_callback=lambda done, total: calls.append((done, total)), workers=1
+    )
+    assert out_dir == str(tmp_path)
+    assert calls == [(i, len(teams)) for i in range(1, len(teams) + 1)]
+    assert {p.name for p in tmp_path.glob("*.png")} == {f"{t.team_id.lower()}.png" for t in teams}
+    cached = sorted(p.name for p in (tmp_path / ".cache").iterdir())
+    assert len(cached) == len(teams)
+
+    calls.clear()
+    generate_team_logos(
+        str(tmp_path), size=24, progress_callback=lambda done, total: calls.append((done, total)), workers=1
+    )
+    assert len(calls) == len(teams)
+    assert sorted(p.name for p in (tmp_path / ".cache").iterdir()) == cached
@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("PIL")
+
+from benchmarks.logo_throughput import TEMPLATES, main, run_benchmark, team_specs
+
+
+def test_run_benchmark_covers_every_size_and_template():
+    results = run_benchmark(sizes=(32, 48), logos=2)
+    assert [(r.size, r.template) for r in results] == [
+        (size, t) for size in (32, 48) for t in TEMPLATES
+    ]
+    assert all(r.logos == 2 and r.logos_per_sec > 0 for r in results)
+
+
+def test_team_specs_cycle_through_teams():
+    specs = team_specs(8, "shield")
+    assert len(specs) == 8
+    assert specs[0].mascot == specs[6].mascot
+    assert {s.template for s in specs} == {"shield"}
+
+
+def test_main_prints_logos_per_second(capsys):
+    assert main(["--sizes", "32", "--logos", "1", "--template", "cap", "--no-numpy"]) == 0
+    out = capsys.readouterr().out
+    assert "logos/s" in out and "cap" in out
@@ -0,0 +1,65 @@
+import math
+import random
+
+import pytest
+
+from logic.game_events import NullSink
+from logic.markov_model import GameModel, HalfInningModel
+from logic.simulation import GameSimulation, TeamState
+from tests.test_simulation import make_pitcher, make_player
+from tests.util.pbini_factory import load_config, make_cfg
+
+
+def test_single_batter_matches_closed_form():
+    # With no strategy a lone batter's hits follow a negative binomial and
+    # every hit after the third scores a run.
+    cfg = make_cfg(swingSpeedBase=40, swingSpeedPHPct=0)
+    model = HalfInningModel([make_player("b", ph=0)], make_pitcher("p"), cfg)
+    p = 0.4
+    expected = sum(
+        (hits - 3) * math.comb(hits + 2, 2) * p**hits * (1 - p) ** 3
+        for hits in range(4, 200)
+    )
+    dist = model.run_distribution()
+    assert sum(dist) == pytest.approx(1.0)
+    assert model.expected_runs() == pytest.approx(expected)
+
+
+def test_half_inning_matches_simulation():
+    cfg = load_config()
+    lineup = [make_player(str(i), ph=10 * i, sp=90 - 10 * i, ch=5 + 9 * i) for i in range(9)]
+    pitcher = make_pitcher("p", hold_runner=30)
+    model = HalfInningModel(lineup, pitcher, cfg)
+
+    rng = random.Random(3)
+    runs = []
+    for _ in range(20000):
+        offense = TeamState(lineup=list(lineup), bench=[], pitchers=[make_pitcher("op")])
+        defense = TeamState(lineup=[make_player("d")], bench=[], pitchers=[pitcher])
+        sim = GameSimulation(defense, offense, cfg, rng, events=NullSink())
+        sim._play_half(offense, defense)
+        runs.append(offense.runs)
+
+    assert sum(runs) / len(runs) == pytest.approx(model.expected_runs(), abs=0.05)
+    table = model.run_expectancy_table()
+    assert len(table) == 24
+    assert table[(0, (False, False, False))] == pytest.approx(model.expected_runs())
+
+
+def test_win_probability_is_a_distribution():
+    cfg = load_config()
+    home = [make_player(f"h{i}", ph=60) for i in range(9)]
+    away = [make_player(f"a{i}", ph=30) for i in range(9)]
+    model = GameModel(home, make_pitcher("hp"), away, make_pitcher("ap"), cfg, innings=3)
+    wp = model.win_probability()
+    assert wp.home + wp.away + wp.tie == pytest.approx(1.0)
+    assert wp.home > wp.away
+
+
+def test_win_probability_when_nobody_can_hit():
+    cfg = make_cfg(swingSpeedBase=0)
+    lineup = [make_player("x")]
+    model = GameModel(lineup, make_pitcher("hp"), lineup, make_pitcher("ap"), cfg)
+    wp = model.win_probability(inning=5, home_runs=2, away_runs=1)
+    assert wp.home == pytest.approx(1.0)
+    assert model.home.expected_game_runs() == 0
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from logic.name_allocator import FALLBACK_NAME, CombinedNames, NameAllocator
+
+
+def _pools():
+    return {
+        "A": [(f"First{i}", "Alpha") for i in range(30)],
+        "B": [(f"First{i}", "Beta") for i in range(20)],
+    }
+
+
+def test_allocator_exhausts_pools_without_repeats():
+    allocator = NameAllocator(_pools(), seed=1, fallback=False)
+    names = [allocator.allocate() for _ in range(50)]
+    assert len(set(names)) == 50
+    assert set(names) == {n for pool in _pools().values() for n in pool}
+    assert allocator.allocate() == FALLBACK_NAME
+
+
+def test_allocator_skips_reserved_names():
+    allocator = NameAllocator(_pools(), seed=2, fallback=False)
+    allocator.reserve([("First0", "Alpha"), ("First1", "Beta")])
+    names = [allocator.allocate() for _ in range(48)]
+    assert ("First0", "Alpha") not in names
+    assert ("First1", "Beta") not in names
+    assert allocator.allocate() == FALLBACK_NAME
+
+
+def test_same_seed_gives_same_names():
+    first = NameAllocator(_pools(), seed=3)
+    second = NameAllocator(_pools(), seed=3)
+    assert [first.allocate() for _ in range(10)] == [second.allocate() for _ in range(10)]
+
+
+def test_snapshot_restore_continues_sequence(tmp_path):
+    allocator = NameAllocator(_pools(), seed=4, fallback=False)
+    allocator.reserve([("First5", "Alpha")])
+    handed_out = [allocator.allocate() for _ in range(20)]
+    path = tmp_path / "names.json"
+    allocator.save(str(path))
+    expected = [allocator.allocate() for _ in range(29)]
+
+    restored = NameAllocator(_pools(), seed=99, fallback=False).load(str(path))
+    assert restored.seed == 4
+    resumed = [restored.allocate() for _ in range(29)]
+    assert resumed == expected
+    assert not set(resumed) & set(handed_out)
+    assert ("First5", "Alpha") not in resumed
+    assert json.loads(path.read_text())["cursors"]
+
+
+def test_restore_rejects_other_pools():
+    snapshot = NameAllocator(_pools(), seed=5).snapshot()
+    with pytest.raises(ValueError):
+        NameAllocator({"A": [("X", "Y")]}, seed=5).restore(snapshot)
+
+
+def test_combined_names_are_a_permutation(tmp_path):
+    first = tmp_path / "first.txt"
+    last = tmp_path / "last.txt"
+    first.write_text("".join(f"F{i}  1.0 1.0 {i}\n" for i in range(7)))
+    last.write_text("".join(f"L{i}  1.0 1.0 {i}\n" for i in range(13)))
+    combined = CombinedNames(6, str(first), str(last))
+    names = [combined.take() for _ in range(len(combined))]
+    assert len(set(names)) == 91
+    assert combined.take() is None
+    assert names != sorted(names)
+
+
+def test_fallback_draws_from_name_lists():
+    allocator = NameAllocator({"A": [("Only", "Name")]}, seed=7)
+    assert allocator.allocate() == ("Only", "Name")
+    extra = [allocator.allocate() for _ in range(100)]
+    assert len(set(extra)) == 100
+    assert FALLBACK_NAME not in extra
+    assert all(first.istitle() and last.istitle() for first, last in extra)
@@ -0,0 +1,84 @@
+from utils.news_log import NewsLog, parse_line, reverse_lines
+from utils.news_logger import log_news_event
+from utils.news_reader import read_latest_news
+
+
+def _fill(log, count):
+    for i in range(count):
+        teams = ("ABU",) if i % 3 == 0 else ("BCH",)
+        log.append(f"event {i}", teams, timestamp=f"2024-01-01 00:00:{i:02d}")
+
+
+def test_reverse_lines_reads_across_blocks(tmp_path):
+    path = tmp_path / "lines.txt"
+    lines = [f"line {i} " + "x" * (i % 7) for i in range(200)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert list(reverse_lines(str(path), block_size=16)) == lines[::-1]
+    assert list(reverse_lines(str(tmp_path / "missing.txt"))) == []
+
+
+def test_lines_keep_the_old_format_and_tags_are_hidden():
+    entry = parse_line("[2024-01-01 10:00:00] {ABU,BCH} TRADE ACCEPTED\n")
+    assert entry.teams == ("ABU", "BCH")
+    assert entry.display() == "[2024-01-01 10:00:00] TRADE ACCEPTED\n"
+    plain = parse_line("[2024-01-01 10:00:00] Season started")
+    assert plain.teams == () and plain.text == "Season started"
+
+
+def test_untagged_text_starting_with_a_brace_round_trips(tmp_path):
+    path = str(tmp_path / "news.txt")
+    log = NewsLog(path)
+    log.append("{ABU} clinched the division", timestamp="2024-01-01 10:00:00")
+    log.append("{BCH} note", teams=["ABU"], timestamp="2024-01-01 10:00:01")
+    untagged, tagged = log.latest(2)[::-1]
+    assert untagged.teams == () and untagged.text == "{ABU} clinched the division"
+    assert untagged.display() == "[2024-01-01 10:00:00] {ABU} clinched the division\n"
+    assert tagged.teams == ("ABU",) and tagged.text == "{BCH} note"
+
+
+def test_rotation_pages_and_team_filters(tmp_path):
+    path = str(tmp_path / "news.txt")
+    log = NewsLog(path, max_segment_bytes=200)
+    _fill(log, 60)
+
+    segments = log.segments()
+    assert len(segments) > 3
+    active = list(reverse_lines(path))
+    assert sum(s["entries"] for s in segments) + len(active) == 60
+    assert sum(s["teams"].get("ABU", 0) for s in segments) + sum("{ABU}" in l for l in active) == 20
+
+    texts = [e.text for e in log.latest(5)]
+    assert texts == [f"event {i}" for i in (59, 58, 57, 56, 55)]
+    page = [e.text for e in log.latest(7, page=5)]
+    assert page == [f"event {i}" for i in range(59 - 35, 59 - 42, -1)]
+    abu = [e.text for e in log.latest(4, page=2, team_id="ABU")]
+    assert abu == [f"event {i}" for i in (33, 30, 27, 24)]
+    assert len(log.latest(100)) == 60
+    assert log.latest(10, page=6) == []
+
+
+def test_archived_segments_skipped_by_paging_are_not_read(tmp_path):
+    path = str(tmp_path / "news.txt")
+    log = NewsLog(path, max_segment_bytes=200)
+    _fill(log, 60)
+    oldest = tmp_path / log.segments()[0]["file"]
+    oldest.write_text("corrupted\n")
+    # The newest pages never open the oldest segment.
+    assert [e.text for e in log.latest(5, page=1)][0] == "event 54"
+
+
+def test_max_segments_drops_oldest(tmp_path):
+    log = NewsLog(str(tmp_path / "news.txt"), max_segment_bytes=200, max_segments=2)
+    _fill(log, 60)
+    assert len(log.segments()) == 2
+    assert len(list(tmp_path.glob("news.0*.txt"))) == 2
+
+
+def test_wrappers(tmp_path):
+    path = str(tmp_path / "news.txt")
+    assert read_latest_news(file_path=path) == []
+    log_news_event("first", path)
+    log_news_event("trade", path, teams=["ABU"])
+    news = read_latest_news(10, path)
+    assert [line.split("] ", 1)[1] for line in news] == ["trade\n", "first\n"]
+    assert len(read_latest_news(10, path, team_id="ABU")) == 1
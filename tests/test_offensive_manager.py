@@ -214,3 +214,32 @@ def test_suicide_squeeze_chance_and_score():
     assert outs == 1
     assert away.runs == 1
     assert away.bases[2] is None
+
+
+def test_decision_tables_follow_config_changes():
+    cfg = make_cfg(offManStealChancePct=20, stealChanceFastThresh=80, stealChanceFastAdjust=5)
+    om = OffensiveManager(cfg)
+    assert om.calculate_steal_chance(runner_sp=70) == 0.25
+
+    cfg.values.update({"stealChanceFastAdjust": 15})
+    assert om.calculate_steal_chance(runner_sp=70) == 0.35
+
+    cfg.offManStealChancePct = 30
+    assert om.calculate_steal_chance(runner_sp=70) == 0.45
+
+    cfg.values = {"offManStealChancePct": 10}
+    assert om.calculate_steal_chance(runner_sp=70) == 0.1
+
+
+def test_decision_tables_handle_ratings_outside_table():
+    cfg = make_cfg(
+        hnrChanceBase=10,
+        hnrChanceFastSPThresh=200,
+        hnrChanceFastSPAdjust=5,
+        hnrChanceVeryFastSPAdjust=40,
+        offManHNRChancePct=100,
+    )
+    om = OffensiveManager(cfg)
+    # Speeds above the tabulated range still walk the thresholds.
+    assert om.hit_and_run_chance(runner_sp=150, batter_ch=0, batter_ph=0) == 15
+    assert om.hit_and_run_chance(runner_sp=250, batter_ch=0, batter_ph=0) == 50
@@ -0,0 +1,58 @@
+from datetime import date
+
+import logic.player_generator as pg
+from logic.player_batch import assign_names, generate_players
+
+
+def test_batch_players_have_generate_player_keys():
+    pitchers = generate_players(20, True, seed=1)
+    hitters = generate_players(20, False, seed=2)
+    assert set(pitchers[0]) == set(pg.generate_player(is_pitcher=True))
+    assert set(hitters[0]) == set(pg.generate_player(is_pitcher=False))
+    assert all(p["primary_position"] == "P" for p in pitchers)
+    assert all(not p["is_pitcher"] for p in hitters)
+
+
+def test_batch_ratings_follow_scalar_rules():
+    today = date(2024, 6, 1)
+    pitchers = generate_players(500, True, (18, 21), seed=3, today=today)
+    for p in pitchers:
+        age = (today - p["birthdate"]).days // 365
+        assert 18 <= age <= 21
+        assert p["role"] == ("SP" if p["endurance"] > 55 else "RP")
+        assert 10 <= p["control"] <= 99
+        # Young players only gain potential, capped at 99.
+        assert min(99, p["control"] + 10) <= p["pot_control"] <= 99
+        pitches = [k for k in pg.PITCH_LIST if p[k]]
+        assert "fb" in pitches and 2 <= len(pitches) <= 5
+        assert all(p[f"pot_{k}"] == 0 for k in pg.PITCH_LIST if k not in pitches)
+
+
+def test_forced_primary_positions_come_first():
+    positions = ["C", "1B", "2B", "3B", "SS", "LF", "CF", "RF"]
+    hitters = generate_players(14, False, seed=4, primary_positions=positions)
+    assert [h["primary_position"] for h in hitters[:8]] == positions
+    assert all(h["primary_position"] in pg.PRIMARY_POSITION_WEIGHTS for h in hitters)
+    assert all(h["pot_sc"] == h["sc"] and h["pot_gf"] == h["gf"] for h in hitters)
+
+
+def test_batches_are_reproducible_from_seed():
+    today = date(2024, 6, 1)
+    first = generate_players(30, True, seed=7, today=today)
+    again = generate_players(30, True, seed=7, today=today)
+    other = generate_players(30, True, seed=8, today=today)
+    assert first == again
+    assert first != other
+
+
+def test_ids_are_taken_in_order():
+    hitters = generate_players(3, False, seed=5, ids=iter(["P1", "P2"]))
+    assert [h["player_id"] for h in hitters] == ["P1", "P2", ""]
+
+
+def test_assign_names_gives_unique_names():
+    pg.reset_name_cache()
+    players = generate_players(40, False, seed=5) + generate_players(40, True, seed=6)
+    assign_names(players)
+    names = {(p["first_name"], p["last_name"]) for p in players}
+    assert len(names) == len(players)
@@ -47,3 +47,21 @@ def test_pitcher_role_rp_when_endurance_low(monkeypatch):
     player = generate_player(is_pitcher=True)
     assert player["endurance"] == 55
     assert player["role"] == "RP"
+
+
+def test_draft_pool_continues_from_league_name_state(tmp_path):
+    state = str(tmp_path / "name_state.json")
+    pg.reset_name_cache(1)
+    league = {pg.generate_name() for _ in range(50)}
+    pg.save_name_state(state)
+
+    # A later session starts with a fresh allocator.
+    pg.reset_name_cache(2)
+    first = pg.generate_draft_pool(20, name_state=state)
+    second = pg.generate_draft_pool(20, name_state=state)
+    first_names = {(p["first_name"], p["last_name"]) for p in first}
+    second_names = {(p["first_name"], p["last_name"]) for p in second}
+    assert len(first_names) == len(second_names) == 20
+    assert not first_names & league
+    assert not second_names & (league | first_names)
+    pg.reset_name_cache()
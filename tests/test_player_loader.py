@@ -1,7 +1,7 @@
 import csv
 import pytest
 from models.pitcher import Pitcher
-from utils.player_loader import load_players_from_csv
+from utils.player_loader import iter_players, load_players_from_csv
 
 
 def test_load_player_with_optional_columns_missing(tmp_path):
@@ -244,3 +244,89 @@ def test_pitcher_arm_defaults_to_fastball(tmp_path):
     assert isinstance(player, Pitcher)
     assert player.role == "SP"
     assert player.arm == 70
+
+
+def _copy_players(tmp_path):
+    path = tmp_path / "players.csv"
+    path.write_bytes(open("data/players.csv", "rb").read())
+    return path
+
+
+def test_player_cache_round_trip(tmp_path):
+    path = _copy_players(tmp_path)
+    parsed = load_players_from_csv(path)
+    assert not (tmp_path / "players.csv.cache").exists()
+
+    first = load_players_from_csv(path, use_cache=True)
+    assert (tmp_path / "players.csv.cache").exists()
+    cached = load_players_from_csv(path, use_cache=True)
+    assert cached == first == parsed
+    assert [type(p) for p in cached] == [type(p) for p in parsed]
+    # Cached players must not share mutable state between loads.
+    assert cached[0].potential is not first[0].potential
+
+
+def test_player_cache_written_to_cache_path(tmp_path):
+    path = _copy_players(tmp_path)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    cache = cache_dir / "players.bin"
+
+    first = load_players_from_csv(path, use_cache=True, cache_path=str(cache))
+    assert cache.exists()
+    assert not (tmp_path / "players.csv.cache").exists()
+    assert load_players_from_csv(path, use_cache=True, cache_path=str(cache)) == first
+
+
+def test_player_cache_ignored_when_csv_changes(tmp_path):
+    path = _copy_players(tmp_path)
+    load_players_from_csv(path, use_cache=True)
+    with open(path, "r", newline="") as f:
+        rows = list(csv.reader(f))
+    rows[1][1] = "Changed"
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+    players = load_players_from_csv(path, use_cache=True)
+    assert players[0].first_name == "Changed"
+    assert load_players_from_csv(path, use_cache=True)[0].first_name == "Changed"
+
+
+def test_corrupt_player_cache_falls_back_to_csv(tmp_path):
+    path = _copy_players(tmp_path)
+    expected = load_players_from_csv(path)
+    (tmp_path / "players.csv.cache").write_bytes(b"not a cache")
+    assert load_players_from_csv(path, use_cache=True) == expected
+
+
+def test_iter_players_projects_columns():
+    players = load_players_from_csv("data/players.csv", use_cache=False)
+    records = list(iter_players("data/players.csv", ("player_id", "primary_position", "is_pitcher", "ph")))
+    assert len(records) == len(players)
+    for record, player in zip(records, players):
+        assert record._fields == ("player_id", "primary_position", "is_pitcher", "ph")
+        assert record.player_id == player.player_id
+        assert record.primary_position == player.primary_position
+        assert record.is_pitcher == isinstance(player, Pitcher)
+        assert record.ph == (None if record.is_pitcher else player.ph)
+
+    full = next(iter_players("data/players.csv"))
+    assert full.other_positions == tuple(players[0].other_positions)
+    assert full.injured is players[0].injured
+
+
+def test_iter_players_filters_before_building_records():
+    pitchers = list(iter_players(
+        "data/players.csv",
+        ("player_id",),
+        where={"is_pitcher": True, "endurance": lambda v: v > 60},
+    ))
+    expected = [
+        p.player_id for p in load_players_from_csv("data/players.csv", use_cache=False)
+        if isinstance(p, Pitcher) and p.endurance > 60
+    ]
+    assert [r.player_id for r in pitchers] == expected
+    some = expected[:3]
+    assert [r.player_id for r in iter_players("data/players.csv", ("player_id",), where={"player_id": some})] == some
+    with pytest.raises(ValueError):
+        next(iter_players("data/players.csv", ("nope",)))
@@ -0,0 +1,117 @@
+import dataclasses
+
+import pytest
+
+from models.pitcher import Pitcher
+from models.player import Player
+from models.player_table import PitcherView, PlayerTable, PlayerView
+from utils.player_loader import load_players_from_csv
+
+BACKENDS = [False, pytest.param(True, id="numpy")]
+
+
+def _players():
+    return load_players_from_csv("data/players.csv")
+
+
+def _table(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    return PlayerTable.from_players(_players(), use_numpy=use_numpy)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_views_match_loaded_players(use_numpy):
+    players = _players()
+    table = _table(use_numpy)
+
+    assert len(table) == len(players)
+    for row, player in enumerate(players):
+        view = table.view(row)
+        assert view == player
+        assert type(view) is (PitcherView if isinstance(player, Pitcher) else PlayerView)
+        assert table.to_player(row) == player
+        assert type(table.to_player(row)) is type(player)
+    # The id index follows ``{p.player_id: p ...}`` semantics.
+    by_id = {p.player_id: p for p in players}
+    assert all(table[pid] == p for pid, p in by_id.items())
+    assert table.get("missing") is None
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_views_write_through_to_the_table(use_numpy):
+    table = _table(use_numpy)
+    hitter = next(v for v in table if not isinstance(v, Pitcher))
+    assert isinstance(hitter, Player)
+
+    hitter.ph = 12
+    hitter.last_name = "Renamed"
+    hitter.potential = {"ph": 40}
+    again = table[hitter.player_id]
+    assert (again.ph, again.last_name, again.potential) == (12, "Renamed", {"ph": 40})
+    assert table.column("ph")[table.row(hitter.player_id)] == 12
+    with pytest.raises(OverflowError):
+        hitter.ph = 70000
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_top_among_free_agent_hitters(use_numpy):
+    players = _players()
+    table = _table(use_numpy)
+    assigned = {p.player_id for p in players[::3]}
+    if use_numpy:
+        mask = ~table.mask_ids(assigned) & ~table.pitcher_mask()
+    else:
+        taken = table.mask_ids(assigned)
+        mask = [not (a or b) for a, b in zip(taken, table.pitcher_mask())]
+
+    top = table.top("ph", 50, mask=mask)
+
+    candidates = [
+        (row, p)
+        for row, p in enumerate(players)
+        if p.player_id not in assigned and not isinstance(p, Pitcher)
+    ]
+    expected = sorted(candidates, key=lambda item: (-item[1].ph, item[0]))[:50]
+    assert [v._row for v in top] == [row for row, _ in expected]
+
+
+def test_string_columns_are_interned():
+    table = PlayerTable.from_players(_players(), use_numpy=False)
+    positions = table.strings["primary_position"]
+    firsts = {}
+    for value in positions:
+        assert firsts.setdefault(value, value) is value
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_compact_players_build_the_same_table(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    compact = load_players_from_csv("data/players.csv", compact=True)
+    table = PlayerTable.from_players(compact, use_numpy=use_numpy)
+
+    assert len(table) == len(compact)
+    for row, (player, slotted) in enumerate(zip(_players(), compact)):
+        if not isinstance(player, Pitcher):
+            # Compact ``pot_*`` attributes alias the ``potential`` entries.
+            aliases = {
+                f.name: getattr(slotted, f.name)
+                for f in dataclasses.fields(Player)
+                if f.name.startswith("pot_")
+            }
+            player = dataclasses.replace(player, **aliases)
+        assert table.view(row) == player
+
+
+def test_from_csv_writes_a_sidecar_only_on_request(tmp_path):
+    path = tmp_path / "players.csv"
+    path.write_bytes(open("data/players.csv", "rb").read())
+
+    table = PlayerTable.from_csv(str(path), use_numpy=False)
+    assert len(table) == len(_players())
+    assert not (tmp_path / "players.csv.cache").exists()
+
+    cached = PlayerTable.from_csv(str(path), use_numpy=False, use_cache=True)
+    assert (tmp_path / "players.csv.cache").exists()
+    assert list(cached.index) == list(table.index)
@@ -0,0 +1,76 @@
+import pytest
+
+from logic.rng_streams import (
+    DEFENSE,
+    OFFENSE,
+    PLAY,
+    SUBSTITUTION,
+    RandomStreams,
+    derive_seed,
+    stream_seed,
+)
+from logic.season_runner import (
+    ScheduledGame,
+    _team_state,
+    load_team_rosters,
+    play_game,
+)
+from logic.simulation import GameSimulation
+from tests.test_simulation import MockRandom
+from tests.util.pbini_factory import load_config
+
+
+def test_stream_seed_depends_on_every_key():
+    base = stream_seed(7, "12", OFFENSE)
+    assert base == stream_seed(7, "12", OFFENSE)
+    assert base != stream_seed(8, "12", OFFENSE)
+    assert base != stream_seed(7, "13", OFFENSE)
+    assert base != stream_seed(7, "12", DEFENSE)
+    assert base == derive_seed(7, "12", OFFENSE)
+
+
+def test_streams_are_independent_and_reproducible():
+    first = RandomStreams(7, "12")
+    # Drawing from one category must not shift another.
+    first.stream(DEFENSE).random()
+    offense = [first.stream(OFFENSE).random() for _ in range(5)]
+
+    second = RandomStreams(7, "12")
+    assert [second.stream(OFFENSE).random() for _ in range(5)] == offense
+    assert first.stream(OFFENSE) is first.stream(OFFENSE)
+
+
+def test_block_matches_individual_draws():
+    blocked = RandomStreams(1, "g").block(PLAY, 10)
+    stream = RandomStreams(1, "g").stream(PLAY)
+    assert blocked == [stream.random() for _ in range(10)]
+
+
+def test_simulation_assigns_one_stream_per_manager():
+    cfg = load_config()
+    rosters = load_team_rosters(["ABU", "BCH"])
+    home, away = _team_state(rosters["ABU"]), _team_state(rosters["BCH"])
+    streams = RandomStreams(3, "1")
+    sim = GameSimulation(home, away, cfg, streams=streams)
+    assert sim.rng is streams.stream(PLAY)
+    assert sim.offense.rng is streams.stream(OFFENSE)
+    assert sim.defense.rng is streams.stream(DEFENSE)
+    assert sim.subs.rng is streams.stream(SUBSTITUTION)
+
+    with pytest.raises(ValueError):
+        GameSimulation(home, away, cfg, MockRandom([]), streams=streams)
+
+
+def test_game_replays_identically_in_isolation():
+    cfg = load_config()
+    rosters = load_team_rosters(["ABU", "BCH"])
+    game = ScheduledGame("5", "ABU", "BCH")
+    first = play_game(game, rosters, cfg, 99)
+    # Play an unrelated game in between; the replay must not notice.
+    play_game(ScheduledGame("4", "BCH", "ABU"), rosters, cfg, 99)
+    again = play_game(game, rosters, cfg, 99)
+    assert (first.home_runs, first.away_runs, first.boxscore) == (
+        again.home_runs,
+        again.away_runs,
+        again.boxscore,
+    )
@@ -0,0 +1,134 @@
+import os
+import shutil
+
+from models.player import Player
+from utils.free_agent_finder import find_free_agents, iter_free_agents
+from utils.roster_index import RosterIndex, get_roster_index
+from utils.roster_loader import load_roster, save_roster
+from utils.team_loader import load_teams
+
+
+def _rosters(tmp_path):
+    roster_dir = tmp_path / "rosters"
+    shutil.copytree("data/rosters", roster_dir)
+    return str(roster_dir)
+
+
+def _player(pid):
+    return Player(pid, "A", "B", "2000-01-01", 72, 180, "R", "SS", [], 50)
+
+
+def test_index_matches_the_roster_files(tmp_path):
+    roster_dir = _rosters(tmp_path)
+    index = RosterIndex(roster_dir).refresh()
+
+    team_ids = [n[:-4] for n in os.listdir(roster_dir) if n.endswith(".csv") and "_" not in n]
+    assert index.reads == len(team_ids)
+    for team_id in team_ids:
+        roster = load_roster(team_id, roster_dir)
+        for level in ("act", "aaa", "low"):
+            for pid in getattr(roster, level):
+                assert pid in index
+    first = load_roster(team_ids[0], roster_dir)
+    first_pid = (first.act + first.aaa + first.low)[0]
+    assert index.team_of(first_pid) is not None
+    assert index.team_of("missing") is None and index.get("missing") is None
+
+
+def test_free_agents_include_no_roster_players(tmp_path):
+    roster_dir = _rosters(tmp_path)
+    roster = load_roster("ABU", roster_dir)
+    # The first row of a roster file is a player, not a header.
+    first = _player((roster.act + roster.aaa + roster.low)[0])
+    free = _player("FA1")
+    assert find_free_agents([first, free], roster_dir) == [free]
+
+
+def test_saves_update_the_index_without_rereading(tmp_path):
+    roster_dir = _rosters(tmp_path)
+    index = get_roster_index(roster_dir)
+    reads = index.reads
+
+    roster = load_roster("ABU", roster_dir)
+    moved = roster.act[0]
+    roster.move_player(moved, "act", "low")
+    roster.act.append("NEW1")
+    save_roster("ABU", roster, roster_dir)
+
+    assert get_roster_index(roster_dir) is index
+    assert index.reads == reads
+    assert index.get("NEW1") == ("ABU", "ACT")
+    assert index.get(moved) == ("ABU", "LOW")
+
+
+def test_index_is_persisted_and_revalidated(tmp_path):
+    roster_dir = _rosters(tmp_path)
+    RosterIndex(roster_dir).refresh()
+    assert os.path.exists(roster_dir + ".index.json")
+
+    reloaded = RosterIndex(roster_dir).refresh()
+    assert reloaded.reads == 0
+
+    # Files changed or removed by other tools are picked up on refresh.
+    with open(os.path.join(roster_dir, "ABU.csv"), "w") as fh:
+        fh.write("X1,AAA\n")
+    victim = load_roster("BCH", roster_dir)
+    os.remove(os.path.join(roster_dir, "BCH.csv"))
+    reloaded.refresh()
+    assert reloaded.reads == 1
+    assert reloaded.get("X1") == ("ABU", "AAA")
+    assert all(reloaded.team_of(pid) != "BCH" for pid in victim.act)
+
+
+def test_iter_free_agents_yields_unrostered_records(tmp_path):
+    roster_dir = _rosters(tmp_path)
+    roster = load_roster("ABU", roster_dir)
+    released = roster.low[:5]
+    roster.low = roster.low[5:]
+    save_roster("ABU", roster, roster_dir)
+
+    index = get_roster_index(roster_dir)
+    records = list(iter_free_agents("data/players.csv", roster_dir))
+    freed = [pid for pid in released if pid not in index]
+    assert freed and {r.player_id for r in records} == set(freed)
+    hitters = list(iter_free_agents("data/players.csv", roster_dir, where={"is_pitcher": False}))
+    assert hitters == [r for r in records if not r.is_pitcher]
+
+
+def test_player_teams_limited_to_given_teams(tmp_path):
+    roster_dir = _rosters(tmp_path)
+    index = RosterIndex(roster_dir).refresh()
+    team_ids = [t.team_id for t in load_teams("data/teams.csv")]
+
+    expected = {}
+    for team_id in team_ids:
+        roster = load_roster(team_id, roster_dir)
+        for pid in roster.act + roster.aaa + roster.low:
+            expected[pid] = team_id
+    assert index.player_teams(team_ids) == expected
+    assert set(index.player_teams()) >= set(expected)
+    assert index.player_teams([]) == {}
+
+
+def test_saves_append_to_the_journal_instead_of_rewriting(tmp_path, monkeypatch):
+    import utils.roster_index as roster_index
+
+    roster_dir = _rosters(tmp_path)
+    index = get_roster_index(roster_dir)
+    snapshot = open(index.index_path).read()
+
+    roster = load_roster("ABU", roster_dir)
+    roster.act.append("NEW1")
+    save_roster("ABU", roster, roster_dir)
+    index.update_many([roster, load_roster("BCH", roster_dir)])
+    assert open(index.index_path).read() == snapshot
+    assert len(open(index.journal_path).read().splitlines()) == 3
+
+    reloaded = RosterIndex(roster_dir).refresh()
+    assert reloaded.reads == 0
+    assert reloaded.get("NEW1") == ("ABU", "ACT")
+
+    monkeypatch.setattr(roster_index, "COMPACT_THRESHOLD", 4)
+    index.update(roster)
+    assert not os.path.exists(index.journal_path)
+    assert RosterIndex(roster_dir).get("NEW1") == ("ABU", "ACT")
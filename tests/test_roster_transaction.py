@@ -0,0 +1,99 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from models.roster import Roster
+from utils.player_loader import load_players_from_csv
+from utils.roster_index import get_roster_index
+from utils.roster_loader import load_roster, write_roster_file
+from utils.roster_transaction import (
+    BATCH_MANIFEST,
+    RosterTransaction,
+    RosterValidationError,
+    recover_batch,
+    validate_roster,
+)
+
+
+@pytest.fixture
+def roster_dir(tmp_path):
+    path = tmp_path / "rosters"
+    shutil.copytree("data/rosters", path)
+    return str(path)
+
+
+def _players():
+    return {p.player_id: p for p in load_players_from_csv("data/players.csv")}
+
+
+def test_trade_and_moves_commit_together(roster_dir):
+    abu, bch = load_roster("ABU", roster_dir), load_roster("BCH", roster_dir)
+    give, receive = abu.aaa[0], bch.aaa[0]
+    call_up, send_down = abu.aaa[1], abu.act[-1]
+
+    with RosterTransaction(roster_dir, players=_players()) as txn:
+        txn.trade("ABU", "BCH", [give], [receive])
+        txn.move("ABU", call_up, "aaa", "act")
+        txn.move("ABU", send_down, "act", "aaa")
+
+    abu, bch = load_roster("ABU", roster_dir), load_roster("BCH", roster_dir)
+    assert give in bch.aaa and give not in abu.aaa
+    assert receive in abu.aaa and receive not in bch.aaa
+    assert call_up in abu.act and send_down in abu.aaa
+    assert len(abu.act) == 25
+    assert get_roster_index(roster_dir).get(give) == ("BCH", "AAA")
+    assert not [n for n in os.listdir(roster_dir) if "txn" in n or n.startswith(".batch")]
+
+
+def test_invalid_batches_write_nothing(roster_dir):
+    before = {n: open(os.path.join(roster_dir, n)).read() for n in os.listdir(roster_dir)}
+    abu = load_roster("ABU", roster_dir)
+    bch = load_roster("BCH", roster_dir)
+
+    txn = RosterTransaction(roster_dir)
+    txn.trade("ABU", "BCH", [abu.act[0]], [bch.act[0], bch.act[1]])
+    assert list(txn.validate()) == ["ABU"]
+    with pytest.raises(RosterValidationError) as info:
+        txn.commit()
+    assert "ABU" in info.value.errors
+    with pytest.raises(ValueError):
+        txn.release("ABU", "missing")
+
+    after = {n: open(os.path.join(roster_dir, n)).read() for n in os.listdir(roster_dir)}
+    assert after == before
+
+
+def test_validate_roster_checks_position_players():
+    players = _players()
+    pitchers = [pid for pid, p in players.items() if getattr(p, "role", "")][:20]
+    roster = Roster("T", act=pitchers)
+    assert validate_roster(roster) == []
+    assert validate_roster(roster, players) == [
+        "Active roster must have at least 11 position players."
+    ]
+    roster = Roster("T", aaa=["x"] * 16, low=["y"] * 11)
+    assert len(validate_roster(roster)) == 2
+
+
+def test_committed_batch_is_rolled_forward(roster_dir):
+    # Simulate a crash after the manifest was written but before the renames.
+    new = Roster("ABU", act=["X1"], aaa=["X2"])
+    write_roster_file(new, os.path.join(roster_dir, "ABU.csv.txn-1"))
+    write_roster_file(Roster("BCH", low=["X3"]), os.path.join(roster_dir, "BCH.csv.txn-1"))
+    with open(os.path.join(roster_dir, BATCH_MANIFEST), "w") as fh:
+        json.dump([["ABU.csv.txn-1", "ABU.csv"], ["BCH.csv.txn-1", "BCH.csv"]], fh)
+
+    assert recover_batch(roster_dir)
+    assert load_roster("ABU", roster_dir) == new
+    assert load_roster("BCH", roster_dir).low == ["X3"]
+    assert not os.path.exists(os.path.join(roster_dir, BATCH_MANIFEST))
+
+
+def test_uncommitted_batch_is_discarded(roster_dir):
+    before = load_roster("ABU", roster_dir)
+    write_roster_file(Roster("ABU"), os.path.join(roster_dir, "ABU.csv.txn-1"))
+    RosterTransaction(roster_dir)
+    assert load_roster("ABU", roster_dir) == before
+    assert not os.path.exists(os.path.join(roster_dir, "ABU.csv.txn-1"))
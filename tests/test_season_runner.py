@@ -0,0 +1,71 @@
+import multiprocessing
+import pickle
+
+from logic.season_runner import (
+    ScheduledGame,
+    load_team_rosters,
+    run_season,
+    simulate_season,
+)
+from tests.util.pbini_factory import load_config
+
+
+TEAMS = ["ABU", "ARG", "BCH", "BRA"]
+
+
+def _schedule():
+    return [(home, away) for home in TEAMS for away in TEAMS if home != away]
+
+
+def test_parallel_season_matches_serial():
+    cfg = load_config()
+    rosters = load_team_rosters(TEAMS)
+    serial = simulate_season(_schedule(), rosters, cfg, season_seed=42, workers=1)
+    parallel = simulate_season(_schedule(), rosters, cfg, season_seed=42, workers=2)
+
+    assert [r.game_id for r in serial] == [str(i) for i in range(len(_schedule()))]
+    assert [(r.home_runs, r.away_runs, r.boxscore) for r in serial] == [
+        (r.home_runs, r.away_runs, r.boxscore) for r in parallel
+    ]
+
+
+def test_run_season_streams_results_and_leaves_rosters_untouched():
+    cfg = load_config()
+    rosters = load_team_rosters(TEAMS[:2])
+    before = {t: tuple(len(group) for group in r) for t, r in rosters.items()}
+    seen = []
+    games = [ScheduledGame("g1", "ABU", "ARG"), ScheduledGame("g2", "ARG", "ABU")]
+    results = list(run_season(games, rosters, cfg, 3, workers=1, callback=seen.append))
+
+    assert [r.game_id for r in results] == ["g1", "g2"]
+    assert seen == results
+    assert all(len(r.boxscore["home"]["inning_runs"]) == 9 for r in results)
+    assert {t: tuple(len(group) for group in r) for t, r in rosters.items()} == before
+
+
+def test_config_pickles_for_spawned_workers():
+    cfg = load_config()
+    cfg.values["pinchRunChance"] = 17
+    restored = pickle.loads(pickle.dumps(cfg))
+
+    assert restored.values == cfg.values
+    assert restored.pinchRunChance == 17
+
+
+def test_parallel_season_runs_under_spawn():
+    cfg = load_config()
+    rosters = load_team_rosters(TEAMS[:2])
+    games = [ScheduledGame("g1", "ABU", "ARG"), ScheduledGame("g2", "ARG", "ABU")]
+    serial = simulate_season(games, rosters, cfg, season_seed=5, workers=1)
+    spawned = simulate_season(
+        games,
+        rosters,
+        cfg,
+        season_seed=5,
+        workers=2,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    assert [(r.home_runs, r.away_runs, r.boxscore) for r in spawned] == [
+        (r.home_runs, r.away_runs, r.boxscore) for r in serial
+    ]
@@ -0,0 +1,51 @@
+from benchmarks.sim_throughput import (
+    ALL_STRATEGIES,
+    BenchmarkResult,
+    all_strategies_config,
+    append_history,
+    check_regression,
+    load_history,
+    main,
+    run_benchmarks,
+)
+
+
+def test_run_benchmarks_counts_games_and_at_bats():
+    results = run_benchmarks(4, team_ids=["ABU", "BCH"])
+    assert [r.scenario for r in results] == ["default", "all_strategies"]
+    for r in results:
+        assert r.games == 4
+        assert r.at_bats >= 4 * 2 * 27
+        assert r.games_per_sec > 0 and r.at_bats_per_sec > r.games_per_sec
+
+
+def test_all_strategies_config_applies_overrides():
+    cfg = all_strategies_config()
+    for key, value in ALL_STRATEGIES.items():
+        assert cfg.get(key) == value
+
+
+def test_check_regression_uses_median_of_recent_runs(tmp_path):
+    path = str(tmp_path / "history.json")
+    for speed in (100.0, 1000.0, 110.0, 90.0):
+        append_history(path, [BenchmarkResult("default", int(speed), 0, 1.0)])
+    history = load_history(path)
+    assert len(history) == 4
+
+    ok = BenchmarkResult("default", 95, 0, 1.0)
+    slow = BenchmarkResult("default", 80, 0, 1.0)
+    new = BenchmarkResult("all_strategies", 1, 0, 1.0)
+    # Baseline is the median of the last three runs: 110 games/s.
+    assert check_regression([ok, new], history, 15.0, window=3) == []
+    problems = check_regression([slow], history, 15.0, window=3)
+    assert len(problems) == 1 and problems[0].startswith("default:")
+
+
+def test_main_fails_on_regression(tmp_path):
+    path = str(tmp_path / "history.json")
+    append_history(path, [BenchmarkResult("default", 10**9, 0, 1.0)])
+    args = ["--games", "1", "--teams", "ABU", "BCH", "--scenario", "default"]
+    assert main(args + ["--history", path, "--no-record"]) == 1
+    assert len(load_history(path)) == 1
+    assert main(args + ["--history", path, "--threshold", "100"]) == 0
+    assert len(load_history(path)) == 2
@@ -0,0 +1,131 @@
+import pytest
+
+from models.trade import Trade
+from utils import sqlite_store as store
+from utils.player_loader import load_players_from_csv
+from utils.roster_loader import load_roster
+from utils.team_loader import load_teams
+from utils.user_manager import load_users
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "league.db")
+    store.import_data_dir("data", path)
+    return path
+
+
+def _roster_rows(db, team_id):
+    with store.transaction(db) as conn:
+        return {
+            row["row_id"]: tuple(row)
+            for row in conn.execute("SELECT * FROM rosters WHERE team_id = ?", (team_id,))
+        }
+
+
+def test_import_matches_the_file_loaders(db):
+    assert store.load_players(db) == load_players_from_csv("data/players.csv", use_cache=False)
+    teams = load_teams("data/teams.csv")
+    assert store.load_teams(db) == teams
+    for team in teams:
+        assert store.load_roster(team.team_id, db) == load_roster(team.team_id)
+    assert store.load_users(db) == load_users("data/users.txt")
+    with pytest.raises(FileNotFoundError):
+        store.load_roster("NOPE", db)
+
+
+def test_roster_changes_touch_only_the_moved_rows(db):
+    team_id = load_teams("data/teams.csv")[0].team_id
+    before = _roster_rows(db, team_id)
+    roster = store.load_roster(team_id, db)
+    moved = roster.act[-1]
+    roster.move_player(moved, "act", "aaa")
+
+    store.save_roster(team_id, roster, db)
+    after = _roster_rows(db, team_id)
+    changed = [row_id for row_id in after if after[row_id] != before[row_id]]
+    assert after.keys() == before.keys()
+    assert [after[r][2] for r in changed] == [moved]
+    assert store.load_roster(team_id, db) == roster
+
+    store.move_player(team_id, moved, "low", db)
+    assert store.load_roster(team_id, db).low[-1] == moved
+    with pytest.raises(ValueError):
+        store.move_player(team_id, "missing", "low", db)
+
+
+def test_trades_are_updated_in_place(db):
+    trade = Trade("T1", "ABU", "BCH", ["P1"], ["P2", "P3"])
+    store.save_trade(trade, db)
+    store.save_trade(trade, db)
+    assert store.load_trades(db) == [trade]
+
+    store.update_trade_status("T1", "accepted", db)
+    assert store.load_trades(db, status="pending") == []
+    assert store.load_trades(db, status="accepted")[0].receive_player_ids == ["P2", "P3"]
+    with pytest.raises(ValueError):
+        store.update_trade_status("T2", "accepted", db)
+
+
+def test_users_keep_the_file_rules(db):
+    store.clear_users(db)
+    store.add_user("owner1", "pw", "owner", "LAX", db_path=db)
+    with pytest.raises(ValueError):
+        store.add_user("owner1", "pw", "owner", "ARG", db_path=db)
+    with pytest.raises(ValueError):
+        store.add_user("owner2", "pw", "owner", "LAX", db_path=db)
+
+    store.add_user("owner2", "pw", "owner", "ARG", db_path=db)
+    with pytest.raises(ValueError):
+        store.update_user("owner2", new_team_id="LAX", db_path=db)
+    store.update_user("owner2", new_password="new", new_team_id="", db_path=db)
+    assert store.load_users(db)[-1] == {
+        "username": "owner2", "password": "new", "role": "owner", "team_id": ""
+    }
+    with pytest.raises(ValueError):
+        store.update_user("ghost", new_password="x", db_path=db)
+
+
+def test_transaction_rolls_back_on_error(db):
+    team = store.load_teams(db)[0]
+    with pytest.raises(RuntimeError):
+        with store.transaction(db) as conn:
+            conn.execute("UPDATE teams SET stadium = 'Gone' WHERE team_id = ?", (team.team_id,))
+            raise RuntimeError
+    assert store.load_teams(db)[0] == team
+
+    team.stadium = "New Park"
+    team.primary_color = "abc"
+    store.save_team_settings(team, db)
+    saved = store.load_teams(db)[0]
+    assert (saved.stadium, saved.primary_color) == ("New Park", "#ABC")
+
+
+def test_savers_join_an_open_transaction(db):
+    trade = Trade("T1", "ABU", "BCH", ["P1"], ["P2"])
+    team = store.load_teams(db)[0]
+    team.stadium = "Joint Park"
+    with store.transaction(db):
+        store.save_trade(trade, db)
+        store.update_trade_status("T1", "accepted", db)
+        store.save_team_settings(team, db)
+        # A failing call inside the transaction undoes only its own changes.
+        with pytest.raises(ValueError):
+            store.update_trade_status("T2", "accepted", db)
+    assert store.load_trades(db, status="accepted") == [
+        Trade("T1", "ABU", "BCH", ["P1"], ["P2"], "accepted")
+    ]
+    assert store.load_teams(db)[0].stadium == "Joint Park"
+
+
+def test_joined_savers_roll_back_together(db):
+    team = store.load_teams(db)[0]
+    renamed = store.load_teams(db)[0]
+    renamed.stadium = "Never Built"
+    with pytest.raises(RuntimeError):
+        with store.transaction(db):
+            store.save_trade(Trade("T1", "ABU", "BCH", ["P1"], ["P2"]), db)
+            store.save_team_settings(renamed, db)
+            raise RuntimeError
+    assert store.load_trades(db) == []
+    assert store.load_teams(db)[0] == team
@@ -0,0 +1,95 @@
+import pytest
+
+from models.trade import Trade
+from utils.trade_utils import (
+    HISTORY_SUFFIX,
+    TradeJournal,
+    get_trade_journal,
+    load_trades,
+    save_trade,
+)
+
+
+def _trade(trade_id="T1", status="pending"):
+    return Trade(trade_id, "ABU", "BCH", ["P1"], ["P2", "P3"], status)
+
+
+def _rows(path):
+    return path.read_text().splitlines()
+
+
+def test_save_trade_appends_and_load_returns_current_state(tmp_path):
+    path = tmp_path / "trades.csv"
+    save_trade(_trade("T1"), str(path))
+    save_trade(_trade("T2"), str(path))
+    save_trade(_trade("T1"), str(path))  # unchanged, not recorded again
+    assert len(_rows(path)) == 3
+
+    save_trade(_trade("T1", "accepted"), str(path))
+    assert len(_rows(path)) == 4
+    assert load_trades(str(path)) == [_trade("T1", "accepted"), _trade("T2")]
+
+
+def test_existing_files_are_read_as_journals(tmp_path):
+    path = tmp_path / "trades.csv"
+    path.write_text(
+        "trade_id,from_team,to_team,give_player_ids,receive_player_ids,status\n"
+        "T1,ABU,BCH,P1,P2|P3,pending\n"
+        "T1,ABU,BCH,P1,P2|P3,rejected\n"
+    )
+    journal = TradeJournal(str(path))
+    assert journal.trades() == [_trade("T1", "rejected")]
+    assert journal.pending() == []
+    assert journal.superseded == 1
+
+
+def test_status_transitions_are_validated(tmp_path):
+    journal = TradeJournal(str(tmp_path / "trades.csv"))
+    journal.propose(_trade("T1", "accepted"))
+    assert journal.get("T1").status == "pending"
+    with pytest.raises(ValueError):
+        journal.propose(_trade("T1"))
+
+    assert journal.set_status("T1", "accepted").status == "accepted"
+    assert journal.pending() == [] and journal.trades("accepted") == [_trade("T1", "accepted")]
+    with pytest.raises(ValueError):
+        journal.set_status("T1", "rejected")
+    with pytest.raises(ValueError):
+        journal.set_status("T9", "accepted")
+
+
+def test_returned_trades_do_not_alias_the_index(tmp_path):
+    journal = TradeJournal(str(tmp_path / "trades.csv"))
+    journal.propose(_trade())
+    trade = journal.pending()[0]
+    trade.status = "accepted"
+    trade.give_player_ids.append("P9")
+    assert journal.get("T1") == _trade()
+
+
+def test_appends_by_other_writers_are_picked_up(tmp_path):
+    path = str(tmp_path / "trades.csv")
+    reader = get_trade_journal(path)
+    writer = TradeJournal(path)
+    writer.propose(_trade("T1"))
+    writer.set_status("T1", "rejected")
+    assert get_trade_journal(path) is reader
+    assert reader.trades() == [_trade("T1", "rejected")]
+
+
+def test_compaction_keeps_full_history(tmp_path):
+    path = tmp_path / "trades.csv"
+    journal = TradeJournal(str(path), compact_threshold=2)
+    journal.propose(_trade("T1"))
+    journal.propose(_trade("T2"))
+    journal.set_status("T1", "accepted")
+    assert len(_rows(path)) == 4
+
+    journal.set_status("T2", "rejected")  # second superseded row triggers compaction
+    assert len(_rows(path)) == 3
+    assert journal.superseded == 0
+    assert journal.trades() == [_trade("T1", "accepted"), _trade("T2", "rejected")]
+    assert [t.status for t in journal.history("T2")] == ["pending", "rejected"]
+    assert len(journal.history()) == 4
+    assert len(_rows(tmp_path / ("trades.csv" + HISTORY_SUFFIX))) == 3
+    assert TradeJournal(str(path)).trades() == journal.trades()
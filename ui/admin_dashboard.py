@@ -17,14 +17,13 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from ui.team_entry_dialog import TeamEntryDialog
 from ui.exhibition_game_dialog import ExhibitionGameDialog
-from utils.trade_utils import load_trades, save_trade
+from utils.trade_utils import get_trade_journal
 from utils.news_logger import log_news_event
-from utils.roster_loader import load_roster
-from utils.player_loader import load_players_from_csv
+from utils.roster_transaction import RosterTransaction
+from utils.league_repository import get_repository
 from utils.team_loader import load_teams
 from utils.user_manager import add_user, load_users, update_user
 from models.trade import Trade
-import csv
 import os
 from logic.league_creator import create_league
 
@@ -99,9 +98,11 @@ class AdminDashboard(QWidget):
         dialog.setWindowTitle("Review Pending Trades")
         dialog.setMinimumSize(600, 400)
 
-        trades = load_trades()
-        players = {p.player_id: p for p in load_players_from_csv("data/players.csv")}
-        teams = {t.team_id: t for t in load_teams("data/teams.csv")}
+        journal = get_trade_journal()
+        trades = journal.pending()
+        repo = get_repository()
+        players = repo.players("data/players.csv")
+        teams = repo.teams("data/teams.csv")
 
         layout = QVBoxLayout()
 
@@ -109,8 +110,6 @@ class AdminDashboard(QWidget):
         trade_map = {}
 
         for t in trades:
-            if t.status != "pending":
-                continue
             give_names = [f"{pid} ({players[pid].first_name} {players[pid].last_name})" for pid in t.give_player_ids if pid in players]
             recv_names = [f"{pid} ({players[pid].first_name} {players[pid].last_name})" for pid in t.receive_player_ids if pid in players]
             summary = f"{t.trade_id}: {t.from_team} → {t.to_team} | Give: {', '.join(give_names)} | Get: {', '.join(recv_names)}"
@@ -124,42 +123,27 @@ class AdminDashboard(QWidget):
             summary = selected.text()
             trade = trade_map[summary]
 
-            # Update rosters
-            from_roster = load_roster(trade.from_team)
-            to_roster = load_roster(trade.to_team)
-
-            for pid in trade.give_player_ids:
-                for level in ["act", "aaa", "low"]:
-                    if pid in getattr(from_roster, level):
-                        getattr(from_roster, level).remove(pid)
-                        getattr(to_roster, level).append(pid)
-                        break
-
-            for pid in trade.receive_player_ids:
-                for level in ["act", "aaa", "low"]:
-                    if pid in getattr(to_roster, level):
-                        getattr(to_roster, level).remove(pid)
-                        getattr(from_roster, level).append(pid)
-                        break
-
-            # Save updated rosters
-            def save_roster(roster):
-                path = f"data/rosters/{roster.team_id}.csv"
-                with open(path, "w", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=["player_id", "level"])
-                    writer.writeheader()
-                    for lvl in ["act", "aaa", "low"]:
-                        for pid in getattr(roster, lvl):
-                            writer.writerow({"player_id": pid, "level": lvl.upper()})
-
-            save_roster(from_roster)
-            save_roster(to_roster)
-
-            # Update trade status
-            trade.status = "accepted" if accept else "rejected"
-            save_trade(trade)
-
-            log_news_event(f"TRADE {'ACCEPTED' if accept else 'REJECTED'}: {summary}")
+            # Move the players of an accepted trade in one validated batch
+            if accept:
+                try:
+                    with RosterTransaction(players=players) as txn:
+                        txn.trade(
+                            trade.from_team,
+                            trade.to_team,
+                            trade.give_player_ids,
+                            trade.receive_player_ids,
+                        )
+                except ValueError as e:
+                    QMessageBox.warning(dialog, "Trade Not Processed", str(e))
+                    return
+
+            # Record the status change in the trade journal
+            trade = journal.set_status(trade.trade_id, "accepted" if accept else "rejected")
+
+            log_news_event(
+                f"TRADE {'ACCEPTED' if accept else 'REJECTED'}: {summary}",
+                teams=(trade.from_team, trade.to_team),
+            )
             QMessageBox.information(dialog, "Trade Processed", f"{summary} marked as {trade.status.upper()}.")
             trade_list.takeItem(trade_list.currentRow())
 
@@ -209,13 +193,14 @@ class AdminDashboard(QWidget):
         return
 
     def generate_player_avatars(self):
-        players = {p.player_id: p for p in load_players_from_csv("data/players.csv")}
-        teams = load_teams("data/teams.csv")
+        repo = get_repository()
+        players = repo.players("data/players.csv")
+        teams = list(repo.teams("data/teams.csv").values())
 
         player_ids = set()
         for t in teams:
             try:
-                roster = load_roster(t.team_id)
+                roster = repo.roster(t.team_id)
             except FileNotFoundError:
                 continue
             player_ids.update(roster.act + roster.aaa + roster.low)
@@ -12,8 +12,7 @@ from typing import Dict
 import os
 
 from utils.team_loader import load_teams
-from utils.player_loader import load_players_from_csv
-from utils.roster_loader import load_roster
+from utils.league_repository import get_repository
 from logic.simulation import GameSimulation, TeamState, generate_boxscore
 from models.pitcher import Pitcher
 from logic.playbalance_config import PlayBalanceConfig
@@ -69,11 +68,9 @@ class ExhibitionGameDialog(QDialog):
         )
 
     def _build_state(self, team_id: str) -> TeamState:
-        players = {
-            p.player_id: p
-            for p in load_players_from_csv(os.path.join(self._data_dir, "players.csv"))
-        }
-        roster = load_roster(team_id, os.path.join(self._data_dir, "rosters"))
+        repo = get_repository()
+        players = repo.players(os.path.join(self._data_dir, "players.csv"))
+        roster = repo.roster(team_id, os.path.join(self._data_dir, "rosters"))
 
         lineup = []
         bench = []
@@ -3,6 +3,8 @@ from PyQt6.QtGui import QPixmap
 from PyQt6.QtCore import Qt, QPropertyAnimation
 import os
 import csv
+from utils.league_repository import get_repository
+from utils.player_loader import iter_players
 from utils.pitcher_role import get_role
 
 class LineupEditor(QDialog):
@@ -190,40 +192,34 @@ class LineupEditor(QDialog):
         QMessageBox.information(self, "Lineup Saved", "Lineup saved successfully.")
 
     def load_players_dict(self):
-        players_file = os.path.join("data", "players.csv")
         players = {}
-        if os.path.exists(players_file):
-            with open(players_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    player_id = str(row.get("player_id", "")).strip()
-                    name = f"{row.get('first_name', '').strip()} {row.get('last_name', '').strip()}"
-                    primary = row.get("primary_position", "").strip()
-                    others = row.get("other_positions", "").strip().split("/") if row.get("other_positions") else []
-                    is_pitcher = row.get("is_pitcher") == "1"
-                    players[player_id] = {
-                        "name": f"{name} ({primary})",
-                        "primary_position": primary,
-                        "other_positions": others,
-                        "is_pitcher": is_pitcher,
-                        "ratings": {
-                            "CH": row.get("CH", ""),
-                            "PH": row.get("PH", ""),
-                            "SP": row.get("SP", "")
-                        }
-                    }
+        players_file = os.path.join("data", "players.csv")
+        if not os.path.exists(players_file):
+            return players
+        columns = (
+            "player_id", "first_name", "last_name", "primary_position",
+            "other_positions", "is_pitcher", "ch", "ph", "sp",
+        )
+        for p in iter_players(players_file, columns):
+            players[p.player_id] = {
+                "name": f"{p.first_name} {p.last_name} ({p.primary_position})",
+                "primary_position": p.primary_position,
+                "other_positions": list(p.other_positions),
+                "is_pitcher": p.is_pitcher,
+                "ratings": {
+                    "CH": "" if p.is_pitcher or p.ch is None else p.ch,
+                    "PH": "" if p.is_pitcher or p.ph is None else p.ph,
+                    "SP": "" if p.is_pitcher or p.sp is None else p.sp,
+                },
+            }
         return players
 
     def get_act_level_ids(self):
-        act_ids = set()
-        act_roster_file = os.path.join("data", "rosters", f"{self.team_id}.csv")
-        if os.path.exists(act_roster_file):
-            with open(act_roster_file, "r", encoding="utf-8") as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 2 and row[1].strip().upper() == "ACT":
-                        act_ids.add(row[0].strip())
-        return act_ids
+        try:
+            roster = get_repository().roster(self.team_id, os.path.join("data", "rosters"))
+        except FileNotFoundError:
+            return set()
+        return set(roster.act)
 
     def switch_view(self):
         self.current_view = self.view_selector.currentText()
@@ -35,11 +35,12 @@ from ui.transactions_window import TransactionsWindow
 from ui.team_settings_dialog import TeamSettingsDialog
 from ui.standings_window import StandingsWindow
 from ui.schedule_window import ScheduleWindow
-from utils.roster_loader import load_roster, save_roster
-from utils.player_loader import load_players_from_csv
+from utils.roster_loader import save_roster
+from utils.roster_transaction import validate_roster
+from utils.league_repository import get_repository
 from utils.news_reader import read_latest_news
 from utils.free_agent_finder import find_free_agents
-from utils.team_loader import load_teams, save_team_settings
+from utils.team_loader import save_team_settings
 from utils.pitcher_role import get_role
 
 
@@ -73,10 +74,10 @@ class OwnerDashboard(QWidget):
         self.unsaved_changes = False
 
         # Data
-        self.players = {p.player_id: p for p in load_players_from_csv("data/players.csv")}
-        self.roster = load_roster(team_id)
-        teams = {t.team_id: t for t in load_teams()}
-        self.team = teams.get(team_id)
+        repo = get_repository()
+        self.players = repo.players("data/players.csv")
+        self.roster = repo.roster(team_id)
+        self.team = repo.teams().get(team_id)
 
         # Window
         self.setGeometry(200, 200, 900, 650)
@@ -340,29 +341,10 @@ class OwnerDashboard(QWidget):
             self.update_window_title()
 
     def save_roster(self):
-        act_total = len(self.roster.act)
-        aaa_total = len(self.roster.aaa)
-        low_total = len(self.roster.low)
-        # Count ACT position players (not pitchers)
-        act_pos_players = 0
-        for pid in self.roster.act:
-            p = self.players.get(pid)
-            if not p:
-                continue
-            if not get_role(p):
-                act_pos_players += 1
         # Validations per spec
-        if act_total > 25:
-            QMessageBox.warning(self, "Validation Error", "Active roster cannot exceed 25 players.")
-            return
-        if act_pos_players < 11:
-            QMessageBox.warning(self, "Validation Error", "Active roster must have at least 11 position players.")
-            return
-        if aaa_total > 15:
-            QMessageBox.warning(self, "Validation Error", "AAA roster cannot exceed 15 players.")
-            return
-        if low_total > 10:
-            QMessageBox.warning(self, "Validation Error", "LOW roster cannot exceed 10 players.")
+        errors = validate_roster(self.roster, self.players)
+        if errors:
+            QMessageBox.warning(self, "Validation Error", errors[0])
             return
         try:
             save_roster(self.team_id, self.roster)
@@ -377,12 +359,16 @@ class OwnerDashboard(QWidget):
 
     def sign_free_agent(self):
         try:
-            free_agents = find_free_agents(self.players, self.roster)
+            signed = set(self.roster.act + self.roster.aaa + self.roster.low)
+            free_agents = [
+                p for p in find_free_agents(self.players.values())
+                if p.player_id not in signed
+            ]
             if not free_agents:
                 QMessageBox.information(self, "Free Agents", "No free agents available to sign.")
                 return
             # For now, auto-sign the first free agent to ACT (can be replaced with a dialog)
-            pid = free_agents[0]
+            pid = free_agents[0].player_id
             self.roster.act.append(pid)
             self.refresh_roster_views()
             self.update_roster_count_display()
@@ -393,7 +379,7 @@ class OwnerDashboard(QWidget):
 
     def load_news_feed(self):
         try:
-            self.news_feed.setPlainText(read_latest_news("data/news_feed.txt"))
+            self.news_feed.setPlainText("".join(read_latest_news()))
         except Exception as e:
             self.news_feed.setPlainText(f"(Failed to load news)\n{e}")
 
@@ -12,9 +12,8 @@ from typing import Callable, Dict, Optional
 from PIL import Image
 
 from images.avatars import generate_player_headshot
-from utils.player_loader import load_players_from_csv
-from utils.team_loader import load_teams
-from utils.roster_loader import load_roster
+from utils.league_repository import get_repository
+from utils.roster_index import get_roster_index
 
 
 def generate_player_avatars(
@@ -55,20 +54,15 @@ def generate_player_avatars(
             ip_adapter_path=ip_adapter_path,
         )
 
+    repo = get_repository()
     if players is None:
-        players = {p.player_id: p for p in load_players_from_csv("data/players.csv")}
+        players = repo.players("data/players.csv")
     if teams is None:
-        teams = load_teams("data/teams.csv")
-
-    # Map each player ID to their team ID via roster files
-    player_team: Dict[str, str] = {}
-    for t in teams:
-        try:
-            roster = load_roster(t.team_id)
-        except FileNotFoundError:
-            continue
-        for pid in roster.act + roster.aaa + roster.low:
-            player_team[pid] = t.team_id
+        teams = list(repo.teams("data/teams.csv").values())
+
+    # Map each player ID to one of ``teams`` via the roster index
+    team_map = {t.team_id: t for t in teams}
+    player_team = get_roster_index().player_teams(team_map)
 
     # Determine total number of players that will have avatars generated
     total = sum(1 for pid in players if pid in player_team)
@@ -79,7 +73,6 @@ def generate_player_avatars(
         out_dir = os.path.join(base_dir, "images", "avatars")
     os.makedirs(out_dir, exist_ok=True)
 
-    team_map = {t.team_id: t for t in teams}
     for pid, player in players.items():
         team_id = player_team.get(pid)
         if not team_id:
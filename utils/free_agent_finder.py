@@ -1,19 +1,31 @@
-import os
-import csv
+from utils.player_loader import iter_players
+from utils.roster_index import get_roster_index
+
+FREE_AGENT_COLUMNS = ("player_id", "first_name", "last_name", "primary_position", "is_pitcher")
+
 
 def find_free_agents(players, roster_dir="data/rosters"):
     """Return a list of Player/Pitcher objects not assigned to any roster."""
-    assigned_ids = set()
+    index = get_roster_index(roster_dir)
+    return index.free_agents(players)
+
 
-    # Check all roster files and collect player_ids
-    for filename in os.listdir(roster_dir):
-        if filename.endswith(".csv"):
-            with open(os.path.join(roster_dir, filename), mode="r", newline="") as f:
-                reader = csv.reader(f)
-                next(reader, None)  # skip header if present
-                for row in reader:
-                    if row:
-                        assigned_ids.add(row[0].strip())
+def iter_free_agents(
+    players_file="data/players.csv",
+    roster_dir="data/rosters",
+    columns=FREE_AGENT_COLUMNS,
+    where=None,
+):
+    """Yield lightweight records of the unassigned players in ``players_file``.
 
-    # Return only those players not assigned to any team
-    return [p for p in players if p.player_id not in assigned_ids]
+    ``columns`` and ``where`` are passed to
+    :func:`utils.player_loader.iter_players`; rostered players are skipped
+    before their other columns are parsed.  ``where`` cannot filter on
+    ``player_id``, which is used for the roster check.
+    """
+    conditions = dict(where or {})
+    if "player_id" in conditions:
+        raise ValueError("iter_free_agents cannot filter on player_id")
+    index = get_roster_index(roster_dir)
+    conditions["player_id"] = lambda pid: pid not in index
+    return iter_players(players_file, columns, conditions)
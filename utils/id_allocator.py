@@ -0,0 +1,189 @@
+"""Collision-free player ids with a persistent high-water mark.
+
+Player ids used to be ``P`` followed by a random four digit number, so a
+league of a few thousand players was all but certain to contain duplicates.
+:class:`PlayerIdAllocator` instead hands out ``P1000``, ``P1001``... in
+order and records the next free number in ``player_ids.json`` next to the
+league's ``players.csv``.  Numbers past ``9999`` simply grow a digit
+(``P10000``), so existing ``P####`` ids stay valid and the id space is
+unbounded.
+
+Ids are reserved in blocks.  :meth:`PlayerIdAllocator.reserve` persists the
+new high-water mark before returning an :class:`IdBlock`, which can be sent
+to a worker process and turned into ids there without further
+coordination.  Ids of a block that are never used are skipped, never
+reissued.  When no state file exists yet the high-water mark starts above
+the largest id in ``players.csv``.  Reservations are expected to come from
+one process at a time.  An allocator without a state file keeps the mark in
+memory only, for ids that never reach a saved league.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional
+
+ID_STATE_FILE = "player_ids.json"
+STATE_VERSION = 1
+
+PREFIX = "P"
+WIDTH = 4
+FIRST_NUMBER = 1000
+BLOCK_SIZE = 100
+
+_PLAYER_ID = re.compile(r"^P(\d+)$")
+
+
+def format_player_id(number: int) -> str:
+    """Return the id for ``number``, e.g. ``P1234`` or ``P123456``."""
+
+    return f"{PREFIX}{number:0{WIDTH}d}"
+
+
+def parse_player_id(player_id: str) -> Optional[int]:
+    """Return the number of a ``P####`` id, or ``None`` for other ids."""
+
+    match = _PLAYER_ID.match(player_id or "")
+    return int(match.group(1)) if match else None
+
+
+@dataclass(frozen=True)
+class IdBlock:
+    """The reserved numbers ``start`` to ``stop - 1``."""
+
+    start: int
+    stop: int
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __iter__(self) -> Iterator[str]:
+        return (format_player_id(n) for n in range(self.start, self.stop))
+
+
+class PlayerIdAllocator:
+    """Reserve player ids in blocks and persist the high-water mark.
+
+    Parameters
+    ----------
+    state_path:
+        JSON file holding the next free number.  ``None`` keeps it in memory
+        and writes nothing.
+    players_file:
+        ``players.csv`` scanned for the largest existing id when
+        ``state_path`` does not exist yet.
+    block_size:
+        Number of ids :meth:`allocate` reserves at a time.
+    """
+
+    def __init__(
+        self,
+        state_path: Optional[str] = None,
+        players_file: Optional[str] = None,
+        block_size: int = BLOCK_SIZE,
+    ) -> None:
+        self.state_path = state_path
+        self.players_file = players_file
+        self.block_size = block_size
+        self._next = self._read_state()
+        if self._next is None:
+            self._next = self._scan_players()
+        self._block: Iterator[str] = iter(())
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+    def _read_state(self) -> Optional[int]:
+        if self.state_path is None:
+            return None
+        try:
+            with open(self.state_path, "r") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != STATE_VERSION:
+            return None
+        return int(data["next"])
+
+    def _write_state(self) -> None:
+        if self.state_path is None:
+            return
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as fh:
+            json.dump({"version": STATE_VERSION, "next": self._next}, fh)
+        os.replace(tmp_path, self.state_path)
+
+    def _scan_players(self) -> int:
+        if not self.players_file or not os.path.exists(self.players_file):
+            return FIRST_NUMBER
+        from utils.player_loader import iter_players
+
+        return self.observe(r.player_id for r in iter_players(self.players_file, ("player_id",)))
+
+    @property
+    def next_number(self) -> int:
+        """The first number not yet reserved."""
+
+        return self._next
+
+    def observe(self, player_ids: Iterable[str]) -> int:
+        """Move the high-water mark past every id in ``player_ids``.
+
+        Returns the new next free number.  The state file is written on the
+        next reservation.
+        """
+
+        highest = max(
+            (n for n in map(parse_player_id, player_ids) if n is not None), default=-1
+        )
+        self._next = max(self._next or FIRST_NUMBER, highest + 1)
+        return self._next
+
+    def reset(self, start: int = FIRST_NUMBER) -> None:
+        """Start numbering at ``start`` again, e.g. for a brand new league."""
+
+        self._next = start
+        self._block = iter(())
+        self._write_state()
+
+    # ------------------------------------------------------------------
+    # Reservations
+    # ------------------------------------------------------------------
+    def reserve(self, count: int) -> IdBlock:
+        """Reserve ``count`` consecutive ids and persist the new mark."""
+
+        stored = self._read_state()
+        if stored is not None and stored > self._next:
+            self._next = stored
+        block = IdBlock(self._next, self._next + count)
+        self._next = block.stop
+        self._write_state()
+        return block
+
+    def allocate(self) -> str:
+        """Return the next id, reserving a new block when needed."""
+
+        player_id = next(self._block, None)
+        if player_id is None:
+            self._block = iter(self.reserve(self.block_size))
+            player_id = next(self._block)
+        return player_id
+
+
+_ALLOCATORS: Dict[str, PlayerIdAllocator] = {}
+
+
+def get_id_allocator(data_dir: str = "data") -> PlayerIdAllocator:
+    """Return the process-wide :class:`PlayerIdAllocator` of the league in ``data_dir``."""
+
+    key = os.path.abspath(data_dir)
+    allocator = _ALLOCATORS.get(key)
+    if allocator is None:
+        allocator = _ALLOCATORS[key] = PlayerIdAllocator(
+            os.path.join(data_dir, ID_STATE_FILE),
+            os.path.join(data_dir, "players.csv"),
+        )
+    return allocator
@@ -0,0 +1,139 @@
+"""Process-wide cache of league data files.
+
+Dashboards, dialogs, avatar generators and the simulation all need the same
+players, teams, rosters and lineups.  :class:`LeagueRepository` parses each
+file once and serves the parsed objects to every caller until the file
+changes on disk.  A file counts as changed when its modification time or size
+differs from when it was loaded, so writes made through the existing savers
+(``save_roster``, ``save_team_settings``, ``save_lineup``...) are picked up
+on the next access without extra bookkeeping.
+
+Players and teams are returned as read-only mappings that share the cached
+objects; do not modify those objects in place.  Rosters and lineups are
+small and are returned as fresh copies, because callers edit them before
+saving.
+
+League players files are parsed through the binary sidecar of
+:func:`~utils.player_loader.load_players_from_csv`, which is written next to
+the CSV.
+"""
+
+from __future__ import annotations
+
+import os
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
+
+from models.base_player import BasePlayer
+from models.roster import Roster
+from models.team import Team
+from utils.player_loader import load_players_from_csv
+from utils.roster_loader import load_roster
+from utils.team_loader import load_teams
+
+T = TypeVar("T")
+
+# ``(st_mtime_ns, st_size)`` of a file when it was parsed.
+_Stamp = Tuple[int, int]
+
+
+def _stamp(path: str) -> _Stamp:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+class LeagueRepository:
+    """Cache of parsed league files keyed by path and invalidated by mtime."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, str], Tuple[_Stamp, object]] = {}
+        self.loads = 0  # number of files parsed, for diagnostics and tests
+
+    def _get(self, kind: str, path: str, loader: Callable[[], T]) -> T:
+        key = (kind, os.path.abspath(path))
+        stamp = _stamp(path)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]  # type: ignore[return-value]
+        value = loader()
+        self.loads += 1
+        self._entries[key] = (stamp, value)
+        return value
+
+    # ------------------------------------------------------------------
+    # Accessors
+    # ------------------------------------------------------------------
+    def players(self, file_path: str = "data/players.csv") -> Mapping[str, BasePlayer]:
+        """Return all players in ``file_path`` indexed by ``player_id``."""
+
+        return self._get(
+            "players",
+            file_path,
+            lambda: MappingProxyType(
+                {
+                    p.player_id: p
+                    for p in load_players_from_csv(file_path, use_cache=True)
+                }
+            ),
+        )
+
+    def teams(self, file_path: str = "data/teams.csv") -> Mapping[str, Team]:
+        """Return all teams in ``file_path`` indexed by ``team_id`` in file order."""
+
+        return self._get(
+            "teams",
+            file_path,
+            lambda: MappingProxyType({t.team_id: t for t in load_teams(file_path)}),
+        )
+
+    def roster(self, team_id: str, roster_dir: str = "data/rosters") -> Roster:
+        """Return a copy of ``team_id``'s roster from ``roster_dir``.
+
+        Raises :class:`FileNotFoundError` when the team has no roster file,
+        like :func:`utils.roster_loader.load_roster`.
+        """
+
+        path = os.path.join(roster_dir, f"{team_id}.csv")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Roster file not found: {path}")
+        cached = self._get("roster", path, lambda: load_roster(team_id, roster_dir))
+        return Roster(
+            team_id=cached.team_id,
+            act=list(cached.act),
+            aaa=list(cached.aaa),
+            low=list(cached.low),
+        )
+
+    def lineup(
+        self, team_id: str, vs: str = "lhp", lineup_dir: str = "data/lineups"
+    ) -> List[Tuple[str, str]]:
+        """Return a copy of the ``(player_id, position)`` lineup for ``team_id``."""
+
+        from utils.lineup_loader import load_lineup
+
+        path = os.path.join(lineup_dir, f"{team_id}_vs_{vs.lower()}.csv")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Lineup file not found: {path}")
+        cached = self._get(
+            "lineup", path, lambda: load_lineup(team_id, vs, lineup_dir)
+        )
+        return list(cached)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Forget the cached copy of ``path``, or of every file when omitted."""
+
+        if path is None:
+            self._entries.clear()
+            return
+        target = os.path.abspath(path)
+        for key in [k for k in self._entries if k[1] == target]:
+            del self._entries[key]
+
+
+_REPOSITORY = LeagueRepository()
+
+
+def get_repository() -> LeagueRepository:
+    """Return the process-wide :class:`LeagueRepository`."""
+
+    return _REPOSITORY
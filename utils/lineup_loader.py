@@ -5,8 +5,7 @@ from typing import List, Tuple, Iterable
 from logic.simulation import TeamState
 from models.player import Player
 from models.pitcher import Pitcher
-from .player_loader import load_players_from_csv
-from .roster_loader import load_roster
+from .league_repository import get_repository
 from .pitcher_role import get_role
 
 
@@ -33,6 +32,28 @@ def load_lineup(team_id: str, vs: str = "lhp", lineup_dir: str = "data/lineups")
     return lineup
 
 
+def save_lineup(
+    team_id: str,
+    vs: str,
+    lineup: Iterable[Tuple[str, str]],
+    lineup_dir: str = "data/lineups",
+) -> str:
+    """Write ``(player_id, position)`` pairs as a lineup file.
+
+    The file uses the same ``{team_id}_vs_{vs}.csv`` name and
+    ``order,player_id,position`` columns read by :func:`load_lineup`.  The
+    path of the written file is returned.
+    """
+    os.makedirs(lineup_dir, exist_ok=True)
+    file_path = os.path.join(lineup_dir, f"{team_id}_vs_{vs.lower()}.csv")
+    with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["order", "player_id", "position"])
+        for order, (player_id, position) in enumerate(lineup, start=1):
+            writer.writerow([order, player_id, position])
+    return file_path
+
+
 def _separate_players(players: Iterable[Player]) -> Tuple[List[Player], List[Pitcher]]:
     """Return hitters and pitchers from ``players``.
 
@@ -61,10 +82,9 @@ def _build_default_lists(team_id: str, players_file: str, roster_dir: str) -> Tu
     single starter first followed by the remaining bullpen arms.
     """
 
-    all_players = {
-        p.player_id: p for p in load_players_from_csv(players_file)
-    }
-    roster = load_roster(team_id, roster_dir)
+    repo = get_repository()
+    all_players = repo.players(players_file)
+    roster = repo.roster(team_id, roster_dir)
 
     active = [all_players.get(pid) for pid in roster.act]
     active = [p for p in active if p is not None]
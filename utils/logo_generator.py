@@ -2,7 +2,9 @@
 
 Creates simple team logos using the :mod:`images.auto_logo` module. Logos are
 written to ``logo/teams`` relative to the repository root and named after the
-team's ID (lower‑cased).
+team's ID (lower‑cased).  Rendered logos are kept in a content-addressed
+cache (``logo/teams/.cache``), so only teams whose name, colours or logo
+settings changed are rendered again.
 """
 from __future__ import annotations
 
@@ -17,6 +19,8 @@ def generate_team_logos(
     out_dir: str | None = None,
     size: int = 512,
     progress_callback: Optional[Callable[[int, int], None]] = None,
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
 ) -> str:
     """Generate logos for all teams and return the output directory.
 
@@ -29,7 +33,14 @@ def generate_team_logos(
         Pixel size for the generated square logos.
     progress_callback:
         Optional callback receiving ``(completed, total)`` after each logo is
-        saved.
+        saved.  It is always called from the calling process.
+    workers:
+        Number of worker processes rendering logos.  Defaults to one per CPU
+        core; ``1`` renders in the calling process.
+    cache_dir:
+        Directory of cached renders.  Defaults to ``.cache`` inside
+        ``out_dir``.  Renders of earlier team settings are deleted once the
+        logos are written.
     """
 
     teams = load_teams("data/teams.csv")
@@ -51,6 +62,8 @@ def generate_team_logos(
         base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         out_dir = os.path.join(base_dir, "logo", "teams")
     os.makedirs(out_dir, exist_ok=True)
+    if cache_dir is None:
+        cache_dir = os.path.join(out_dir, ".cache")
     total = len(specs)
     completed = 0
 
@@ -60,5 +73,12 @@ def generate_team_logos(
         if progress_callback:
             progress_callback(completed, total)
 
-    batch_generate(specs, out_dir=out_dir, size=size, callback=cb)
+    batch_generate(
+        specs,
+        out_dir=out_dir,
+        size=size,
+        callback=cb,
+        workers=workers,
+        cache_dir=cache_dir,
+    )
     return out_dir
@@ -0,0 +1,251 @@
+"""Segmented, rotating news feed log.
+
+New events are appended to the active file (``data/news_feed.txt``).  Once
+it grows past ``max_segment_bytes`` it is renamed to a numbered segment
+(``news_feed.000001.txt``, ``news_feed.000002.txt``...) and a fresh active
+file is started.  A small index (``news_feed.index.json``) records each
+archived segment's entry count and per-team counts.
+
+The latest entries are read by seeking backwards from the end of the
+files, newest segment first.  Paging and per-team filtering use the index
+counts to skip whole segments, so neither scans the full history.
+
+Each line is ``[timestamp] event``.  Events tagged with teams are written
+as ``[timestamp] {ABU,BCH} event``; the tag is removed when entries are
+displayed.  Untagged events whose text starts with ``{`` get an empty
+``{}`` tag so the text is not mistaken for one.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+NEWS_FILE = "data/news_feed.txt"
+MAX_SEGMENT_BYTES = 256 * 1024
+INDEX_VERSION = 1
+
+_LINE = re.compile(r"^\[(?P<ts>[^\]]*)\] (?:\{(?P<teams>[A-Za-z0-9_,]*)\} )?(?P<text>.*)$")
+
+
+class NewsEntry(NamedTuple):
+    """One line of the news feed."""
+
+    timestamp: str
+    teams: Tuple[str, ...]
+    text: str
+
+    def display(self) -> str:
+        """Return the line as shown to users, without the team tag."""
+
+        if not self.timestamp:
+            return f"{self.text}\n"
+        return f"[{self.timestamp}] {self.text}\n"
+
+
+def parse_line(line: str) -> NewsEntry:
+    line = line.rstrip("\r\n")
+    match = _LINE.match(line)
+    if match is None:
+        return NewsEntry("", (), line)
+    teams = match.group("teams")
+    return NewsEntry(
+        match.group("ts"),
+        tuple(t for t in teams.split(",") if t) if teams else (),
+        match.group("text"),
+    )
+
+
+def format_line(entry: NewsEntry) -> str:
+    if entry.teams or entry.text.startswith("{"):
+        tag = f"{{{','.join(entry.teams)}}} "
+    else:
+        tag = ""
+    return f"[{entry.timestamp}] {tag}{entry.text}\n"
+
+
+def reverse_lines(path: str, block_size: int = 8192) -> Iterator[str]:
+    """Yield the non-empty lines of ``path`` from last to first.
+
+    The file is read in ``block_size`` chunks from the end, so taking the
+    first few lines costs the same however long the file is.
+    """
+
+    try:
+        fh = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with fh:
+        pos = fh.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            fh.seek(pos)
+            lines = (fh.read(step) + tail).split(b"\n")
+            # The first piece may be the end of a line in an earlier block.
+            tail = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line.decode("utf-8")
+        if tail:
+            yield tail.decode("utf-8")
+
+
+class NewsLog:
+    """Append to and read from a segmented news feed.
+
+    Parameters
+    ----------
+    file_path:
+        Path of the active segment; archived segments and the index are
+        stored next to it.
+    max_segment_bytes:
+        Size at which the active segment is rotated.
+    max_segments:
+        Number of archived segments to keep, or ``None`` to keep them all.
+    """
+
+    def __init__(
+        self,
+        file_path: str = NEWS_FILE,
+        max_segment_bytes: int = MAX_SEGMENT_BYTES,
+        max_segments: Optional[int] = None,
+    ) -> None:
+        self.file_path = file_path
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        stem, self._ext = os.path.splitext(file_path)
+        self._stem = stem
+        self.index_path = f"{stem}.index.json"
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+    def segments(self) -> List[Dict[str, object]]:
+        """Return the archived segments, oldest first."""
+
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return []
+        if data.get("version") != INDEX_VERSION:
+            return []
+        return data.get("segments", [])
+
+    def _write_index(self, segments: List[Dict[str, object]]) -> None:
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"version": INDEX_VERSION, "segments": segments}, fh)
+        os.replace(tmp_path, self.index_path)
+
+    def _segment_path(self, name: str) -> str:
+        return os.path.join(os.path.dirname(self.file_path), name)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def append(
+        self, event: str, teams: Iterable[str] = (), timestamp: Optional[str] = None
+    ) -> None:
+        """Append ``event``, tagged with ``teams``, and rotate when full."""
+
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        line = format_line(NewsEntry(timestamp, tuple(teams), event))
+        with open(self.file_path, mode="a", encoding="utf-8") as f:
+            f.write(line)
+            size = f.tell()
+        if size >= self.max_segment_bytes:
+            self.rotate()
+
+    def rotate(self) -> None:
+        """Archive the active segment and record it in the index."""
+
+        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
+            return
+        entries = 0
+        teams: Dict[str, int] = {}
+        first = last = ""
+        with open(self.file_path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                entry = parse_line(line)
+                entries += 1
+                first = first or entry.timestamp
+                last = entry.timestamp or last
+                for team in entry.teams:
+                    teams[team] = teams.get(team, 0) + 1
+
+        segments = self.segments()
+        seq = segments[-1]["seq"] + 1 if segments else 1
+        name = f"{os.path.basename(self._stem)}.{seq:06d}{self._ext}"
+        os.replace(self.file_path, self._segment_path(name))
+        segments.append(
+            {
+                "seq": seq,
+                "file": name,
+                "entries": entries,
+                "first": first,
+                "last": last,
+                "teams": teams,
+            }
+        )
+        if self.max_segments is not None:
+            while len(segments) > self.max_segments:
+                old = segments.pop(0)
+                try:
+                    os.remove(self._segment_path(old["file"]))
+                except FileNotFoundError:
+                    pass
+        self._write_index(segments)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def entries(self, team_id: Optional[str] = None, skip: int = 0) -> Iterator[NewsEntry]:
+        """Yield entries newest first, optionally only those tagged ``team_id``.
+
+        The first ``skip`` matching entries are passed over; archived
+        segments that hold no more than the remaining skip are not read.
+        """
+
+        sources: List[Tuple[str, Optional[int]]] = [(self.file_path, None)]
+        for segment in reversed(self.segments()):
+            if team_id is None:
+                count = segment["entries"]
+            else:
+                count = segment["teams"].get(team_id, 0)
+            sources.append((self._segment_path(segment["file"]), count))
+
+        for path, count in sources:
+            if count is not None and count <= skip:
+                skip -= count
+                continue
+            for line in reverse_lines(path):
+                if not line.strip():
+                    continue
+                entry = parse_line(line)
+                if team_id is not None and team_id not in entry.teams:
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+                yield entry
+
+    def latest(self, n: int = 10, page: int = 0, team_id: Optional[str] = None) -> List[NewsEntry]:
+        """Return page ``page`` of ``n`` entries, newest first."""
+
+        result = []
+        if n <= 0:
+            return result
+        for entry in self.entries(team_id, skip=page * n):
+            result.append(entry)
+            if len(result) == n:
+                break
+        return result
@@ -1,10 +1,10 @@
-import os
-from datetime import datetime
+from utils.news_log import NEWS_FILE, NewsLog
 
-NEWS_FILE = "data/news_feed.txt"
+def log_news_event(event: str, file_path: str = NEWS_FILE, teams=()):
+    """Appends a timestamped news event to the news feed file.
 
-def log_news_event(event: str, file_path: str = NEWS_FILE):
-    """Appends a timestamped news event to the news feed file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(file_path, mode="a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {event}\n")
+    ``teams`` tags the event with team ids so it can be filtered per team.
+    The feed rotates into numbered segments as it grows; see
+    :mod:`utils.news_log`.
+    """
+    NewsLog(file_path).append(event, teams)
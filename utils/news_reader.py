@@ -1,8 +1,11 @@
-def read_latest_news(n=10, file_path="data/news_feed.txt"):
-    """Returns the latest N news items as a list of strings (most recent first)."""
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        return list(reversed(lines[-n:]))
-    except FileNotFoundError:
-        return []
+from utils.news_log import NEWS_FILE, NewsLog
+
+def read_latest_news(n=10, file_path=NEWS_FILE, page=0, team_id=None):
+    """Returns the latest N news items as a list of strings (most recent first).
+
+    ``page`` selects older items, ``n`` at a time, and ``team_id`` limits
+    the items to events tagged with that team.  Only the end of the feed is
+    read, not the whole history.
+    """
+    entries = NewsLog(file_path).latest(n, page=page, team_id=team_id)
+    return [entry.display() for entry in entries]
@@ -1,7 +1,20 @@
 import csv
+import hashlib
+import marshal
+import os
+from collections import namedtuple
+from functools import lru_cache
 from models.player import Player
 from models.pitcher import Pitcher
 
+# Binary sidecar written next to a players CSV.  It holds the parsed players
+# as plain tuples so they can be rebuilt without re-validating every field.
+# Bump ``CACHE_VERSION`` whenever the player models or the parsing change;
+# the marshal format version is part of the key as well.
+CACHE_SUFFIX = ".cache"
+CACHE_VERSION = 1
+_CACHE_CLASSES = {"Player": Player, "Pitcher": Pitcher}
+
 
 def _required_int(row, key):
     value = row.get(key)
@@ -17,115 +30,310 @@ def _optional_int(row, key, default=0):
     return int(value)
 
 
-def load_players_from_csv(file_path):
-    players = []
+def load_players_from_csv(file_path, use_cache=False, compact=False, cache_path=None):
+    """Return the players stored in ``file_path``.
+
+    With ``compact`` the players are returned as the slotted
+    :class:`~models.compact_player.CompactPlayer` and
+    :class:`~models.compact_player.CompactPitcher` variants.
+
+    With ``use_cache`` the parsed players are saved to a binary sidecar and
+    later calls load them from it.  The sidecar is written to ``cache_path``,
+    or next to the CSV (``players.csv.cache``) when no path is given.  It is
+    only used when the CSV's size, modification time and SHA-256 digest all
+    match the values recorded with it; otherwise the CSV is parsed again and
+    the sidecar rewritten.
+    """
+
+    if compact:
+        from models.compact_player import to_compact
+
+        players = load_players_from_csv(file_path, use_cache, cache_path=cache_path)
+        return [to_compact(p) for p in players]
+    if not use_cache:
+        return _parse_players_csv(file_path)
+
+    with open(file_path, "rb") as fh:
+        content = fh.read()
+    st = os.stat(file_path)
+    key = (
+        CACHE_VERSION,
+        marshal.version,
+        st.st_size,
+        st.st_mtime_ns,
+        hashlib.sha256(content).hexdigest(),
+    )
+    if cache_path is None:
+        cache_path = os.fspath(file_path) + CACHE_SUFFIX
+
+    players = _read_player_cache(cache_path, key)
+    if players is None:
+        players = _parse_players_csv(file_path)
+        _write_player_cache(cache_path, key, players)
+    return players
+
+
+def _to_int(value):
+    return int(value) if value != "" else None
+
+
+def _to_optional_str(value):
+    return value or None
+
+
+def _to_positions(value):
+    return tuple(value.split("|")) if value else ()
+
+
+def _to_is_pitcher(value):
+    return value.strip().lower() in {"true", "1", "yes"}
+
+
+def _to_bool(value):
+    return value.strip().lower() == "true"
+
+
+# Conversion applied by ``iter_players`` to each projected column; columns
+# not listed here are ratings and become ``int`` (``None`` when blank).
+_COLUMN_CONVERTERS = {
+    "player_id": str,
+    "first_name": str,
+    "last_name": str,
+    "birthdate": str,
+    "bats": str,
+    "primary_position": str,
+    "role": str,
+    "other_positions": _to_positions,
+    "is_pitcher": _to_is_pitcher,
+    "injured": _to_bool,
+    "injury_description": _to_optional_str,
+    "return_date": _to_optional_str,
+}
+
+
+@lru_cache(maxsize=None)
+def _record_type(columns):
+    return namedtuple("PlayerRecord", columns)
+
+
+def _matcher(condition):
+    if callable(condition):
+        return condition
+    if isinstance(condition, (set, frozenset, list, tuple)):
+        allowed = frozenset(condition)
+        return lambda value: value in allowed
+    return lambda value: value == condition
+
+
+def iter_players(file_path, columns=None, where=None):
+    """Yield lightweight records for the players in ``file_path``.
+
+    Only the requested ``columns`` (CSV header names, all of them when
+    omitted) are converted.  Each record is a ``PlayerRecord`` named tuple
+    with those fields, in that order.  Ratings become ``int`` or ``None``
+    when blank, ``other_positions`` a tuple, and ``is_pitcher`` and
+    ``injured`` booleans.
+
+    ``where`` maps column names to a value, a collection of accepted values
+    or a predicate.  A row is skipped as soon as one of its conditions
+    fails, before the remaining columns are converted::
+
+        iter_players(path, ("player_id", "last_name"), where={"is_pitcher": False})
+
+    Raises :class:`ValueError` for a column the file does not have.
+    """
+
+    where = dict(where or {})
     with open(file_path, mode="r", newline="") as csvfile:
-        reader = csv.DictReader(csvfile)
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return
+        positions = {name: i for i, name in enumerate(header)}
+        columns = tuple(header if columns is None else columns)
+        missing = [c for c in (*columns, *where) if c not in positions]
+        if missing:
+            raise ValueError(f"Unknown player columns: {missing}")
+
+        def field(name):
+            return positions[name], _COLUMN_CONVERTERS.get(name, _to_int)
+
+        fields = [field(name) for name in columns]
+        filters = [(*field(name), _matcher(cond)) for name, cond in where.items()]
+        width = len(header)
+        record = _record_type(columns)._make
+
         for row in reader:
-            is_pitcher_value = row.get("is_pitcher", "").strip().lower()
-            is_pitcher = is_pitcher_value in {"true", "1", "yes"}
-
-            height = _required_int(row, "height")
-            weight = _required_int(row, "weight")
-            gf = _required_int(row, "gf")
-
-            common_kwargs = {
-                "player_id": row["player_id"],
-                "first_name": row["first_name"],
-                "last_name": row["last_name"],
-                "birthdate": row["birthdate"],
-                "height": height,
-                "weight": weight,
-                "bats": row["bats"],
-                "primary_position": row["primary_position"],
-                "other_positions": row.get("other_positions", "").split("|") if row.get("other_positions") else [],
-                "gf": gf,
-                "injured": (row.get("injured") or "false").strip().lower() == "true",
-                "injury_description": row.get("injury_description") or None,
-                "return_date": row.get("return_date") or None,
-            }
-
-            if is_pitcher:
-                endurance = _required_int(row, "endurance")
-                control = _required_int(row, "control")
-                movement = _required_int(row, "movement")
-                hold_runner = _required_int(row, "hold_runner")
-                role = row.get("role", "")
-                fb = _required_int(row, "fb")
-                cu = _required_int(row, "cu")
-                cb = _required_int(row, "cb")
-                sl = _required_int(row, "sl")
-                si = _required_int(row, "si")
-                scb = _required_int(row, "scb")
-                kn = _required_int(row, "kn")
-                arm = _optional_int(row, "arm")
-                if arm == 0:
-                    arm = fb
-                fa = _optional_int(row, "fa")
-                player = Pitcher(
-                    **common_kwargs,
-                    endurance=endurance,
-                    control=control,
-                    movement=movement,
-                    hold_runner=hold_runner,
-                    fb=fb,
-                    cu=cu,
-                    cb=cb,
-                    sl=sl,
-                    si=si,
-                    scb=scb,
-                    kn=kn,
-                    role=role,
-                    arm=arm,
-                    fa=fa,
-                    potential={
-                        "gf": _optional_int(row, "pot_gf", gf),
-                        "fb": _optional_int(row, "pot_fb", fb),
-                        "cu": _optional_int(row, "pot_cu", cu),
-                        "cb": _optional_int(row, "pot_cb", cb),
-                        "sl": _optional_int(row, "pot_sl", sl),
-                        "si": _optional_int(row, "pot_si", si),
-                        "scb": _optional_int(row, "pot_scb", scb),
-                        "kn": _optional_int(row, "pot_kn", kn),
-                        "control": _optional_int(row, "pot_control", control),
-                        "movement": _optional_int(row, "pot_movement", movement),
-                        "endurance": _optional_int(row, "pot_endurance", endurance),
-                        "hold_runner": _optional_int(row, "pot_hold_runner", hold_runner),
-                        "arm": _optional_int(row, "pot_arm", arm),
-                        "fa": _optional_int(row, "pot_fa", fa),
-                    },
-                )
-            else:
-                ch = _required_int(row, "ch")
-                ph = _required_int(row, "ph")
-                sp = _required_int(row, "sp")
-                pl = _required_int(row, "pl")
-                vl = _required_int(row, "vl")
-                sc = _required_int(row, "sc")
-                fa = _required_int(row, "fa")
-                arm = _required_int(row, "arm")
-                player = Player(
-                    **common_kwargs,
-                    ch=ch,
-                    ph=ph,
-                    sp=sp,
-                    pl=pl,
-                    vl=vl,
-                    sc=sc,
-                    fa=fa,
-                    arm=arm,
-                    potential={
-                        "ch": _optional_int(row, "pot_ch", ch),
-                        "ph": _optional_int(row, "pot_ph", ph),
-                        "sp": _optional_int(row, "pot_sp", sp),
-                        "gf": _optional_int(row, "pot_gf", gf),
-                        "pl": _optional_int(row, "pot_pl", pl),
-                        "vl": _optional_int(row, "pot_vl", vl),
-                        "sc": _optional_int(row, "pot_sc", sc),
-                        "fa": _optional_int(row, "pot_fa", fa),
-                        "arm": _optional_int(row, "pot_arm", arm),
-                    },
-                )
-
-            players.append(player)
+            if not row:
+                continue
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            if all(test(convert(row[i])) for i, convert, test in filters):
+                yield record([convert(row[i]) for i, convert in fields])
+
+
+def _read_player_cache(cache_path, key):
+    try:
+        with open(cache_path, "rb") as fh:
+            stored_key, schemas, records = marshal.loads(fh.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if tuple(stored_key) != key:
+        return None
+
+    classes = [(_CACHE_CLASSES[name], fields) for name, fields in schemas]
+    new = object.__new__
+    players = []
+    for schema, values in records:
+        cls, fields = classes[schema]
+        player = new(cls)
+        player.__dict__ = dict(zip(fields, values))
+        players.append(player)
     return players
+
+
+def _write_player_cache(cache_path, key, players):
+    schemas = []
+    schema_index = {}
+    records = []
+    for player in players:
+        attrs = vars(player)
+        schema = (type(player).__name__, tuple(attrs))
+        idx = schema_index.get(schema)
+        if idx is None:
+            idx = schema_index[schema] = len(schemas)
+            schemas.append(schema)
+        records.append((idx, tuple(attrs.values())))
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as fh:
+            fh.write(marshal.dumps((key, schemas, records)))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is an optimisation only; a read-only data directory
+        # simply means every load parses the CSV.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _parse_players_csv(file_path):
+    with open(file_path, mode="r", newline="") as csvfile:
+        return [player_from_row(row) for row in csv.DictReader(csvfile)]
+
+
+def player_from_row(row):
+    """Build a ``Player`` or ``Pitcher`` from a players CSV row dict.
+
+    Values may be strings, as read from the CSV, or integers for the
+    numeric columns.
+    """
+
+    is_pitcher_value = row.get("is_pitcher", "").strip().lower()
+    is_pitcher = is_pitcher_value in {"true", "1", "yes"}
+
+    height = _required_int(row, "height")
+    weight = _required_int(row, "weight")
+    gf = _required_int(row, "gf")
+
+    common_kwargs = {
+        "player_id": row["player_id"],
+        "first_name": row["first_name"],
+        "last_name": row["last_name"],
+        "birthdate": row["birthdate"],
+        "height": height,
+        "weight": weight,
+        "bats": row["bats"],
+        "primary_position": row["primary_position"],
+        "other_positions": row.get("other_positions", "").split("|") if row.get("other_positions") else [],
+        "gf": gf,
+        "injured": (row.get("injured") or "false").strip().lower() == "true",
+        "injury_description": row.get("injury_description") or None,
+        "return_date": row.get("return_date") or None,
+    }
+
+    if is_pitcher:
+        endurance = _required_int(row, "endurance")
+        control = _required_int(row, "control")
+        movement = _required_int(row, "movement")
+        hold_runner = _required_int(row, "hold_runner")
+        role = row.get("role", "")
+        fb = _required_int(row, "fb")
+        cu = _required_int(row, "cu")
+        cb = _required_int(row, "cb")
+        sl = _required_int(row, "sl")
+        si = _required_int(row, "si")
+        scb = _required_int(row, "scb")
+        kn = _required_int(row, "kn")
+        arm = _optional_int(row, "arm")
+        if arm == 0:
+            arm = fb
+        fa = _optional_int(row, "fa")
+        player = Pitcher(
+            **common_kwargs,
+            endurance=endurance,
+            control=control,
+            movement=movement,
+            hold_runner=hold_runner,
+            fb=fb,
+            cu=cu,
+            cb=cb,
+            sl=sl,
+            si=si,
+            scb=scb,
+            kn=kn,
+            role=role,
+            arm=arm,
+            fa=fa,
+            potential={
+                "gf": _optional_int(row, "pot_gf", gf),
+                "fb": _optional_int(row, "pot_fb", fb),
+                "cu": _optional_int(row, "pot_cu", cu),
+                "cb": _optional_int(row, "pot_cb", cb),
+                "sl": _optional_int(row, "pot_sl", sl),
+                "si": _optional_int(row, "pot_si", si),
+                "scb": _optional_int(row, "pot_scb", scb),
+                "kn": _optional_int(row, "pot_kn", kn),
+                "control": _optional_int(row, "pot_control", control),
+                "movement": _optional_int(row, "pot_movement", movement),
+                "endurance": _optional_int(row, "pot_endurance", endurance),
+                "hold_runner": _optional_int(row, "pot_hold_runner", hold_runner),
+                "arm": _optional_int(row, "pot_arm", arm),
+                "fa": _optional_int(row, "pot_fa", fa),
+            },
+        )
+    else:
+        ch = _required_int(row, "ch")
+        ph = _required_int(row, "ph")
+        sp = _required_int(row, "sp")
+        pl = _required_int(row, "pl")
+        vl = _required_int(row, "vl")
+        sc = _required_int(row, "sc")
+        fa = _required_int(row, "fa")
+        arm = _required_int(row, "arm")
+        player = Player(
+            **common_kwargs,
+            ch=ch,
+            ph=ph,
+            sp=sp,
+            pl=pl,
+            vl=vl,
+            sc=sc,
+            fa=fa,
+            arm=arm,
+            potential={
+                "ch": _optional_int(row, "pot_ch", ch),
+                "ph": _optional_int(row, "pot_ph", ph),
+                "sp": _optional_int(row, "pot_sp", sp),
+                "gf": _optional_int(row, "pot_gf", gf),
+                "pl": _optional_int(row, "pot_pl", pl),
+                "vl": _optional_int(row, "pot_vl", vl),
+                "sc": _optional_int(row, "pot_sc", sc),
+                "fa": _optional_int(row, "pot_fa", fa),
+                "arm": _optional_int(row, "pot_arm", arm),
+            },
+        )
+
+    return player
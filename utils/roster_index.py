@@ -0,0 +1,290 @@
+"""Persistent player → (team, level) index of the roster files.
+
+Finding a player's team, or every unassigned player, used to mean parsing
+every file in ``data/rosters``.  :class:`RosterIndex` keeps the mapping in
+memory and in a JSON file next to the roster directory
+(``data/rosters.index.json``).  Each roster file's modification time and
+size are recorded with its entries.  :meth:`RosterIndex.refresh` only
+re-reads the team files whose stamp changed, so files edited by other tools
+are picked up too.
+
+:func:`utils.roster_loader.save_roster` updates the index after writing a
+roster, so a roster save or trade costs no extra parsing.  Updates are
+appended to a journal (``data/rosters.index.log``) as one line per team
+instead of rewriting the whole index, and the journal is folded into the
+index file once it holds ``COMPACT_THRESHOLD`` entries.
+:meth:`RosterIndex.update_many` records several rosters with one append.
+Lookups are O(1) per player.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.roster import Roster
+
+INDEX_SUFFIX = ".index.json"
+INDEX_VERSION = 1
+
+LEVELS = ("ACT", "AAA", "LOW")
+
+# Fold the journal into the index file once it holds this many entries.
+COMPACT_THRESHOLD = 200
+
+# Roster files are named ``<team_id>.csv``; lineup and pitching files that
+# share the directory (``ARG_lhp_lineup.csv``...) contain an underscore.
+_ROSTER_FILE = re.compile(r"^([A-Za-z0-9]+)\.csv$")
+
+_Stamp = Tuple[int, int]
+
+
+def _stamp(path: str) -> _Stamp:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+class RosterIndex:
+    """Map each rostered ``player_id`` to its ``(team_id, level)``."""
+
+    def __init__(self, roster_dir: str = "data/rosters", index_path: Optional[str] = None):
+        self.roster_dir = roster_dir
+        self.index_path = index_path or os.path.normpath(roster_dir) + INDEX_SUFFIX
+        self.journal_path = os.path.splitext(self.index_path)[0] + ".log"
+        self.journaled = 0  # entries in the journal not yet in the index file
+        self._stamps: Dict[str, _Stamp] = {}
+        self._members: Dict[str, List[Tuple[str, str]]] = {}
+        # A player may appear on several rosters; lookups report the team
+        # indexed first.
+        self._locations: Dict[str, Dict[str, str]] = {}
+        self.reads = 0  # roster files parsed, for diagnostics and tests
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._locations
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def get(self, player_id: str) -> Optional[Tuple[str, str]]:
+        """Return ``(team_id, level)`` for ``player_id`` or ``None``."""
+
+        teams = self._locations.get(player_id)
+        if not teams:
+            return None
+        team_id, level = next(iter(teams.items()))
+        return team_id, level
+
+    def team_of(self, player_id: str) -> Optional[str]:
+        location = self.get(player_id)
+        return None if location is None else location[0]
+
+    def level_of(self, player_id: str) -> Optional[str]:
+        location = self.get(player_id)
+        return None if location is None else location[1]
+
+    def player_teams(self, team_ids: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Return a ``player_id -> team_id`` dict of every rostered player.
+
+        With ``team_ids`` only those teams' rosters are included, and a
+        player listed by several of them maps to the last one.
+        """
+
+        if team_ids is None:
+            return {pid: next(iter(teams)) for pid, teams in self._locations.items()}
+        player_team: Dict[str, str] = {}
+        for team_id in team_ids:
+            for pid, _ in self._members.get(team_id, ()):
+                player_team[pid] = team_id
+        return player_team
+
+    def free_agents(self, players: Iterable) -> List:
+        """Return the players in ``players`` that are on no roster."""
+
+        return [p for p in players if p.player_id not in self._locations]
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def _set_team(self, team_id: str, members: Optional[List[Tuple[str, str]]]) -> None:
+        for pid, _ in self._members.pop(team_id, []):
+            teams = self._locations.get(pid)
+            if teams is not None:
+                teams.pop(team_id, None)
+                if not teams:
+                    del self._locations[pid]
+        if members is None:
+            return
+        self._members[team_id] = members
+        for pid, level in members:
+            self._locations.setdefault(pid, {}).setdefault(team_id, level)
+
+    @staticmethod
+    def _roster_members(roster: Roster) -> List[Tuple[str, str]]:
+        return [
+            (pid, level) for level in LEVELS for pid in getattr(roster, level.lower())
+        ]
+
+    def update(self, roster: Roster) -> None:
+        """Record ``roster`` after it has been written to the roster directory."""
+
+        self.update_many([roster])
+
+    def update_many(self, rosters: Iterable[Roster]) -> None:
+        """Record several written rosters with a single journal append."""
+
+        team_ids = []
+        for roster in rosters:
+            path = os.path.join(self.roster_dir, f"{roster.team_id}.csv")
+            self._stamps[roster.team_id] = _stamp(path)
+            self._set_team(roster.team_id, self._roster_members(roster))
+            team_ids.append(roster.team_id)
+        self._journal(team_ids)
+
+    def refresh(self) -> "RosterIndex":
+        """Re-read the roster files that changed since they were indexed."""
+
+        from utils.roster_loader import load_roster
+
+        try:
+            names = os.listdir(self.roster_dir)
+        except FileNotFoundError:
+            names = []
+        current: Dict[str, _Stamp] = {}
+        for name in names:
+            match = _ROSTER_FILE.match(name)
+            if match:
+                current[match.group(1)] = _stamp(os.path.join(self.roster_dir, name))
+
+        changed = []
+        for team_id in [t for t in self._stamps if t not in current]:
+            del self._stamps[team_id]
+            self._set_team(team_id, None)
+            changed.append(team_id)
+        for team_id, stamp in current.items():
+            if self._stamps.get(team_id) == stamp:
+                continue
+            roster = load_roster(team_id, self.roster_dir)
+            self.reads += 1
+            self._stamps[team_id] = stamp
+            self._set_team(team_id, self._roster_members(roster))
+            changed.append(team_id)
+        if changed:
+            self._journal(changed)
+        return self
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, "r") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        for team_id, entry in data.get("teams", {}).items():
+            self._stamps[team_id] = tuple(entry["stamp"])
+            self._set_team(team_id, [tuple(m) for m in entry["players"]])
+        self._replay()
+
+    def _entry(self, team_id: str) -> Dict[str, object]:
+        if team_id not in self._stamps:
+            return {"team": team_id, "stamp": None, "players": None}
+        return {
+            "team": team_id,
+            "stamp": list(self._stamps[team_id]),
+            "players": [list(m) for m in self._members.get(team_id, [])],
+        }
+
+    def _replay(self) -> None:
+        try:
+            with open(self.journal_path, "r") as fh:
+                lines = fh.readlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break  # a torn final line from an interrupted append
+            team_id = entry["team"]
+            if entry["stamp"] is None:
+                self._stamps.pop(team_id, None)
+                self._set_team(team_id, None)
+            else:
+                self._stamps[team_id] = tuple(entry["stamp"])
+                self._set_team(team_id, [tuple(m) for m in entry["players"]])
+            self.journaled += 1
+
+    def _journal(self, team_ids: List[str]) -> None:
+        """Append the current entries of ``team_ids`` to the journal."""
+
+        if (
+            self.journaled + len(team_ids) >= COMPACT_THRESHOLD
+            or not os.path.exists(self.index_path)
+        ):
+            self._save()
+            return
+        lines = "".join(
+            json.dumps(self._entry(t), separators=(",", ":")) + "\n" for t in team_ids
+        )
+        try:
+            with open(self.journal_path, "a") as fh:
+                fh.write(lines)
+        except OSError:
+            return
+        self.journaled += len(team_ids)
+
+    def _save(self) -> None:
+        """Write the whole index file and drop the journal it supersedes."""
+
+        data = {
+            "version": INDEX_VERSION,
+            "teams": {
+                team_id: {
+                    "stamp": list(self._stamps[team_id]),
+                    "players": [list(m) for m in self._members.get(team_id, [])],
+                }
+                for team_id in self._stamps
+            },
+        }
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as fh:
+                json.dump(data, fh, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self.journaled = 0
+        except OSError:
+            # The index file only saves re-reading rosters on the next start.
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+_INDEXES: Dict[str, RosterIndex] = {}
+
+
+def cached_roster_index(roster_dir: str = "data/rosters") -> RosterIndex:
+    """Return the process-wide :class:`RosterIndex` without refreshing it."""
+
+    key = os.path.abspath(roster_dir)
+    index = _INDEXES.get(key)
+    if index is None:
+        index = _INDEXES[key] = RosterIndex(roster_dir)
+    return index
+
+
+def get_roster_index(roster_dir: str = "data/rosters") -> RosterIndex:
+    """Return the process-wide :class:`RosterIndex` for ``roster_dir``, refreshed."""
+
+    return cached_roster_index(roster_dir).refresh()
@@ -1,6 +1,7 @@
 import csv
 import os
 from models.roster import Roster
+from utils.roster_index import cached_roster_index
 
 def load_roster(team_id, roster_dir="data/rosters"):
     act, aaa, low = [], [], []
@@ -24,10 +25,19 @@ def load_roster(team_id, roster_dir="data/rosters"):
 
     return Roster(team_id=team_id, act=act, aaa=aaa, low=low)
 
-def save_roster(team_id, roster: Roster):
-    filepath = os.path.join("data", "rosters", f"{team_id}.csv")
-    with open(filepath, mode="w", newline="") as f:
+def write_roster_file(roster: Roster, file_path):
+    """Write ``roster`` to ``file_path`` in the roster CSV format and fsync it."""
+    with open(file_path, mode="w", newline="") as f:
         writer = csv.writer(f)
         for level, group in [("ACT", roster.act), ("AAA", roster.aaa), ("LOW", roster.low)]:
             for player_id in group:
                 writer.writerow([player_id, level])
+        f.flush()
+        os.fsync(f.fileno())
+
+def save_roster(team_id, roster: Roster, roster_dir="data/rosters"):
+    filepath = os.path.join(roster_dir, f"{team_id}.csv")
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    write_roster_file(roster, tmp_path)
+    os.replace(tmp_path, filepath)
+    cached_roster_index(roster_dir).update(roster)
@@ -0,0 +1,278 @@
+"""Batched, validated roster changes across any number of teams.
+
+A :class:`RosterTransaction` stages trades, call-ups, demotions, signings
+and releases in memory.  :meth:`RosterTransaction.commit` validates every
+touched roster against the league limits once and then writes all of them
+in a single write-rename batch::
+
+    with RosterTransaction() as txn:
+        txn.trade("ABU", "BCH", ["P1"], ["P2"])
+        txn.move("ABU", "P3", "aaa", "act")
+        txn.release("BCH", "P4")
+
+The batch is crash-safe.  Each roster is first written to a temporary file
+next to its target.  A ``.batch`` manifest listing the renames is then
+atomically put in place; that is the commit point.  The renames are applied
+and the manifest removed.  A batch interrupted after the commit point is
+rolled forward by :func:`recover_batch`, which every new transaction runs
+first.  A batch interrupted before it leaves only temporary files, which are
+discarded.  Roster writes are expected to come from one process at a time.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from models.roster import Roster
+from utils.pitcher_role import get_role
+from utils.roster_index import cached_roster_index
+from utils.roster_loader import load_roster, write_roster_file
+
+# League roster limits, as enforced by the owner dashboard.
+MAX_ACT = 25
+MAX_AAA = 15
+MAX_LOW = 10
+MIN_ACT_POSITION_PLAYERS = 11
+
+LEVELS = ("act", "aaa", "low")
+BATCH_MANIFEST = ".batch"
+
+
+class RosterValidationError(ValueError):
+    """Raised when a commit would leave rosters outside the league limits.
+
+    ``errors`` maps each offending ``team_id`` to its messages.
+    """
+
+    def __init__(self, errors: Dict[str, List[str]]):
+        self.errors = errors
+        summary = " ".join(f"{team}: {msg}" for team, msgs in errors.items() for msg in msgs)
+        super().__init__(summary)
+
+
+def validate_roster(roster: Roster, players: Optional[Mapping[str, object]] = None) -> List[str]:
+    """Return the league-limit violations of ``roster`` (empty when valid).
+
+    The minimum number of active position players is only checked when
+    ``players`` maps player ids to ``Player``/``Pitcher`` objects; unknown
+    ids are not counted.
+    """
+
+    errors = []
+    if len(roster.act) > MAX_ACT:
+        errors.append(f"Active roster cannot exceed {MAX_ACT} players.")
+    if players is not None:
+        position_players = sum(
+            1 for pid in roster.act if pid in players and not get_role(players[pid])
+        )
+        if position_players < MIN_ACT_POSITION_PLAYERS:
+            errors.append(
+                f"Active roster must have at least {MIN_ACT_POSITION_PLAYERS} position players."
+            )
+    if len(roster.aaa) > MAX_AAA:
+        errors.append(f"AAA roster cannot exceed {MAX_AAA} players.")
+    if len(roster.low) > MAX_LOW:
+        errors.append(f"LOW roster cannot exceed {MAX_LOW} players.")
+    return errors
+
+
+# ----------------------------------------------------------------------
+# Batch files
+# ----------------------------------------------------------------------
+def _manifest_path(roster_dir: str) -> str:
+    return os.path.join(roster_dir, BATCH_MANIFEST)
+
+
+def _fsync_dir(path: str) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # pragma: no cover - e.g. directories on Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover - not supported everywhere
+        pass
+    finally:
+        os.close(fd)
+
+
+def _apply_manifest(roster_dir: str, renames: List[List[str]]) -> None:
+    for tmp_name, target_name in renames:
+        tmp_path = os.path.join(roster_dir, tmp_name)
+        if os.path.exists(tmp_path):
+            os.replace(tmp_path, os.path.join(roster_dir, target_name))
+    _fsync_dir(roster_dir)
+    os.remove(_manifest_path(roster_dir))
+
+
+def recover_batch(roster_dir: str = "data/rosters") -> bool:
+    """Finish a committed batch interrupted by a crash.
+
+    Returns ``True`` when a batch was rolled forward.  Temporary files of
+    batches that never reached their commit point are removed.
+    """
+
+    manifest = _manifest_path(roster_dir)
+    recovered = False
+    if os.path.exists(manifest):
+        with open(manifest, "r") as fh:
+            renames = json.load(fh)
+        _apply_manifest(roster_dir, renames)
+        recovered = True
+    for name in os.listdir(roster_dir):
+        if name.endswith(".batch.tmp") or ".csv.txn-" in name:
+            os.remove(os.path.join(roster_dir, name))
+    return recovered
+
+
+# ----------------------------------------------------------------------
+# Transactions
+# ----------------------------------------------------------------------
+class RosterTransaction:
+    """Stage roster changes for several teams and commit them together.
+
+    Parameters
+    ----------
+    roster_dir:
+        Directory holding the ``<team_id>.csv`` roster files.
+    players:
+        Optional ``player_id -> Player`` mapping used to check the minimum
+        number of active position players.
+    """
+
+    def __init__(self, roster_dir: str = "data/rosters", players: Optional[Mapping[str, object]] = None):
+        self.roster_dir = roster_dir
+        self.players = players
+        self._rosters: Dict[str, Roster] = {}
+        self._dirty: Dict[str, None] = {}
+        recover_batch(roster_dir)
+
+    def __enter__(self) -> "RosterTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    # ------------------------------------------------------------------
+    # Staging
+    # ------------------------------------------------------------------
+    def roster(self, team_id: str) -> Roster:
+        """Return the staged roster of ``team_id``, loading it on first use.
+
+        Changes made to the returned object directly are committed too.
+        """
+
+        roster = self._rosters.get(team_id)
+        if roster is None:
+            roster = self._rosters[team_id] = load_roster(team_id, self.roster_dir)
+        self._dirty[team_id] = None
+        return roster
+
+    def _level_of(self, roster: Roster, player_id: str) -> str:
+        for level in LEVELS:
+            if player_id in getattr(roster, level):
+                return level
+        raise ValueError(f"{player_id} is not on the {roster.team_id} roster")
+
+    def move(self, team_id: str, player_id: str, from_level: str, to_level: str) -> None:
+        """Move ``player_id`` between levels, e.g. a call-up from AAA to ACT."""
+
+        roster = self.roster(team_id)
+        from_level, to_level = from_level.lower(), to_level.lower()
+        if player_id not in getattr(roster, from_level):
+            raise ValueError(f"{player_id} is not on the {team_id} {from_level.upper()} roster")
+        roster.move_player(player_id, from_level, to_level)
+
+    def add(self, team_id: str, player_id: str, level: str = "act") -> None:
+        """Sign ``player_id`` to ``level`` of ``team_id``."""
+
+        roster = self.roster(team_id)
+        for existing in LEVELS:
+            if player_id in getattr(roster, existing):
+                raise ValueError(f"{player_id} is already on the {team_id} roster")
+        getattr(roster, level.lower()).append(player_id)
+
+    def release(self, team_id: str, player_id: str) -> str:
+        """Remove ``player_id`` from ``team_id`` and return the level it left."""
+
+        roster = self.roster(team_id)
+        level = self._level_of(roster, player_id)
+        getattr(roster, level).remove(player_id)
+        return level
+
+    def trade(
+        self,
+        from_team: str,
+        to_team: str,
+        give_player_ids: Iterable[str],
+        receive_player_ids: Iterable[str],
+    ) -> None:
+        """Swap players between two teams; each player keeps their roster level."""
+
+        give = list(give_player_ids)
+        receive = list(receive_player_ids)
+        from_levels = [self.release(from_team, pid) for pid in give]
+        to_levels = [self.release(to_team, pid) for pid in receive]
+        for pid, level in zip(give, from_levels):
+            self.add(to_team, pid, level)
+        for pid, level in zip(receive, to_levels):
+            self.add(from_team, pid, level)
+
+    # ------------------------------------------------------------------
+    # Commit
+    # ------------------------------------------------------------------
+    def validate(self) -> Dict[str, List[str]]:
+        """Return the limit violations of every staged roster by team."""
+
+        errors = {}
+        for team_id in self._dirty:
+            problems = validate_roster(self._rosters[team_id], self.players)
+            if problems:
+                errors[team_id] = problems
+        return errors
+
+    def commit(self) -> List[str]:
+        """Validate and write every staged roster; return the teams written.
+
+        Raises :class:`RosterValidationError` without writing anything when
+        a roster is outside the league limits.
+        """
+
+        errors = self.validate()
+        if errors:
+            raise RosterValidationError(errors)
+        teams = list(self._dirty)
+        if not teams:
+            return teams
+
+        renames = []
+        for team_id in teams:
+            tmp_name = f"{team_id}.csv.txn-{os.getpid()}"
+            write_roster_file(self._rosters[team_id], os.path.join(self.roster_dir, tmp_name))
+            renames.append([tmp_name, f"{team_id}.csv"])
+
+        manifest = _manifest_path(self.roster_dir)
+        tmp_manifest = manifest + ".tmp"
+        with open(tmp_manifest, "w") as fh:
+            json.dump(renames, fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_manifest, manifest)  # commit point
+        _apply_manifest(self.roster_dir, renames)
+
+        cached_roster_index(self.roster_dir).update_many(
+            self._rosters[team_id] for team_id in teams
+        )
+        self._dirty.clear()
+        return teams
+
+    def rollback(self) -> None:
+        """Discard every staged change."""
+
+        self._rosters.clear()
+        self._dirty.clear()
@@ -0,0 +1,576 @@
+"""Optional SQLite storage for players, teams, rosters, trades and users.
+
+The CSV and text stores under ``data/`` are rewritten whole on every change.
+This module keeps the same data in one SQLite database instead and offers
+the loaders and savers of :mod:`utils.player_loader`,
+:mod:`utils.player_writer`, :mod:`utils.team_loader`,
+:mod:`utils.roster_loader`, :mod:`utils.trade_utils` and
+:mod:`utils.user_manager` under the same names and arguments.  The file path
+argument is replaced by ``db_path``.  Single-row operations
+(:func:`move_player`, :func:`update_trade_status`, :func:`save_trade`,
+:func:`save_team_settings`...) update only the affected rows.  Calls made
+inside ``with transaction(db_path):`` join that transaction, so several
+changes are committed together.
+
+Nothing switches to this backend automatically; import an existing league
+with :func:`import_data_dir` or ``python -m utils.sqlite_store``.
+"""
+
+import argparse
+import contextlib
+import os
+import sqlite3
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from models.roster import Roster
+from models.team import Team
+from models.trade import Trade
+from utils.player_loader import load_players_from_csv, player_from_row
+from utils.player_writer import PLAYER_FIELDS, player_to_row
+from utils.roster_loader import load_roster as load_roster_csv
+from utils.team_loader import _sanitize_color, load_teams as load_teams_csv
+from utils.trade_utils import load_trades as load_trades_csv
+from utils.user_manager import load_users as load_users_csv
+
+DEFAULT_DB = "data/league.db"
+
+ROSTER_LEVELS = ("ACT", "AAA", "LOW")
+
+# Player columns holding text; the remaining ones are ratings.
+_TEXT_PLAYER_FIELDS = {
+    "player_id",
+    "first_name",
+    "last_name",
+    "birthdate",
+    "bats",
+    "primary_position",
+    "other_positions",
+    "is_pitcher",
+    "role",
+    "injured",
+    "injury_description",
+    "return_date",
+}
+
+_TEAM_FIELDS = (
+    "team_id",
+    "name",
+    "city",
+    "abbreviation",
+    "division",
+    "stadium",
+    "primary_color",
+    "secondary_color",
+    "owner_id",
+)
+
+_PLAYER_COLUMNS = ",\n    ".join(
+    f"{name} {'TEXT' if name in _TEXT_PLAYER_FIELDS else 'INTEGER'}"
+    for name in PLAYER_FIELDS
+)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS players (
+    row_id INTEGER PRIMARY KEY,
+    {_PLAYER_COLUMNS}
+);
+CREATE INDEX IF NOT EXISTS players_player_id ON players (player_id);
+
+CREATE TABLE IF NOT EXISTS teams (
+    team_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    city TEXT NOT NULL,
+    abbreviation TEXT NOT NULL,
+    division TEXT NOT NULL,
+    stadium TEXT NOT NULL,
+    primary_color TEXT NOT NULL,
+    secondary_color TEXT NOT NULL,
+    owner_id TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rosters (
+    row_id INTEGER PRIMARY KEY,
+    team_id TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    level TEXT NOT NULL CHECK (level IN ('ACT', 'AAA', 'LOW')),
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rosters_team_level ON rosters (team_id, level, position);
+CREATE INDEX IF NOT EXISTS rosters_player_id ON rosters (player_id);
+
+CREATE TABLE IF NOT EXISTS trades (
+    trade_id TEXT PRIMARY KEY,
+    from_team TEXT NOT NULL,
+    to_team TEXT NOT NULL,
+    give_player_ids TEXT NOT NULL,
+    receive_player_ids TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending'
+);
+CREATE INDEX IF NOT EXISTS trades_status ON trades (status);
+
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    role TEXT NOT NULL,
+    team_id TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS users_team_id ON users (team_id);
+"""
+
+
+# Connections of the transactions open in the current context, by database.
+_ACTIVE: ContextVar[Dict[str, sqlite3.Connection]] = ContextVar(
+    "sqlite_store_active", default={}
+)
+
+
+@contextlib.contextmanager
+def transaction(db_path: str = DEFAULT_DB) -> Iterator[sqlite3.Connection]:
+    """Yield a connection whose changes are committed together on exit.
+
+    The schema is created when missing.  An exception rolls back every
+    change made through the connection.
+
+    Transactions nest: the loaders and savers of this module called inside
+    ``with transaction(db_path):`` join the open transaction instead of
+    connecting again, so their changes are committed or rolled back with
+    it.  A nested block runs in a savepoint, so an error it raises only
+    undoes its own changes when the caller handles it.
+    """
+
+    key = os.path.abspath(db_path)
+    active = _ACTIVE.get()
+    conn = active.get(key)
+    if conn is not None:
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        conn.execute("SAVEPOINT nested")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK TO nested")
+            conn.execute("RELEASE nested")
+            raise
+        conn.execute("RELEASE nested")
+        return
+
+    conn = sqlite3.connect(db_path)
+    token = _ACTIVE.set({**active, key: conn})
+    try:
+        conn.row_factory = sqlite3.Row
+        conn.executescript(SCHEMA)
+        with conn:
+            yield conn
+    finally:
+        _ACTIVE.reset(token)
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# Players
+# ----------------------------------------------------------------------
+_PLAYER_INSERT = (
+    f"INSERT INTO players ({', '.join(PLAYER_FIELDS)}) "
+    f"VALUES ({', '.join('?' * len(PLAYER_FIELDS))})"
+)
+
+
+def _player_values(player) -> List[object]:
+    row = player_to_row(player)
+    return [row.get(name) for name in PLAYER_FIELDS]
+
+
+def load_players(db_path: str = DEFAULT_DB):
+    """Return every player in insertion order, like ``load_players_from_csv``."""
+
+    with transaction(db_path) as conn:
+        rows = conn.execute("SELECT * FROM players ORDER BY row_id").fetchall()
+    return [player_from_row(dict(row)) for row in rows]
+
+
+def save_players(players, db_path: str = DEFAULT_DB) -> None:
+    """Replace all players, like ``save_players_to_csv``."""
+
+    with transaction(db_path) as conn:
+        conn.execute("DELETE FROM players")
+        conn.executemany(_PLAYER_INSERT, (_player_values(p) for p in players))
+
+
+def save_player(player, db_path: str = DEFAULT_DB) -> None:
+    """Update the row(s) of ``player.player_id`` or add the player."""
+
+    values = _player_values(player)
+    assignments = ", ".join(f"{name} = ?" for name in PLAYER_FIELDS)
+    with transaction(db_path) as conn:
+        cur = conn.execute(
+            f"UPDATE players SET {assignments} WHERE player_id = ?",
+            values + [player.player_id],
+        )
+        if cur.rowcount == 0:
+            conn.execute(_PLAYER_INSERT, values)
+
+
+# ----------------------------------------------------------------------
+# Teams
+# ----------------------------------------------------------------------
+def load_teams(db_path: str = DEFAULT_DB) -> List[Team]:
+    with transaction(db_path) as conn:
+        rows = conn.execute("SELECT * FROM teams ORDER BY rowid").fetchall()
+    return [Team(**{name: row[name] for name in _TEAM_FIELDS}) for row in rows]
+
+
+def save_team_settings(team: Team, db_path: str = DEFAULT_DB) -> None:
+    """Persist ``team``'s stadium and colors; other fields stay unchanged."""
+
+    primary = _sanitize_color(team.primary_color, "primary_color")
+    secondary = _sanitize_color(team.secondary_color, "secondary_color")
+    with transaction(db_path) as conn:
+        conn.execute(
+            "UPDATE teams SET stadium = ?, primary_color = ?, secondary_color = ? "
+            "WHERE team_id = ?",
+            (team.stadium, primary, secondary, team.team_id),
+        )
+
+
+# ----------------------------------------------------------------------
+# Rosters
+# ----------------------------------------------------------------------
+def load_roster(team_id: str, db_path: str = DEFAULT_DB) -> Roster:
+    """Return ``team_id``'s roster.
+
+    Raises :class:`FileNotFoundError`, like the CSV loader, when the team
+    has neither roster rows nor a row in ``teams``.
+    """
+
+    with transaction(db_path) as conn:
+        rows = conn.execute(
+            "SELECT player_id, level FROM rosters WHERE team_id = ? "
+            "ORDER BY position, row_id",
+            (team_id,),
+        ).fetchall()
+        if not rows and conn.execute(
+            "SELECT 1 FROM teams WHERE team_id = ?", (team_id,)
+        ).fetchone() is None:
+            raise FileNotFoundError(f"Roster not found: {team_id}")
+    roster = Roster(team_id=team_id)
+    for row in rows:
+        getattr(roster, row["level"].lower()).append(row["player_id"])
+    return roster
+
+
+def _save_roster(conn: sqlite3.Connection, team_id: str, roster: Roster) -> None:
+    existing: Dict[str, List[sqlite3.Row]] = {}
+    for row in conn.execute(
+        "SELECT row_id, player_id, level, position FROM rosters WHERE team_id = ?",
+        (team_id,),
+    ):
+        existing.setdefault(row["player_id"], []).append(row)
+
+    # Reuse each player's existing row so only changed entries are written.
+    for level in ROSTER_LEVELS:
+        for position, player_id in enumerate(getattr(roster, level.lower())):
+            rows = existing.get(player_id)
+            if not rows:
+                conn.execute(
+                    "INSERT INTO rosters (team_id, player_id, level, position) "
+                    "VALUES (?, ?, ?, ?)",
+                    (team_id, player_id, level, position),
+                )
+                continue
+            row = next(
+                (r for r in rows if (r["level"], r["position"]) == (level, position)),
+                rows[0],
+            )
+            rows.remove(row)
+            if (row["level"], row["position"]) != (level, position):
+                conn.execute(
+                    "UPDATE rosters SET level = ?, position = ? WHERE row_id = ?",
+                    (level, position, row["row_id"]),
+                )
+    stale = [(r["row_id"],) for rows in existing.values() for r in rows]
+    conn.executemany("DELETE FROM rosters WHERE row_id = ?", stale)
+
+
+def save_roster(team_id: str, roster: Roster, db_path: str = DEFAULT_DB) -> None:
+    """Store ``roster`` for ``team_id``, writing only the rows that changed."""
+
+    with transaction(db_path) as conn:
+        _save_roster(conn, team_id, roster)
+
+
+def save_rosters(rosters: Iterable[Roster], db_path: str = DEFAULT_DB) -> None:
+    """Store several rosters in one transaction, e.g. both sides of a trade."""
+
+    with transaction(db_path) as conn:
+        for roster in rosters:
+            _save_roster(conn, roster.team_id, roster)
+
+
+def move_player(
+    team_id: str, player_id: str, to_level: str, db_path: str = DEFAULT_DB
+) -> None:
+    """Move ``player_id`` to the end of ``to_level`` on ``team_id``'s roster.
+
+    Raises
+    ------
+    ValueError
+        If the level is unknown or the player is not on the roster.
+    """
+
+    level = to_level.upper()
+    if level not in ROSTER_LEVELS:
+        raise ValueError(f"Unknown roster level: {to_level}")
+    with transaction(db_path) as conn:
+        cur = conn.execute(
+            "UPDATE rosters SET level = ?, position = ("
+            "  SELECT COALESCE(MAX(position), -1) + 1 FROM rosters"
+            "  WHERE team_id = ? AND level = ?"
+            ") WHERE row_id = ("
+            "  SELECT row_id FROM rosters WHERE team_id = ? AND player_id = ?"
+            "  ORDER BY row_id LIMIT 1"
+            ")",
+            (level, team_id, level, team_id, player_id),
+        )
+        if cur.rowcount == 0:
+            raise ValueError(f"{player_id} is not on the {team_id} roster")
+
+
+# ----------------------------------------------------------------------
+# Trades
+# ----------------------------------------------------------------------
+def load_trades(db_path: str = DEFAULT_DB, status: Optional[str] = None) -> List[Trade]:
+    """Return the stored trades, optionally only those with ``status``."""
+
+    query = "SELECT * FROM trades"
+    params: tuple = ()
+    if status is not None:
+        query += " WHERE status = ?"
+        params = (status,)
+    with transaction(db_path) as conn:
+        rows = conn.execute(query + " ORDER BY rowid", params).fetchall()
+    return [
+        Trade(
+            trade_id=row["trade_id"],
+            from_team=row["from_team"],
+            to_team=row["to_team"],
+            give_player_ids=row["give_player_ids"].split("|"),
+            receive_player_ids=row["receive_player_ids"].split("|"),
+            status=row["status"],
+        )
+        for row in rows
+    ]
+
+
+def save_trade(trade: Trade, db_path: str = DEFAULT_DB) -> None:
+    """Add ``trade``; a trade with the same ``trade_id`` is updated in place."""
+
+    with transaction(db_path) as conn:
+        conn.execute(
+            "INSERT INTO trades (trade_id, from_team, to_team, give_player_ids, "
+            "receive_player_ids, status) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (trade_id) DO UPDATE SET from_team = excluded.from_team, "
+            "to_team = excluded.to_team, give_player_ids = excluded.give_player_ids, "
+            "receive_player_ids = excluded.receive_player_ids, status = excluded.status",
+            (
+                trade.trade_id,
+                trade.from_team,
+                trade.to_team,
+                "|".join(trade.give_player_ids),
+                "|".join(trade.receive_player_ids),
+                trade.status,
+            ),
+        )
+
+
+def update_trade_status(trade_id: str, status: str, db_path: str = DEFAULT_DB) -> None:
+    """Set the status of ``trade_id``; raises ``ValueError`` when unknown."""
+
+    with transaction(db_path) as conn:
+        cur = conn.execute(
+            "UPDATE trades SET status = ? WHERE trade_id = ?", (status, trade_id)
+        )
+        if cur.rowcount == 0:
+            raise ValueError(f"Trade not found: {trade_id}")
+
+
+# ----------------------------------------------------------------------
+# Users
+# ----------------------------------------------------------------------
+def load_users(db_path: str = DEFAULT_DB) -> List[Dict[str, str]]:
+    with transaction(db_path) as conn:
+        rows = conn.execute(
+            "SELECT username, password, role, team_id FROM users ORDER BY rowid"
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def _owner_of(conn: sqlite3.Connection, team_id: str) -> Optional[str]:
+    row = conn.execute(
+        "SELECT username FROM users WHERE role = 'owner' AND team_id = ?", (team_id,)
+    ).fetchone()
+    return None if row is None else row["username"]
+
+
+def add_user(
+    username: str,
+    password: str,
+    role: str,
+    team_id: str = "",
+    db_path: str = DEFAULT_DB,
+) -> None:
+    """Add a new user.
+
+    Raises:
+        ValueError: If the username already exists or the team is already
+        managed by another owner.
+    """
+    username = username.strip()
+    password = password.strip()
+    role = role.strip()
+    team_id = team_id.strip()
+
+    with transaction(db_path) as conn:
+        if conn.execute(
+            "SELECT 1 FROM users WHERE username = ?", (username,)
+        ).fetchone():
+            raise ValueError("Username already exists")
+        if role == "owner" and team_id and _owner_of(conn, team_id) is not None:
+            raise ValueError("Team already has an owner")
+        conn.execute(
+            "INSERT INTO users (username, password, role, team_id) VALUES (?, ?, ?, ?)",
+            (username, password, role, team_id),
+        )
+
+
+def update_user(
+    username: str,
+    new_password: Optional[str] = None,
+    new_team_id: Optional[str] = None,
+    db_path: str = DEFAULT_DB,
+) -> None:
+    """Update an existing user's password or team assignment.
+
+    Raises
+    ------
+    ValueError
+        If the user does not exist or if assigning an owner to a team that
+        already has an owner.
+    """
+
+    username = username.strip()
+    with transaction(db_path) as conn:
+        user = conn.execute(
+            "SELECT role FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        if user is None:
+            raise ValueError("User not found")
+        if new_team_id is not None:
+            new_team_id = new_team_id.strip()
+            if user["role"] == "owner" and new_team_id:
+                owner = _owner_of(conn, new_team_id)
+                if owner is not None and owner != username:
+                    raise ValueError("Team already has an owner")
+            conn.execute(
+                "UPDATE users SET team_id = ? WHERE username = ?",
+                (new_team_id, username),
+            )
+        if new_password is not None:
+            conn.execute(
+                "UPDATE users SET password = ? WHERE username = ?",
+                (new_password.strip(), username),
+            )
+
+
+def clear_users(db_path: str = DEFAULT_DB) -> None:
+    """Remove every user except ``admin``, creating ``admin,pass`` if missing."""
+
+    with transaction(db_path) as conn:
+        conn.execute("DELETE FROM users WHERE username != 'admin'")
+        conn.execute(
+            "INSERT OR IGNORE INTO users (username, password, role, team_id) "
+            "VALUES ('admin', 'pass', 'admin', '')"
+        )
+
+
+# ----------------------------------------------------------------------
+# Import
+# ----------------------------------------------------------------------
+def import_data_dir(data_dir: str = "data", db_path: str = DEFAULT_DB) -> Dict[str, int]:
+    """Copy the CSV and text stores in ``data_dir`` into ``db_path``.
+
+    Existing rows in the database are replaced.  Everything is imported in
+    one transaction.  Returns the number of rows imported per table.
+    """
+
+    players = load_players_from_csv(
+        os.path.join(data_dir, "players.csv"), use_cache=False
+    )
+    teams = load_teams_csv(os.path.join(data_dir, "teams.csv"))
+    roster_dir = os.path.join(data_dir, "rosters")
+    rosters = [
+        load_roster_csv(team.team_id, roster_dir)
+        for team in teams
+        if os.path.exists(os.path.join(roster_dir, f"{team.team_id}.csv"))
+    ]
+    trades = load_trades_csv(os.path.join(data_dir, "trades_pending.csv"))
+    users = load_users_csv(os.path.join(data_dir, "users.txt"))
+
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with transaction(db_path) as conn:
+        for table in ("players", "teams", "rosters", "trades", "users"):
+            conn.execute(f"DELETE FROM {table}")
+        conn.executemany(_PLAYER_INSERT, (_player_values(p) for p in players))
+        conn.executemany(
+            f"INSERT INTO teams ({', '.join(_TEAM_FIELDS)}) "
+            f"VALUES ({', '.join('?' * len(_TEAM_FIELDS))})",
+            ([getattr(t, name) for name in _TEAM_FIELDS] for t in teams),
+        )
+        conn.executemany(
+            "INSERT INTO rosters (team_id, player_id, level, position) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                (r.team_id, pid, level, pos)
+                for r in rosters
+                for level in ROSTER_LEVELS
+                for pos, pid in enumerate(getattr(r, level.lower()))
+            ),
+        )
+        # Later duplicates of a trade id win, as they would on reload.
+        conn.executemany(
+            "INSERT OR REPLACE INTO trades VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    t.trade_id,
+                    t.from_team,
+                    t.to_team,
+                    "|".join(t.give_player_ids),
+                    "|".join(t.receive_player_ids),
+                    t.status,
+                )
+                for t in trades
+            ),
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO users (username, password, role, team_id) "
+            "VALUES (:username, :password, :role, :team_id)",
+            users,
+        )
+    return {
+        "players": len(players),
+        "teams": len(teams),
+        "rosters": sum(len(r.act) + len(r.aaa) + len(r.low) for r in rosters),
+        "trades": len(trades),
+        "users": len(users),
+    }
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI helper
+    parser = argparse.ArgumentParser(description="Import data/ into SQLite")
+    parser.add_argument("data_dir", nargs="?", default="data")
+    parser.add_argument("db_path", nargs="?", default=DEFAULT_DB)
+    args = parser.parse_args()
+    for table, count in import_data_dir(args.data_dir, args.db_path).items():
+        print(f"{table}: {count}")
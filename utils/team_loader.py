@@ -22,6 +22,22 @@ def load_teams(file_path="data/teams.csv"):
     return teams
 
 
+def _sanitize_color(value: str, field: str) -> str:
+    """Return a normalized hex color or raise ``ValueError``.
+
+    The function ensures the color string begins with ``#`` and matches the
+    ``#RRGGBB`` or ``#RGB`` formats. If the value cannot be normalized into a
+    valid hex color a descriptive ``ValueError`` is raised.
+    """
+
+    value = value.strip()
+    if not value.startswith("#"):
+        value = f"#{value}"
+    if re.fullmatch(r"#(?:[0-9a-fA-F]{3}){1,2}$", value):
+        return value.upper()
+    raise ValueError(f"Invalid hex color for {field}: {value}")
+
+
 def save_team_settings(team: Team, file_path="data/teams.csv") -> None:
     """Persist updates to a single team's stadium or colors.
 
@@ -30,21 +46,6 @@ def save_team_settings(team: Team, file_path="data/teams.csv") -> None:
     other information remains unchanged.
     """
 
-    def _sanitize_color(value: str, field: str) -> str:
-        """Return a normalized hex color or raise ``ValueError``.
-
-        The function ensures the color string begins with ``#`` and matches the
-        ``#RRGGBB`` or ``#RGB`` formats. If the value cannot be normalized into a
-        valid hex color a descriptive ``ValueError`` is raised.
-        """
-
-        value = value.strip()
-        if not value.startswith("#"):
-            value = f"#{value}"
-        if re.fullmatch(r"#(?:[0-9a-fA-F]{3}){1,2}$", value):
-            return value.upper()
-        raise ValueError(f"Invalid hex color for {field}: {value}")
-
     teams = []
     with open(file_path, mode="r", newline="") as csvfile:
         reader = csv.DictReader(csvfile)
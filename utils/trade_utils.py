@@ -1,38 +1,264 @@
+"""Trade storage as an append-only journal.
+
+``data/trades_pending.csv`` keeps its columns, but every state change of a
+trade (proposed as ``pending``, then ``accepted`` or ``rejected``) is
+appended as a new row instead of rewriting the file.  The last row of a
+``trade_id`` is its current state.  :class:`TradeJournal` indexes the
+current states by ``trade_id`` and status, and reads only the rows appended
+since its last look.
+
+Compaction rewrites the journal with one row per trade.  The superseded
+rows are first appended to ``<journal>.history``, so the full history stays
+available through :meth:`TradeJournal.history`.
+"""
+
 import csv
+import os
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
 from models.trade import Trade
 
-def load_trades(file_path="data/trades_pending.csv"):
-    trades = []
+FIELDNAMES = ["trade_id", "from_team", "to_team", "give_player_ids", "receive_player_ids", "status"]
+HISTORY_SUFFIX = ".history"
+
+# Statuses a trade may move to from each status.
+TRANSITIONS = {
+    "pending": {"accepted", "rejected"},
+    "accepted": set(),
+    "rejected": set(),
+}
+
+# Compact once this many superseded rows have accumulated.
+COMPACT_THRESHOLD = 500
+
+
+def _copy(trade: Trade) -> Trade:
+    return replace(
+        trade,
+        give_player_ids=list(trade.give_player_ids),
+        receive_player_ids=list(trade.receive_player_ids),
+    )
+
+
+def _from_row(row) -> Trade:
+    return Trade(
+        trade_id=row["trade_id"],
+        from_team=row["from_team"],
+        to_team=row["to_team"],
+        give_player_ids=row["give_player_ids"].split("|"),
+        receive_player_ids=row["receive_player_ids"].split("|"),
+        status=row["status"]
+    )
+
+
+def _to_row(trade: Trade) -> Dict[str, str]:
+    return {
+        "trade_id": trade.trade_id,
+        "from_team": trade.from_team,
+        "to_team": trade.to_team,
+        "give_player_ids": "|".join(trade.give_player_ids),
+        "receive_player_ids": "|".join(trade.receive_player_ids),
+        "status": trade.status
+    }
+
+
+def _read_rows(file_path: str, offset: int = 0) -> Tuple[List[Trade], int]:
+    """Return the trades stored after byte ``offset`` and the end offset."""
+
     try:
-        with open(file_path, newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                trade = Trade(
-                    trade_id=row["trade_id"],
-                    from_team=row["from_team"],
-                    to_team=row["to_team"],
-                    give_player_ids=row["give_player_ids"].split("|"),
-                    receive_player_ids=row["receive_player_ids"].split("|"),
-                    status=row["status"]
-                )
-                trades.append(trade)
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
     except FileNotFoundError:
-        pass
-    return trades
+        return [], 0
+    # Ignore a trailing partial line; it is read once its writer finishes.
+    end = data.rfind(b"\n") + 1
+    lines = data[:end].decode("utf-8").splitlines()
+    if offset == 0:
+        reader = csv.DictReader(lines)
+    else:
+        reader = csv.DictReader(lines, fieldnames=FIELDNAMES)
+    return [_from_row(row) for row in reader], offset + end
+
+
+class TradeJournal:
+    """In-memory index over an append-only trade journal file."""
+
+    def __init__(self, file_path: str = "data/trades_pending.csv", compact_threshold: int = COMPACT_THRESHOLD):
+        self.file_path = file_path
+        self.compact_threshold = compact_threshold
+        self._trades: Dict[str, Trade] = {}
+        self._by_status: Dict[str, Dict[str, Trade]] = {}
+        self._offset = 0
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self.superseded = 0  # rows in the journal that are no longer current
+        self.refresh()
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+    def _index(self, trade: Trade) -> None:
+        old = self._trades.get(trade.trade_id)
+        if old is not None:
+            self._by_status[old.status].pop(trade.trade_id, None)
+            self.superseded += 1
+        self._trades[trade.trade_id] = trade
+        self._by_status.setdefault(trade.status, {})[trade.trade_id] = trade
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def refresh(self) -> "TradeJournal":
+        """Pick up rows appended to the journal by other writers.
+
+        The whole file is re-read when it was replaced or truncated, e.g.
+        by a compaction in another process.
+        """
+
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return self
+        appended = (
+            self._stamp is not None
+            and stamp is not None
+            and stamp[0] == self._stamp[0]
+            and stamp[1] >= self._offset
+        )
+        if not appended:
+            self._trades.clear()
+            self._by_status.clear()
+            self._offset = 0
+            self.superseded = 0
+        trades, self._offset = _read_rows(self.file_path, self._offset)
+        for trade in trades:
+            self._index(trade)
+        self._stamp = stamp
+        return self
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def get(self, trade_id: str) -> Optional[Trade]:
+        trade = self._trades.get(trade_id)
+        return None if trade is None else _copy(trade)
+
+    def trades(self, status: Optional[str] = None) -> List[Trade]:
+        """Return the current state of every trade, or of those with ``status``."""
+
+        source = self._trades if status is None else self._by_status.get(status, {})
+        return [_copy(t) for t in source.values()]
+
+    def pending(self) -> List[Trade]:
+        return self.trades("pending")
+
+    def history(self, trade_id: Optional[str] = None) -> List[Trade]:
+        """Return every recorded state, oldest first, including compacted rows."""
+
+        records = _read_rows(self.file_path + HISTORY_SUFFIX)[0]
+        records += _read_rows(self.file_path)[0]
+        if trade_id is not None:
+            records = [t for t in records if t.trade_id == trade_id]
+        return records
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def _append(self, path: str, trades: Iterable[Trade]) -> None:
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            if new_file:
+                writer.writeheader()
+            for trade in trades:
+                writer.writerow(_to_row(trade))
+
+    def record(self, trade: Trade) -> None:
+        """Append ``trade``'s current state unless it is already recorded."""
+
+        self.refresh()
+        if self._trades.get(trade.trade_id) == trade:
+            return
+        self._append(self.file_path, [trade])
+        self.refresh()
+        if self.compact_threshold and self.superseded >= self.compact_threshold:
+            self.compact()
+
+    def propose(self, trade: Trade) -> None:
+        """Record a new ``pending`` trade; raises ``ValueError`` for a known id."""
+
+        self.refresh()
+        if trade.trade_id in self._trades:
+            raise ValueError(f"Trade already exists: {trade.trade_id}")
+        self.record(replace(_copy(trade), status="pending"))
+
+    def set_status(self, trade_id: str, status: str) -> Trade:
+        """Move ``trade_id`` to ``status`` and return its new state.
+
+        Raises
+        ------
+        ValueError
+            If the trade is unknown or cannot move to ``status``.
+        """
+
+        self.refresh()
+        current = self._trades.get(trade_id)
+        if current is None:
+            raise ValueError(f"Trade not found: {trade_id}")
+        if status not in TRANSITIONS.get(current.status, set()):
+            raise ValueError(f"Cannot change trade {trade_id} from {current.status} to {status}")
+        updated = replace(_copy(current), status=status)
+        self.record(updated)
+        return _copy(updated)
+
+    def compact(self) -> None:
+        """Rewrite the journal with one row per trade.
+
+        Superseded rows are appended to the ``.history`` file first, so no
+        state is lost even if the rewrite is interrupted.
+        """
+
+        self.refresh()
+        if not self.superseded:
+            return
+        rows = _read_rows(self.file_path)[0]
+        latest_index = {t.trade_id: i for i, t in enumerate(rows)}
+        old = [t for i, t in enumerate(rows) if latest_index[t.trade_id] != i]
+        self._append(self.file_path + HISTORY_SUFFIX, old)
+
+        tmp_path = f"{self.file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            writer.writeheader()
+            for trade in self._trades.values():
+                writer.writerow(_to_row(trade))
+        os.replace(tmp_path, self.file_path)
+        self._stamp = None
+        self.refresh()
+
+
+_JOURNALS: Dict[str, TradeJournal] = {}
+
+
+def get_trade_journal(file_path: str = "data/trades_pending.csv") -> TradeJournal:
+    """Return the process-wide :class:`TradeJournal` for ``file_path``, refreshed."""
+
+    key = os.path.abspath(file_path)
+    journal = _JOURNALS.get(key)
+    if journal is None:
+        journal = _JOURNALS[key] = TradeJournal(file_path)
+    return journal.refresh()
+
+
+def load_trades(file_path="data/trades_pending.csv"):
+    """Return the current state of every trade, in the order they were proposed."""
+    return get_trade_journal(file_path).trades()
+
 
 def save_trade(trade: Trade, file_path="data/trades_pending.csv"):
-    existing = load_trades(file_path)
-    existing.append(trade)
-    with open(file_path, "w", newline="") as f:
-        fieldnames = ["trade_id", "from_team", "to_team", "give_player_ids", "receive_player_ids", "status"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for t in existing:
-            writer.writerow({
-                "trade_id": t.trade_id,
-                "from_team": t.from_team,
-                "to_team": t.to_team,
-                "give_player_ids": "|".join(t.give_player_ids),
-                "receive_player_ids": "|".join(t.receive_player_ids),
-                "status": t.status
-            })
+    """Append ``trade``'s state to the journal; unchanged trades are skipped."""
+    get_trade_journal(file_path).record(_copy(trade))
@@ -10,9 +10,8 @@ from __future__ import annotations
 import os
 from typing import Callable, Dict, Optional
 
-from utils.player_loader import load_players_from_csv
-from utils.team_loader import load_teams
-from utils.roster_loader import load_roster
+from utils.league_repository import get_repository
+from utils.roster_index import get_roster_index
 
 
 def generate_player_avatars_sdxl(
@@ -56,20 +55,15 @@ def generate_player_avatars_sdxl(
             "Pillow and diskcache to be installed"
         ) from exc
 
+    repo = get_repository()
     if players is None:
-        players = {p.player_id: p for p in load_players_from_csv("data/players.csv")}
+        players = repo.players("data/players.csv")
     if teams is None:
-        teams = load_teams("data/teams.csv")
+        teams = list(repo.teams("data/teams.csv").values())
 
-    # Map each player ID to their team ID via roster files
-    player_team: Dict[str, str] = {}
-    for t in teams:
-        try:
-            roster = load_roster(t.team_id)
-        except FileNotFoundError:
-            continue
-        for pid in roster.act + roster.aaa + roster.low:
-            player_team[pid] = t.team_id
+    # Map each player ID to one of ``teams`` via the roster index
+    team_map = {t.team_id: t for t in teams}
+    player_team = get_roster_index().player_teams(team_map)
 
     total = sum(1 for pid in players if pid in player_team)
     completed = 0
@@ -106,8 +100,6 @@ def generate_player_avatars_sdxl(
         except Exception:
             pass
 
-    team_map = {t.team_id: t for t in teams}
-
     for pid, player in players.items():
         team_id = player_team.get(pid)
         if not team_id: